@@ -7,3 +7,5 @@ problem-specific
 """
 from metaheuristics.tools.optimization_problem import OptimizationProblem
 from metaheuristics.tools.optimization_solution import OptimizationSolution
+from metaheuristics.tools.qap_instance import QAPInstance
+from metaheuristics.tools.quadratic_assignment_problem import QuadraticAssignmentProblem
@@ -0,0 +1,17 @@
+"""A set of methods and classes used to implement genetic algorithms. A
+genetic algorithm evolves a population of solutions rather than a single
+solution.
+
+At each generation, parents are selected from the population, favouring
+those with lower objective values. Pairs of parents are combined by a
+crossover operator into children that inherit parts of both, and the
+children are randomly perturbed by a mutation operator. The best solutions
+of a generation, called the elite, are carried over unchanged to the next.
+
+Populations are stored as NumPy arrays with one solution per row, so that
+selection, crossover, mutation and evaluation each act on the whole
+population at once. Operators are provided for permutations, as used by
+the quadratic assignment problem, and for real vectors, as used by the
+himmelblau function.
+
+"""
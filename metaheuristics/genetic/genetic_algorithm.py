@@ -0,0 +1,278 @@
+"""Runs a generational genetic algorithm on a population stored as a NumPy
+array with one solution per row. Selection is by tournament and the best
+solutions of each generation are kept unchanged. The crossover and mutation
+operators are passed in, so the same loop evolves permutations and real
+vectors, and the population is scored with a batch objective function, in
+chunks on an executor if one is given
+
+"""
+
+from functools import partial
+import numpy as np
+from metaheuristics.genetic.genetic_result import GeneticResult
+from metaheuristics.genetic.permutation_operators import make_permutation_population, order_crossover, \
+    partially_mapped_crossover, swap_mutation
+from metaheuristics.genetic.real_vector_operators import blend_crossover, gaussian_mutation, \
+    make_uniform_population
+from metaheuristics.tools.functions import himmelblau_batch
+from metaheuristics.tools.optimization_solution import OptimizationSolution
+from metaheuristics.tools.qap_instance import QAPInstance
+
+
+def tournament_selection(objective_values, count, rng, tournament_size=2):
+    """Selects solutions by tournament, where each selected solution is the
+    one with the lowest objective value among tournament_size solutions
+    chosen at random
+
+    Parameters
+    ----------
+    objective_values: numpy.ndarray
+        The objective value of each solution in the population
+    count: int
+        The number of solutions to select
+    rng: numpy.random.Generator
+        The generator from which the tournaments are drawn
+    tournament_size: int
+        The number of solutions in each tournament
+
+    Returns
+    -------
+    numpy.ndarray
+        The indices of the count selected solutions
+
+    """
+    entrants = rng.integers(0, len(objective_values), (count, tournament_size))
+    winners = np.argmin(objective_values[entrants], axis=1)
+    return entrants[np.arange(count), winners]
+
+
+def evaluate_population(batch_objective_function, population, executor=None, chunk_count=None):
+    """Calculates the objective value of every solution in a population
+
+    Parameters
+    ----------
+    batch_objective_function: function
+        A function taking an array of solutions, one per row, and returning
+        an array of their objective values
+    population: numpy.ndarray
+        The population, with one solution per row
+    executor: concurrent.futures.Executor
+        An optional executor, such as a ProcessPoolExecutor, on which chunks
+        of the population are evaluated concurrently. For a process pool,
+        batch_objective_function must be picklable
+    chunk_count: int
+        The number of chunks the population is split into when an executor
+        is given. Defaults to 4 chunks
+
+    Returns
+    -------
+    numpy.ndarray
+        A float array with the objective value of each solution
+
+    """
+    if executor is None:
+        return np.asarray(batch_objective_function(population), dtype=float)
+    chunks = np.array_split(population, chunk_count or 4)
+    return np.concatenate([np.asarray(values, dtype=float)
+                           for values in executor.map(batch_objective_function, chunks)])
+
+
+def run_genetic_algorithm(batch_objective_function, initial_population, number_of_generations,
+                          crossover_function, mutation_function, seed=None, elite_size=1,
+                          tournament_size=2, crossover_rate=0.9, target_objective=None,
+                          executor=None, chunk_count=None):
+    """Evolves a population with a generational genetic algorithm
+
+    Parameters
+    ----------
+    batch_objective_function: function
+        A function taking an array of solutions, one per row, and returning
+        an array of their objective values
+    initial_population: numpy.ndarray
+        The initial population, with one solution per row
+    number_of_generations: int
+        The number of generations produced after the initial population
+    crossover_function: function
+        A function taking two arrays of parents and a numpy.random.Generator
+        and returning an array with one child per pair of parents, such as
+        order_crossover or blend_crossover
+    mutation_function: function
+        A function taking a population and a numpy.random.Generator and
+        returning a mutated copy, such as swap_mutation or gaussian_mutation
+    seed: int or numpy.random.Generator
+        An optional seed for the random number generator of the run, which
+        makes the run reproducible, or a generator used directly
+    elite_size: int
+        The number of best solutions carried over unchanged to the next
+        generation
+    tournament_size: int
+        The number of solutions in each selection tournament
+    crossover_rate: float
+        The probability that a child is produced by crossover rather than
+        copied from its first parent
+    target_objective: float
+        An optional objective value at or below which the algorithm stops
+    executor: concurrent.futures.Executor
+        An optional executor on which the population is evaluated
+    chunk_count: int
+        The number of chunks the population is split into when an executor
+        is given
+
+    Returns
+    -------
+    GeneticResult
+        A GeneticResult holding the best solution found, the final
+        population and the objective values of each generation
+
+    """
+    rng = np.random.default_rng(seed)
+    population = np.asarray(initial_population)
+    population_size = len(population)
+    elite_size = min(elite_size, population_size)
+    objective_values = evaluate_population(batch_objective_function, population, executor, chunk_count)
+    best_index = int(np.argmin(objective_values))
+    best_solution = OptimizationSolution(population[best_index].copy(), float(objective_values[best_index]))
+    best_objective_values = [best_solution.get_objective_value()]
+    mean_objective_values = [float(np.mean(objective_values))]
+    for _ in range(number_of_generations):
+        if target_objective is not None and best_solution.get_objective_value() <= target_objective:
+            break
+        elite = np.argsort(objective_values, kind="stable")[:elite_size]
+        child_count = population_size - elite_size
+        parents_a = population[tournament_selection(objective_values, child_count, rng, tournament_size)]
+        parents_b = population[tournament_selection(objective_values, child_count, rng, tournament_size)]
+        crossed = rng.random(child_count) < crossover_rate
+        children = np.where(crossed[:, None], crossover_function(parents_a, parents_b, rng), parents_a)
+        children = mutation_function(children, rng)
+        population = np.concatenate([population[elite], children])
+        objective_values = np.concatenate([
+                objective_values[elite],
+                evaluate_population(batch_objective_function, children, executor, chunk_count)])
+        best_index = int(np.argmin(objective_values))
+        if objective_values[best_index] < best_solution.get_objective_value():
+            best_solution = OptimizationSolution(population[best_index].copy(), float(objective_values[best_index]))
+        best_objective_values.append(best_solution.get_objective_value())
+        mean_objective_values.append(float(np.mean(objective_values)))
+    return GeneticResult(best_solution, population, objective_values, best_objective_values, mean_objective_values)
+
+
+def quadratic_assignment_genetic_solver(flow_matrix, dist_matrix, initial_array, population_size,
+                                        number_of_generations, crossover="order", mutation_rate=0.2,
+                                        seed=None, executor=None):
+    """Runs a genetic algorithm for the quadratic assignment problem. The
+    initial population holds the ordering given by initial_array and
+    random orderings
+
+    Parameters
+    ----------
+    flow_matrix: pandas.DataFrame or numpy.ndarray
+        A square matrix, specifying the flows between facilities
+    dist_matrix: pandas.DataFrame or numpy.ndarray
+        A square matrix, specifying the distances between the facilities
+    inital_array: list
+        An initial solution to the quadratic assignment problem, that is
+        the list represents an ordering of the facilities
+    population_size: int
+        The number of orderings in each generation
+    number_of_generations: int
+        The number of generations produced after the initial population
+    crossover: str
+        The crossover used, either "order" for the order crossover or
+        "pmx" for the partially mapped crossover
+    mutation_rate: float
+        The probability that a child has two facilities swapped
+    seed: int
+        An optional seed for the random number generator of the run, which
+        makes the run reproducible
+    executor: concurrent.futures.Executor
+        An optional executor on which the population is evaluated
+
+    Returns
+    -------
+    GeneticResult
+        A GeneticResult object holding the best solution found, given as an
+        ordering of the facility labels, and the objective values of each
+        generation. The final population holds permutations of facility indices
+
+    Raises
+    ------
+    ValueError
+        If crossover is not "order" or "pmx"
+
+    """
+    crossover_functions = {"order": order_crossover, "pmx": partially_mapped_crossover}
+    if crossover not in crossover_functions:
+        raise ValueError("crossover must be 'order' or 'pmx'")
+    qap_instance = QAPInstance(flow_matrix, dist_matrix)
+    # the generator is shared with the run, so the initial population and the
+    # evolution draw different random numbers
+    generator = np.random.default_rng(seed)
+    initial_population = make_permutation_population(qap_instance.get_size(), population_size, generator)
+    initial_population[0] = qap_instance.encode(initial_array)
+    result = run_genetic_algorithm(
+            qap_instance.calculate_objective_batch, initial_population, number_of_generations,
+            crossover_functions[crossover], partial(swap_mutation, rate=mutation_rate), seed=generator,
+            executor=executor)
+    best_solution = result.get_best_solution()
+    return GeneticResult(
+            OptimizationSolution(qap_instance.decode(best_solution.get_solution_value()),
+                                 best_solution.get_objective_value()),
+            result.get_final_population(), result.get_final_objective_values(),
+            result.get_best_objective_values(), result.get_mean_objective_values())
+
+
+def himmelblau_genetic_solver(initial_x, initial_y, population_size, number_of_generations, lower_bound=-5.0,
+                              upper_bound=5.0, mutation_rate=0.2, mutation_scale=0.5, seed=None, executor=None):
+    """Runs a genetic algorithm to minimize the himmelblau function. The
+    initial population holds the point (initial_x, initial_y) and points
+    drawn uniformly from the square bounded by lower_bound and upper_bound
+
+    Parameters
+    ----------
+    initial_x: float
+        The x coordinate of the initial solution
+    initial_y: float
+        The y coordinate of the initial solution
+    population_size: int
+        The number of points in each generation
+    number_of_generations: int
+        The number of generations produced after the initial population
+    lower_bound: float
+        The lower bound of both coordinates
+    upper_bound: float
+        The upper bound of both coordinates
+    mutation_rate: float
+        The probability that a coordinate of a child is mutated
+    mutation_scale: float
+        The standard deviation of the noise added by a mutation
+    seed: int
+        An optional seed for the random number generator of the run, which
+        makes the run reproducible
+    executor: concurrent.futures.Executor
+        An optional executor on which the population is evaluated
+
+    Returns
+    -------
+    GeneticResult
+        A GeneticResult object holding the best solution found, given as a
+        tuple of its x and y coordinates, and the objective values of each
+        generation
+
+    """
+    lower_bounds = np.full(2, lower_bound, dtype=float)
+    upper_bounds = np.full(2, upper_bound, dtype=float)
+    # the generator is shared with the run, so the initial population and the
+    # evolution draw different random numbers
+    generator = np.random.default_rng(seed)
+    initial_population = make_uniform_population(lower_bounds, upper_bounds, population_size, generator)
+    initial_population[0] = (initial_x, initial_y)
+    mutation_function = partial(gaussian_mutation, rate=mutation_rate, scale=mutation_scale,
+                                lower_bounds=lower_bounds, upper_bounds=upper_bounds)
+    result = run_genetic_algorithm(himmelblau_batch, initial_population, number_of_generations,
+                                   blend_crossover, mutation_function, seed=generator, executor=executor)
+    best_solution = result.get_best_solution()
+    return GeneticResult(
+            OptimizationSolution(tuple(float(value) for value in best_solution.get_solution_value()),
+                                 best_solution.get_objective_value()),
+            result.get_final_population(), result.get_final_objective_values(),
+            result.get_best_objective_values(), result.get_mean_objective_values())
@@ -0,0 +1,87 @@
+"""The GeneticResult class acts as a container class for the outcome of a
+run of a genetic algorithm. It holds the best solution found, the final
+population and the objective values recorded at each generation
+
+"""
+
+class GeneticResult:
+    """A container class for the outcome of a genetic algorithm
+
+    Attributes
+    ----------
+    best_solution: OptimizationSolution
+        The solution with the lowest objective value in any generation
+    final_population: numpy.ndarray
+        The population of the last generation, with one solution per row
+    final_objective_values: numpy.ndarray
+        The objective value of each solution in final_population
+    best_objective_values: list
+        The lowest objective value in each generation
+    mean_objective_values: list
+        The mean objective value of each generation
+
+    """
+    def __init__(self, best_solution, final_population, final_objective_values,
+                 best_objective_values, mean_objective_values):
+        self._best_solution = best_solution
+        self._final_population = final_population
+        self._final_objective_values = final_objective_values
+        self._best_objective_values = best_objective_values
+        self._mean_objective_values = mean_objective_values
+
+    def get_best_solution(self):
+        """Retrieves the best solution found by the algorithm
+
+        Returns
+        -------
+        OptimizationSolution
+            The solution with the lowest objective value in any generation
+
+        """
+        return self._best_solution
+
+    def get_final_population(self):
+        """Retrieves the population of the last generation
+
+        Returns
+        -------
+        numpy.ndarray
+            The population of the last generation, with one solution per row
+
+        """
+        return self._final_population
+
+    def get_final_objective_values(self):
+        """Retrieves the objective values of the last generation
+
+        Returns
+        -------
+        numpy.ndarray
+            The objective value of each solution in the final population
+
+        """
+        return self._final_objective_values
+
+    def get_best_objective_values(self):
+        """Retrieves the lowest objective value in each generation
+
+        Returns
+        -------
+        list
+            The lowest objective value in each generation, starting with
+            the initial population
+
+        """
+        return self._best_objective_values
+
+    def get_mean_objective_values(self):
+        """Retrieves the mean objective value of each generation
+
+        Returns
+        -------
+        list
+            The mean objective value of each generation, starting with
+            the initial population
+
+        """
+        return self._mean_objective_values
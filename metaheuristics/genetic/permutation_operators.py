@@ -0,0 +1,186 @@
+"""Genetic operators for populations of permutations, stored as integer
+arrays with one permutation of 0 to n - 1 per row. Each operator acts on
+every row at once through NumPy indexing, so a generation is processed
+without a Python loop over its individuals
+
+"""
+
+import numpy as np
+
+
+def make_permutation_population(size, population_size, rng):
+    """Creates a population of random permutations
+
+    Parameters
+    ----------
+    size: int
+        The length of each permutation
+    population_size: int
+        The number of permutations in the population
+    rng: numpy.random.Generator
+        The generator from which the permutations are drawn
+
+    Returns
+    -------
+    numpy.ndarray
+        An integer array of shape (population_size, size) in which each
+        row is a random permutation of 0 to size - 1
+
+    """
+    return rng.permuted(np.tile(np.arange(size, dtype=np.intp), (population_size, 1)), axis=1)
+
+
+def _choose_segments(count, size, rng):
+    """Chooses a random segment of positions for each of count permutations
+
+    Parameters
+    ----------
+    count: int
+        The number of permutations
+    size: int
+        The length of each permutation
+    rng: numpy.random.Generator
+        The generator from which the segments are drawn
+
+    Returns
+    -------
+    numpy.ndarray, numpy.ndarray
+        A column of the positions following each segment and a boolean
+        array of shape (count, size) marking the positions in each segment
+
+    """
+    cuts = np.sort(rng.integers(0, size + 1, (count, 2)), axis=1)
+    positions = np.arange(size)[None, :]
+    return cuts[:, 1:], (positions >= cuts[:, :1]) & (positions < cuts[:, 1:])
+
+
+def _invert_permutations(permutations):
+    """Calculates the position of each entry in each permutation
+
+    Parameters
+    ----------
+    permutations: numpy.ndarray
+        An integer array with one permutation per row
+
+    Returns
+    -------
+    numpy.ndarray
+        An array whose entry in row k, column j is the position of j in
+        row k of permutations
+
+    """
+    count, size = permutations.shape
+    positions = np.empty_like(permutations)
+    positions[np.arange(count)[:, None], permutations] = np.arange(size)
+    return positions
+
+
+def order_crossover(parents_a, parents_b, rng):
+    """Combines pairs of permutations with the order crossover (OX)
+
+    Each child keeps a random segment of its first parent. The remaining
+    positions, starting after the segment and wrapping around, are filled
+    with the entries of its second parent that are not in the segment, in
+    the order they appear after the segment in the second parent
+
+    Parameters
+    ----------
+    parents_a: numpy.ndarray
+        An integer array with the first parent of each child in its rows
+    parents_b: numpy.ndarray
+        An integer array of the same shape with the second parent of
+        each child in its rows
+    rng: numpy.random.Generator
+        The generator from which the segments are drawn
+
+    Returns
+    -------
+    numpy.ndarray
+        An integer array of the same shape as parents_a with one child
+        per row
+
+    """
+    count, size = parents_a.shape
+    rows = np.arange(count)[:, None]
+    segment_ends, in_segment = _choose_segments(count, size, rng)
+    rotated_positions = (np.arange(size)[None, :] + segment_ends) % size
+    rotated_b = parents_b[rows, rotated_positions]
+    b_in_segment = in_segment[rows, _invert_permutations(parents_a)[rows, rotated_b]]
+    # a stable sort moves the entries outside the segment to the front in their
+    # rotated order, matching the free positions sorted the same way
+    entries = rotated_b[rows, np.argsort(b_in_segment, axis=1, kind="stable")]
+    positions = rotated_positions[rows, np.argsort(in_segment[rows, rotated_positions], axis=1, kind="stable")]
+    children = np.empty_like(parents_a)
+    children[rows, positions] = entries
+    children[in_segment] = parents_a[in_segment]
+    return children
+
+
+def partially_mapped_crossover(parents_a, parents_b, rng):
+    """Combines pairs of permutations with the partially mapped crossover (PMX)
+
+    Each child keeps a random segment of its first parent and takes the
+    other positions from its second parent. An entry of the second parent
+    already in the segment is replaced by following the mapping between the
+    two parents in the segment until an entry outside the segment is found
+
+    Parameters
+    ----------
+    parents_a: numpy.ndarray
+        An integer array with the first parent of each child in its rows
+    parents_b: numpy.ndarray
+        An integer array of the same shape with the second parent of
+        each child in its rows
+    rng: numpy.random.Generator
+        The generator from which the segments are drawn
+
+    Returns
+    -------
+    numpy.ndarray
+        An integer array of the same shape as parents_a with one child
+        per row
+
+    """
+    count, size = parents_a.shape
+    rows = np.arange(count)[:, None]
+    _, in_segment = _choose_segments(count, size, rng)
+    positions_in_a = _invert_permutations(parents_a)
+    children = np.where(in_segment, parents_a, parents_b)
+    # every pass resolves one step of the mapping, which is at most as long as the segment
+    for _ in range(size):
+        duplicate_positions = positions_in_a[rows, children]
+        duplicated = ~in_segment & in_segment[rows, duplicate_positions]
+        if not duplicated.any():
+            break
+        children = np.where(duplicated, parents_b[rows, duplicate_positions], children)
+    return children
+
+
+def swap_mutation(population, rng, rate=0.1):
+    """Mutates permutations by swapping two of their entries
+
+    Parameters
+    ----------
+    population: numpy.ndarray
+        An integer array with one permutation per row
+    rng: numpy.random.Generator
+        The generator from which the mutations are drawn
+    rate: float
+        The probability that a permutation is mutated
+
+    Returns
+    -------
+    numpy.ndarray
+        A copy of population in which each row has two random entries
+        swapped with probability rate
+
+    """
+    mutated = population.copy()
+    count, size = mutated.shape
+    if size < 2:
+        return mutated
+    rows = np.flatnonzero(rng.random(count) < rate)
+    first = rng.integers(0, size, len(rows))
+    second = (first + rng.integers(1, size, len(rows))) % size
+    mutated[rows, first], mutated[rows, second] = mutated[rows, second], mutated[rows, first]
+    return mutated
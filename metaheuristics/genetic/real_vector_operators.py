@@ -0,0 +1,93 @@
+"""Genetic operators for populations of real vectors, stored as float
+arrays with one solution per row, such as the x and y coordinates of a
+solution to the himmelblau function
+
+"""
+
+import numpy as np
+
+
+def make_uniform_population(lower_bounds, upper_bounds, population_size, rng):
+    """Creates a population of vectors drawn uniformly from a box
+
+    Parameters
+    ----------
+    lower_bounds: numpy.ndarray
+        The lower bound of each coordinate
+    upper_bounds: numpy.ndarray
+        The upper bound of each coordinate
+    population_size: int
+        The number of vectors in the population
+    rng: numpy.random.Generator
+        The generator from which the vectors are drawn
+
+    Returns
+    -------
+    numpy.ndarray
+        A float array of shape (population_size, len(lower_bounds))
+
+    """
+    lower_bounds = np.asarray(lower_bounds, dtype=float)
+    upper_bounds = np.asarray(upper_bounds, dtype=float)
+    return rng.uniform(lower_bounds, upper_bounds, (population_size, len(lower_bounds)))
+
+
+def blend_crossover(parents_a, parents_b, rng, alpha=0.5):
+    """Combines pairs of vectors with the blend crossover (BLX-alpha)
+
+    Each coordinate of a child is drawn uniformly from the interval spanned
+    by the parents' coordinates, extended on both sides by alpha times its
+    length
+
+    Parameters
+    ----------
+    parents_a: numpy.ndarray
+        A float array with the first parent of each child in its rows
+    parents_b: numpy.ndarray
+        A float array of the same shape with the second parent of each
+        child in its rows
+    rng: numpy.random.Generator
+        The generator from which the children are drawn
+    alpha: float
+        The fraction of the interval added on each side
+
+    Returns
+    -------
+    numpy.ndarray
+        A float array of the same shape as parents_a with one child per row
+
+    """
+    lower = np.minimum(parents_a, parents_b)
+    upper = np.maximum(parents_a, parents_b)
+    extension = alpha * (upper - lower)
+    return rng.uniform(lower - extension, upper + extension)
+
+
+def gaussian_mutation(population, rng, rate=0.1, scale=1.0, lower_bounds=None, upper_bounds=None):
+    """Mutates vectors by adding normally distributed noise to their coordinates
+
+    Parameters
+    ----------
+    population: numpy.ndarray
+        A float array with one vector per row
+    rng: numpy.random.Generator
+        The generator from which the mutations are drawn
+    rate: float
+        The probability that a coordinate is mutated
+    scale: float
+        The standard deviation of the noise
+    lower_bounds: numpy.ndarray
+        Optional lower bounds to which the coordinates are clipped
+    upper_bounds: numpy.ndarray
+        Optional upper bounds to which the coordinates are clipped
+
+    Returns
+    -------
+    numpy.ndarray
+        A mutated copy of population
+
+    """
+    mutated = population + (rng.random(population.shape) < rate) * rng.normal(0.0, scale, population.shape)
+    if lower_bounds is not None or upper_bounds is not None:
+        mutated = np.clip(mutated, lower_bounds, upper_bounds)
+    return mutated
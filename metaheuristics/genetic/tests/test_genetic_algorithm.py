@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+
+import itertools
+import pytest
+import numpy as np
+import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from metaheuristics.genetic.genetic_algorithm import evaluate_population, himmelblau_genetic_solver, \
+    quadratic_assignment_genetic_solver, run_genetic_algorithm, tournament_selection
+from metaheuristics.genetic.permutation_operators import make_permutation_population, order_crossover, \
+    swap_mutation
+from metaheuristics.tools.qap_instance import QAPInstance
+
+
+@pytest.fixture(scope="module")
+def qap_instance():
+    rng = np.random.default_rng(7)
+    return QAPInstance(rng.integers(0, 10, (6, 6)), rng.integers(0, 10, (6, 6)))
+
+
+def test_tournament_selection_prefers_lower_objective_values():
+    objective_values = np.array([5.0, 1.0, 3.0])
+    selected = tournament_selection(objective_values, 1000, np.random.default_rng(0), tournament_size=3)
+    assert selected.shape == (1000,)
+    counts = np.bincount(selected, minlength=3)
+    assert counts[1] > counts[2] > counts[0]
+
+
+def test_evaluate_population_on_an_executor(qap_instance):
+    population = make_permutation_population(6, 25, np.random.default_rng(1))
+    expected = qap_instance.calculate_objective_batch(population)
+    with ThreadPoolExecutor(2) as executor:
+        objective_values = evaluate_population(qap_instance.calculate_objective_batch, population,
+                                               executor, chunk_count=3)
+    assert np.array_equal(objective_values, expected)
+    assert np.array_equal(evaluate_population(qap_instance.calculate_objective_batch, population), expected)
+
+
+def test_genetic_algorithm_finds_the_optimum_of_a_small_instance(qap_instance):
+    optimum = min(qap_instance.calculate_objective(np.array(permutation))
+                  for permutation in itertools.permutations(range(6)))
+    initial_population = make_permutation_population(6, 100, np.random.default_rng(2))
+    result = run_genetic_algorithm(qap_instance.calculate_objective_batch, initial_population, 50,
+                                   order_crossover, partial(swap_mutation, rate=0.3), seed=3)
+    best_solution = result.get_best_solution()
+    assert best_solution.get_objective_value() == optimum
+    assert qap_instance.calculate_objective(best_solution.get_solution_value()) == optimum
+    assert len(result.get_best_objective_values()) == 51
+    assert result.get_final_population().shape == (100, 6)
+    assert np.array_equal(result.get_final_objective_values(),
+                          qap_instance.calculate_objective_batch(result.get_final_population()))
+
+
+def test_best_objective_values_never_increase(qap_instance):
+    initial_population = make_permutation_population(6, 20, np.random.default_rng(2))
+    result = run_genetic_algorithm(qap_instance.calculate_objective_batch, initial_population, 20,
+                                   order_crossover, swap_mutation, seed=4)
+    best_objective_values = result.get_best_objective_values()
+    assert all(later <= earlier for earlier, later in zip(best_objective_values, best_objective_values[1:]))
+    assert len(result.get_mean_objective_values()) == 21
+
+
+def test_genetic_algorithm_stops_at_the_target_objective(qap_instance):
+    initial_population = make_permutation_population(6, 20, np.random.default_rng(2))
+    result = run_genetic_algorithm(qap_instance.calculate_objective_batch, initial_population, 20,
+                                   order_crossover, swap_mutation, seed=4, target_objective=np.inf)
+    assert len(result.get_best_objective_values()) == 1
+
+
+def test_genetic_algorithm_is_reproducible_from_a_seed(qap_instance):
+    initial_population = make_permutation_population(6, 20, np.random.default_rng(2))
+    results = [run_genetic_algorithm(qap_instance.calculate_objective_batch, initial_population, 10,
+                                     order_crossover, swap_mutation, seed=5) for _ in range(2)]
+    assert np.array_equal(results[0].get_final_population(), results[1].get_final_population())
+
+
+def test_genetic_algorithm_continues_the_stream_of_a_generator(qap_instance):
+    initial_population = make_permutation_population(6, 20, np.random.default_rng(2))
+    generator = np.random.default_rng(5)
+    generator.random()
+    shared_result = run_genetic_algorithm(qap_instance.calculate_objective_batch, initial_population, 10,
+                                          order_crossover, swap_mutation, seed=generator)
+    seeded_result = run_genetic_algorithm(qap_instance.calculate_objective_batch, initial_population, 10,
+                                          order_crossover, swap_mutation, seed=5)
+    assert not np.array_equal(shared_result.get_final_population(), seeded_result.get_final_population())
+
+
+def test_quadratic_assignment_solver_returns_facility_labels():
+    facilities = ["X", "Y", "Z"]
+    flow_matrix = pd.DataFrame([[0, 5, 1], [5, 0, 2], [1, 2, 0]], columns=facilities, index=facilities)
+    dist_matrix = pd.DataFrame([[0, 1, 4], [1, 0, 2], [4, 2, 0]], columns=facilities, index=facilities)
+    result = quadratic_assignment_genetic_solver(flow_matrix, dist_matrix, ["Z", "X", "Y"], 10, 5,
+                                                 crossover="pmx", seed=0)
+    assert sorted(result.get_best_solution().get_solution_value()) == facilities
+
+
+def test_quadratic_assignment_solver_rejects_unknown_crossover():
+    with pytest.raises(ValueError):
+        quadratic_assignment_genetic_solver(np.eye(3), np.eye(3), [0, 1, 2], 10, 5, crossover="cycle")
+
+
+def test_himmelblau_solver_finds_a_minimum():
+    result = himmelblau_genetic_solver(0.0, 0.0, 200, 40, seed=0)
+    x, y = result.get_best_solution().get_solution_value()
+    assert isinstance(x, float)
+    assert result.get_best_solution().get_objective_value() < 1e-2
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+import numpy as np
+from unittest.mock import MagicMock
+from metaheuristics.genetic.permutation_operators import make_permutation_population, order_crossover, \
+    partially_mapped_crossover, swap_mutation
+
+
+@pytest.fixture
+def segment_rng():
+    rng = MagicMock()
+    rng.integers.return_value = np.array([[5, 2]])
+    return rng
+
+
+def is_permutation_population(population, size):
+    return np.array_equal(np.sort(population, axis=1), np.tile(np.arange(size), (len(population), 1)))
+
+
+def test_make_permutation_population():
+    population = make_permutation_population(6, 50, np.random.default_rng(0))
+    assert population.shape == (50, 6)
+    assert is_permutation_population(population, 6)
+
+
+def test_order_crossover_fills_after_the_segment(segment_rng):
+    children = order_crossover(np.array([[0, 1, 2, 3, 4, 5, 6, 7]]), np.array([[7, 6, 5, 4, 3, 2, 1, 0]]),
+                               segment_rng)
+    assert list(children[0]) == [6, 5, 2, 3, 4, 1, 0, 7]
+
+
+def test_partially_mapped_crossover_follows_the_mapping(segment_rng):
+    children = partially_mapped_crossover(np.array([[0, 1, 2, 3, 4, 5, 6, 7]]),
+                                          np.array([[7, 6, 5, 4, 3, 2, 1, 0]]), segment_rng)
+    assert list(children[0]) == [7, 6, 2, 3, 4, 5, 1, 0]
+
+
+@pytest.mark.parametrize("crossover_function", [order_crossover, partially_mapped_crossover])
+@pytest.mark.parametrize("size", [1, 2, 9])
+def test_crossover_produces_permutations(crossover_function, size):
+    rng = np.random.default_rng(1)
+    parents_a = make_permutation_population(size, 200, rng)
+    parents_b = make_permutation_population(size, 200, rng)
+    assert is_permutation_population(crossover_function(parents_a, parents_b, rng), size)
+
+
+def test_swap_mutation_swaps_two_entries():
+    population = np.tile(np.arange(5), (100, 1))
+    mutated = swap_mutation(population, np.random.default_rng(2), rate=1.0)
+    assert np.array_equal(population, np.tile(np.arange(5), (100, 1)))
+    assert is_permutation_population(mutated, 5)
+    assert ((mutated != population).sum(axis=1) == 2).all()
+
+
+def test_swap_mutation_with_zero_rate_copies_the_population():
+    population = np.tile(np.arange(5), (10, 1))
+    mutated = swap_mutation(population, np.random.default_rng(2), rate=0.0)
+    assert mutated is not population
+    assert np.array_equal(mutated, population)
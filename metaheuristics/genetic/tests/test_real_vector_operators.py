@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+from metaheuristics.genetic.real_vector_operators import blend_crossover, gaussian_mutation, \
+    make_uniform_population
+
+
+def test_make_uniform_population_is_within_bounds():
+    population = make_uniform_population([-1, 0], [1, 10], 100, np.random.default_rng(0))
+    assert population.shape == (100, 2)
+    assert (population >= [-1, 0]).all() and (population < [1, 10]).all()
+
+
+def test_blend_crossover_stays_in_the_extended_interval():
+    parents_a = np.zeros((500, 2))
+    parents_b = np.array([[1.0, 2.0]] * 500)
+    children = blend_crossover(parents_a, parents_b, np.random.default_rng(1), alpha=0.5)
+    assert (children >= [-0.5, -1.0]).all() and (children <= [1.5, 3.0]).all()
+    assert np.array_equal(blend_crossover(parents_a, parents_a, np.random.default_rng(1)), parents_a)
+
+
+def test_gaussian_mutation_is_clipped_to_bounds():
+    population = np.zeros((500, 2))
+    mutated = gaussian_mutation(population, np.random.default_rng(2), rate=1.0, scale=10.0,
+                                lower_bounds=[-1, -2], upper_bounds=[1, 2])
+    assert (mutated >= [-1, -2]).all() and (mutated <= [1, 2]).all()
+    assert (mutated != 0).any()
+    assert (population == 0).all()
+
+
+def test_gaussian_mutation_with_zero_rate_changes_nothing():
+    population = np.ones((10, 3))
+    assert np.array_equal(gaussian_mutation(population, np.random.default_rng(2), rate=0.0), population)
@@ -0,0 +1,163 @@
+"""The AdaptiveIterationSize class decides how many steps the simulated
+annealing algorithm takes at each temperature from the acceptance rates it
+has observed, instead of using the same number of steps everywhere.
+
+A temperature can end early once enough candidate solutions have been
+accepted. More steps are spent around the critical temperatures, where the
+acceptance rate falls through intermediate values and the structure of the
+solution is decided, and fewer once the algorithm is frozen and almost
+nothing is accepted
+
+"""
+
+class AdaptiveIterationSize:
+    """Sets the number of steps at each temperature of the simulated
+    annealing algorithm from observed acceptance rates
+
+    An AdaptiveIterationSize object can be used wherever an iteration_size
+    function is expected. Called with a temperature, it returns the largest
+    number of steps to take at that temperature
+
+    Attributes
+    ----------
+    base_steps: int
+        The number of steps taken at a temperature by default
+    target_acceptances: int
+        The number of accepted candidate solutions after which a temperature
+        ends early. If None, temperatures never end early
+    critical_acceptance_range: tuple
+        A two element tuple with the lowest and highest acceptance rates
+        considered to be near the critical temperature
+    critical_multiplier: float
+        The factor applied to base_steps after a temperature whose acceptance
+        rate was in critical_acceptance_range
+    min_steps: int
+        The number of steps taken after a temperature whose acceptance rate
+        was below frozen_acceptance_rate. If None, base_steps is used
+    frozen_acceptance_rate: float
+        The acceptance rate below which the algorithm is considered frozen
+    last_acceptance_rate: float
+        The acceptance rate observed at the previous temperature, or None
+        before the first temperature ends
+
+    """
+    def __init__(self, base_steps, target_acceptances=None, critical_acceptance_range=(0.1, 0.5),
+                 critical_multiplier=2, min_steps=None, frozen_acceptance_rate=0.01):
+        self._base_steps = base_steps
+        self._target_acceptances = target_acceptances
+        self._critical_acceptance_range = critical_acceptance_range
+        self._critical_multiplier = critical_multiplier
+        self._min_steps = min_steps
+        self._frozen_acceptance_rate = frozen_acceptance_rate
+        self._last_acceptance_rate = None
+
+    def __call__(self, temperature):
+        """Calculates the largest number of steps to take at temperature
+
+        Parameters
+        ----------
+        temperature: float
+            The temperature about to be used by the algorithm
+
+        Returns
+        -------
+        int
+            The largest number of steps to take at temperature
+
+        """
+        rate = self._last_acceptance_rate
+        if rate is None:
+            return self._base_steps
+        if rate < self._frozen_acceptance_rate and self._min_steps is not None:
+            return self._min_steps
+        lowest_rate, highest_rate = self._critical_acceptance_range
+        if lowest_rate <= rate <= highest_rate:
+            return int(self._base_steps * self._critical_multiplier)
+        return self._base_steps
+
+    def should_end_temperature(self, steps, acceptances):
+        """Decides whether the current temperature should end early
+
+        Parameters
+        ----------
+        steps: int
+            The number of steps taken so far at the current temperature
+        acceptances: int
+            The number of candidate solutions accepted so far at the
+            current temperature
+
+        Returns
+        -------
+        bool
+            True if target_acceptances has been reached, otherwise False
+
+        """
+        return self._target_acceptances is not None and acceptances >= self._target_acceptances
+
+    def record_temperature(self, temperature, steps, acceptances):
+        """Records the outcome of a temperature, which determines the number
+        of steps at the next temperature
+
+        Parameters
+        ----------
+        temperature: float
+            The temperature that ended
+        steps: int
+            The number of steps taken at the temperature
+        acceptances: int
+            The number of candidate solutions accepted at the temperature
+
+        Returns
+        -------
+        None
+
+        Side Effect
+        -----------
+        Sets last_acceptance_rate to the acceptance rate of the temperature
+
+        """
+        if steps > 0:
+            self._last_acceptance_rate = acceptances / steps
+
+    def get_last_acceptance_rate(self):
+        """Retrieves the acceptance rate observed at the previous temperature
+
+        Returns
+        -------
+        float
+            The fraction of steps that were accepted at the previous
+            temperature, or None if no temperature has ended
+
+        """
+        return self._last_acceptance_rate
+
+    def get_state(self):
+        """Retrieves the state observed during a run, so a checkpointed run
+        can be resumed
+
+        Returns
+        -------
+        dict
+            A picklable dictionary holding last_acceptance_rate
+
+        """
+        return {"last_acceptance_rate": self._last_acceptance_rate}
+
+    def set_state(self, state):
+        """Restores a state retrieved by get_state
+
+        Parameters
+        ----------
+        state: dict
+            A dictionary returned by get_state
+
+        Returns
+        -------
+        None
+
+        Side Effect
+        -----------
+        Resets last_acceptance_rate to the value held in state
+
+        """
+        self._last_acceptance_rate = state["last_acceptance_rate"]
@@ -0,0 +1,131 @@
+"""The AnnealingCheckpointer class saves the state of a run of the simulated
+annealing algorithm to a file at regular intervals, so a run stopped part
+way through, for example by a pre-empted node, can be resumed from its last
+checkpoint and continue exactly as if it had never stopped.
+
+A checkpoint holds the state returned by AnnealingRun.get_state along with
+any extra data the caller wants restored, such as the trace of objective
+values so far. It is pickled, so the solutions must be picklable. The
+temperature parameters, iteration size and optimization problem are not
+saved, and must be built in the same way when resuming
+
+"""
+
+import os
+import pickle
+
+
+CHECKPOINT_VERSION = 3
+
+
+class AnnealingCheckpointer:
+    """Saves and restores checkpoints of a run of the simulated annealing
+    algorithm
+
+    Attributes
+    ----------
+    file_path: str
+        The path of the checkpoint file
+    checkpoint_interval: int
+        The number of temperatures between checkpoints
+
+    """
+    def __init__(self, file_path, checkpoint_interval=1):
+        self._file_path = file_path
+        self._checkpoint_interval = checkpoint_interval
+
+    def get_file_path(self):
+        """Retrieves the path of the checkpoint file
+
+        Returns
+        -------
+        str
+            The path of the checkpoint file
+
+        """
+        return self._file_path
+
+    def save(self, annealing_run, extra=None):
+        """Saves a checkpoint of annealing_run
+
+        Parameters
+        ----------
+        annealing_run: AnnealingRun
+            The run being checkpointed, between two temperatures
+        extra: object
+            Optional picklable data saved with the checkpoint and returned
+            when it is restored
+
+        Returns
+        -------
+        None
+
+        Side Effect
+        -----------
+        Replaces the checkpoint file. The checkpoint is written under a
+        temporary name first, so a run stopped while saving leaves the
+        previous checkpoint intact
+
+        """
+        checkpoint = {"version": CHECKPOINT_VERSION, "state": annealing_run.get_state(), "extra": extra}
+        temporary_path = "{0}.tmp".format(self._file_path)
+        with open(temporary_path, "wb") as checkpoint_file:
+            pickle.dump(checkpoint, checkpoint_file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary_path, self._file_path)
+
+    def record(self, annealing_run, extra=None):
+        """Saves a checkpoint of annealing_run if checkpoint_interval
+        temperatures have been completed since the last checkpoint, or if
+        the run has finished
+
+        Parameters
+        ----------
+        annealing_run: AnnealingRun
+            The run being checkpointed, called after each temperature
+        extra: object
+            Optional picklable data saved with the checkpoint
+
+        Returns
+        -------
+        bool
+            True if a checkpoint was saved, otherwise False
+
+        """
+        if annealing_run.get_temperature_index() % self._checkpoint_interval == 0 or annealing_run.is_finished():
+            self.save(annealing_run, extra)
+            return True
+        return False
+
+    def restore(self, annealing_run):
+        """Restores the last checkpoint into annealing_run, if there is one
+
+        Parameters
+        ----------
+        annealing_run: AnnealingRun
+            A run that has not started, built in the same way as the run
+            that was checkpointed
+
+        Returns
+        -------
+        bool, object
+            True and the extra data saved with the checkpoint if a checkpoint
+            was restored, otherwise False and None
+
+        Side Effect
+        -----------
+        Restores the state of annealing_run from the checkpoint file
+
+        Raises
+        ------
+        ValueError
+            If the checkpoint file was written by an incompatible version
+
+        """
+        if not os.path.exists(self._file_path):
+            return False, None
+        with open(self._file_path, "rb") as checkpoint_file:
+            checkpoint = pickle.load(checkpoint_file)
+        if checkpoint.get("version") != CHECKPOINT_VERSION:
+            raise ValueError("{0} is not a compatible checkpoint".format(self._file_path))
+        annealing_run.set_state(checkpoint["state"])
+        return True, checkpoint["extra"]
@@ -0,0 +1,74 @@
+"""The AnnealingResult class acts as a container class for the outcome of
+a run of the simulated annealing algorithm. It holds the final and best
+solutions along with the trace of objective values recorded at each temperature
+
+"""
+
+class AnnealingResult:
+    """A container class for the outcome of the simulated annealing algorithm
+
+    Attributes
+    ----------
+    final_solution: OptimizationSolution
+        The solution held by the algorithm when it finished
+    best_solution: OptimizationSolution
+        The solution with the lowest objective value held at any point
+        during the algorithm
+    temperatures: list
+        The temperatures used in the algorithm
+    objective_values: list
+        The objective value of the solution held at the end of
+        each temperature
+
+    """
+    def __init__(self, final_solution, best_solution, temperatures, objective_values):
+        self._final_solution = final_solution
+        self._best_solution = best_solution
+        self._temperatures = temperatures
+        self._objective_values = objective_values
+
+    def get_final_solution(self):
+        """Retrieves the solution held by the algorithm when it finished
+
+        Returns
+        -------
+        OptimizationSolution
+            The final solution found by the algorithm
+
+        """
+        return self._final_solution
+
+    def get_best_solution(self):
+        """Retrieves the best solution held at any point during the algorithm
+
+        Returns
+        -------
+        OptimizationSolution
+            The solution with the lowest objective value found by the
+            algorithm, which may have been left before it finished
+
+        """
+        return self._best_solution
+
+    def get_temperatures(self):
+        """Retrieves the temperatures used in the algorithm
+
+        Returns
+        -------
+        list
+            The temperatures used in the algorithm, in order
+
+        """
+        return self._temperatures
+
+    def get_objective_values(self):
+        """Retrieves the objective value held at the end of each temperature
+
+        Returns
+        -------
+        list
+            The objective value of the solution at the end of each
+            temperature, in the same order as the temperatures
+
+        """
+        return self._objective_values
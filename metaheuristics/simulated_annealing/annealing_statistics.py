@@ -0,0 +1,283 @@
+"""The AnnealingStatistics class collects detailed statistics about a run of
+the simulated annealing algorithm. For every temperature it counts the
+proposals, evaluations, acceptances, uphill acceptances and improvements of
+the best solution, and times each phase of a step: generating a neighbour,
+evaluating it, deciding whether to accept it and the remaining bookkeeping.
+
+Collecting statistics times every step, so it is only done when an
+AnnealingStatistics object is given to the algorithm. Otherwise the
+uninstrumented steps are run and nothing is collected
+
+"""
+
+PHASES = ("neighbour", "evaluation", "acceptance", "bookkeeping")
+
+
+class TemperatureStatistics:
+    """A container class for the statistics collected at one temperature
+
+    Attributes
+    ----------
+    temperature_index: int
+        The position of the temperature in the run, starting from 0
+    temperature: float
+        The temperature at which the steps were taken
+    proposals: int
+        The number of candidate solutions proposed
+    evaluations: int
+        The number of objective values, or changes in objective value,
+        calculated for candidate solutions
+    acceptances: int
+        The number of candidate solutions accepted
+    uphill_acceptances: int
+        The number of accepted candidate solutions that were worse than
+        the current solution
+    improvements: int
+        The number of times the best solution of the run was improved
+    phase_times: dict
+        The number of seconds spent in each phase of a step, keyed by the
+        names in PHASES
+
+    """
+    def __init__(self, temperature_index, temperature):
+        self._temperature_index = temperature_index
+        self._temperature = temperature
+        self._proposals = 0
+        self._evaluations = 0
+        self._acceptances = 0
+        self._uphill_acceptances = 0
+        self._improvements = 0
+        self._phase_times = {phase: 0.0 for phase in PHASES}
+
+    def get_temperature_index(self):
+        """Retrieves the position of the temperature in the run
+
+        Returns
+        -------
+        int
+            The position of the temperature, starting from 0
+
+        """
+        return self._temperature_index
+
+    def get_temperature(self):
+        """Retrieves the temperature at which the steps were taken
+
+        Returns
+        -------
+        float
+            The temperature
+
+        """
+        return self._temperature
+
+    def get_proposals(self):
+        """Retrieves the number of candidate solutions proposed
+
+        Returns
+        -------
+        int
+            The number of candidate solutions proposed
+
+        """
+        return self._proposals
+
+    def get_evaluations(self):
+        """Retrieves the number of evaluations of candidate solutions
+
+        Returns
+        -------
+        int
+            The number of objective values, or changes in objective value,
+            calculated for candidate solutions
+
+        """
+        return self._evaluations
+
+    def get_acceptances(self):
+        """Retrieves the number of candidate solutions accepted
+
+        Returns
+        -------
+        int
+            The number of candidate solutions accepted
+
+        """
+        return self._acceptances
+
+    def get_uphill_acceptances(self):
+        """Retrieves the number of worse candidate solutions accepted
+
+        Returns
+        -------
+        int
+            The number of accepted candidate solutions that were worse than
+            the current solution
+
+        """
+        return self._uphill_acceptances
+
+    def get_improvements(self):
+        """Retrieves the number of improvements of the best solution
+
+        Returns
+        -------
+        int
+            The number of times the best solution of the run was improved
+
+        """
+        return self._improvements
+
+    def get_phase_times(self):
+        """Retrieves the time spent in each phase of a step
+
+        Returns
+        -------
+        dict
+            The number of seconds spent in each phase, keyed by phase name
+
+        """
+        return self._phase_times
+
+    def record_steps(self, proposals, evaluations, acceptances, uphill_acceptances, improvements, phase_times):
+        """Adds the counters and phase times of a batch of steps
+
+        Parameters
+        ----------
+        proposals: int
+            The number of candidate solutions proposed
+        evaluations: int
+            The number of evaluations of candidate solutions
+        acceptances: int
+            The number of candidate solutions accepted
+        uphill_acceptances: int
+            The number of worse candidate solutions accepted
+        improvements: int
+            The number of improvements of the best solution
+        phase_times: dict
+            The number of seconds spent in each phase, keyed by phase name
+
+        Returns
+        -------
+        None
+
+        Side Effect
+        -----------
+        Adds each value to the corresponding statistic
+
+        """
+        self._proposals += proposals
+        self._evaluations += evaluations
+        self._acceptances += acceptances
+        self._uphill_acceptances += uphill_acceptances
+        self._improvements += improvements
+        for phase, phase_time in phase_times.items():
+            self._phase_times[phase] += phase_time
+
+
+class AnnealingStatistics:
+    """Collects the statistics of every temperature of a run of the
+    simulated annealing algorithm
+
+    Attributes
+    ----------
+    temperature_statistics: list
+        The TemperatureStatistics of every completed temperature, in order
+    callback: function
+        An optional function called with the TemperatureStatistics of a
+        temperature every callback_interval temperatures
+    callback_interval: int
+        The number of temperatures between calls to callback
+
+    """
+    def __init__(self, callback=None, callback_interval=1):
+        self._temperature_statistics = []
+        self._callback = callback
+        self._callback_interval = callback_interval
+
+    def start_temperature(self, temperature_index, temperature):
+        """Creates the statistics of a temperature about to start
+
+        Parameters
+        ----------
+        temperature_index: int
+            The position of the temperature in the run
+        temperature: float
+            The temperature about to be used
+
+        Returns
+        -------
+        TemperatureStatistics
+            Empty statistics for the temperature
+
+        """
+        return TemperatureStatistics(temperature_index, temperature)
+
+    def end_temperature(self, temperature_statistics):
+        """Records the statistics of a completed temperature
+
+        Parameters
+        ----------
+        temperature_statistics: TemperatureStatistics
+            The statistics of the temperature that ended
+
+        Returns
+        -------
+        None
+
+        Side Effect
+        -----------
+        Appends temperature_statistics to the statistics of the run and
+        calls callback with it if callback_interval temperatures have
+        ended since the last call
+
+        """
+        self._temperature_statistics.append(temperature_statistics)
+        if self._callback is not None and len(self._temperature_statistics) % self._callback_interval == 0:
+            self._callback(temperature_statistics)
+
+    def get_temperature_statistics(self):
+        """Retrieves the statistics of every completed temperature
+
+        Returns
+        -------
+        list
+            The TemperatureStatistics of every completed temperature, in order
+
+        """
+        return self._temperature_statistics
+
+    def get_totals(self):
+        """Calculates the counters summed over every completed temperature
+
+        Returns
+        -------
+        dict
+            The total proposals, evaluations, acceptances, uphill_acceptances
+            and improvements of the run
+
+        """
+        totals = {"proposals": 0, "evaluations": 0, "acceptances": 0,
+                  "uphill_acceptances": 0, "improvements": 0}
+        for statistics in self._temperature_statistics:
+            totals["proposals"] += statistics.get_proposals()
+            totals["evaluations"] += statistics.get_evaluations()
+            totals["acceptances"] += statistics.get_acceptances()
+            totals["uphill_acceptances"] += statistics.get_uphill_acceptances()
+            totals["improvements"] += statistics.get_improvements()
+        return totals
+
+    def get_phase_times(self):
+        """Calculates the time spent in each phase over every completed temperature
+
+        Returns
+        -------
+        dict
+            The number of seconds spent in each phase, keyed by phase name
+
+        """
+        phase_times = {phase: 0.0 for phase in PHASES}
+        for statistics in self._temperature_statistics:
+            for phase, phase_time in statistics.get_phase_times().items():
+                phase_times[phase] += phase_time
+        return phase_times
@@ -0,0 +1,13 @@
+"""A benchmark suite for the simulated annealing engine. Each benchmark runs
+run_simulated_annealing on a problem specification and measures the steps
+taken per second, the candidate evaluations per second, the time taken to
+reach a target objective value and the peak memory allocated.
+
+Results are saved as JSON and compared against a stored baseline, so that
+slowdowns are flagged. The suite is run with
+
+    python -m metaheuristics.simulated_annealing.benchmarks --output results.json
+
+and a baseline is compared against with the --baseline option
+
+"""
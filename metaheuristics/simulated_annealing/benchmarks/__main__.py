@@ -0,0 +1,56 @@
+"""Runs the benchmark suite of the simulated annealing engine from the
+command line, optionally saving the results and comparing them against
+a baseline. The exit status is 1 if any regression is found
+
+"""
+
+import argparse
+import os
+import sys
+from metaheuristics.simulated_annealing.benchmarks.baseline_comparison \
+    import compare_with_baseline, load_results, merge_results, save_results
+from metaheuristics.simulated_annealing.benchmarks.benchmark_suite \
+    import default_benchmark_cases, run_benchmarks
+
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+
+def main(arguments=None):
+    parser = argparse.ArgumentParser(description="Benchmarks the simulated annealing engine")
+    parser.add_argument("--output", help="the JSON file to which results are saved")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE,
+                        help="the JSON file of baseline results compared against")
+    parser.add_argument("--no-compare", action="store_true", help="skip the comparison against the baseline")
+    parser.add_argument("--tolerance", type=float,
+                        help="the relative slowdown allowed before any metric is flagged, "
+                             "overriding the tolerance of each metric")
+    parser.add_argument("--repeats", type=int, default=5,
+                        help="the number of timed repeats of each benchmark, of which the best is kept")
+    parser.add_argument("--runs", type=int, default=1,
+                        help="the number of runs of the suite, whose median results are reported")
+    parser.add_argument("--only", nargs="*", help="the names of the benchmarks to run")
+    args = parser.parse_args(arguments)
+
+    cases = default_benchmark_cases()
+    if args.only:
+        cases = [case for case in cases if case.get_name() in args.only]
+    results = merge_results([run_benchmarks(cases, repeats=args.repeats) for _ in range(args.runs)])
+    for name, metrics in results.items():
+        time_to_target = metrics["time_to_target"]
+        print("{0}: {1:.0f} steps/s, {2:.0f} evaluations/s, time to target {3}, peak memory {4} bytes".format(
+                name, metrics["steps_per_second"], metrics["evaluations_per_second"],
+                "n/a" if time_to_target is None else "{0:.4f}s".format(time_to_target),
+                metrics["peak_memory_bytes"]))
+    if args.output:
+        save_results(results, args.output)
+    if args.no_compare or not os.path.exists(args.baseline):
+        return 0
+    regressions = compare_with_baseline(results, load_results(args.baseline), args.tolerance)
+    for regression in regressions:
+        print("REGRESSION {benchmark} {metric}: baseline {baseline}, now {result}".format(**regression))
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,150 @@
+"""Saves benchmark results as JSON and compares them against a stored
+baseline. A metric is flagged as a regression when it is worse than the
+baseline by more than a relative tolerance, which allows for the noise
+of timing on a shared machine.
+
+Timed metrics are compared relative to the speed of the machine, measured
+by a calibration loop matching the work of each benchmark, so a baseline
+saved on one machine can be compared against on another. The
+normalisation only removes differences in overall speed, so a baseline
+should still be regenerated after a large change of hardware or Python
+version. A baseline is best made from the median of several runs of the
+suite, which merge_results computes
+
+"""
+
+import json
+import platform
+import numpy as np
+
+
+HIGHER_IS_BETTER = ("relative_steps_per_second", "relative_evaluations_per_second")
+LOWER_IS_BETTER = ("relative_time_to_target", "peak_memory_bytes")
+# the relative amount by which each metric may be worse than the baseline.
+# Timed metrics vary by up to a quarter between runs on a shared machine,
+# even as the best of several repeats, and the time to target is only
+# measured at the end of each temperature, while peak memory is stable
+TOLERANCES = {"relative_steps_per_second": 0.35,
+              "relative_evaluations_per_second": 0.35,
+              "relative_time_to_target": 0.5,
+              "peak_memory_bytes": 0.1}
+
+
+def save_results(results, file_path):
+    """Saves benchmark results as JSON, along with a description of the
+    environment they were measured in
+
+    Parameters
+    ----------
+    results: dict
+        A dictionary mapping the name of each benchmark to its metrics,
+        as returned by run_benchmarks
+    file_path: str
+        The path of the JSON file written
+
+    Returns
+    -------
+    None
+
+    Side Effect
+    -----------
+    Writes the results to file_path
+
+    """
+    environment = {"python": platform.python_version(),
+                   "numpy": np.__version__,
+                   "machine": platform.machine()}
+    with open(file_path, "w") as results_file:
+        json.dump({"environment": environment, "benchmarks": results}, results_file, indent=2, sort_keys=True)
+
+
+def load_results(file_path):
+    """Loads benchmark results saved by save_results
+
+    Parameters
+    ----------
+    file_path: str
+        The path of the JSON file read
+
+    Returns
+    -------
+    dict
+        A dictionary mapping the name of each benchmark to its metrics
+
+    """
+    with open(file_path) as results_file:
+        return json.load(results_file)["benchmarks"]
+
+
+def merge_results(results_list):
+    """Merges the results of several runs of the benchmarks, taking the
+    median of each metric
+
+    Parameters
+    ----------
+    results_list: list
+        A list of dictionaries mapping the name of each benchmark to its
+        metrics, as returned by run_benchmarks
+
+    Returns
+    -------
+    dict
+        A dictionary of the same form holding the median of each metric
+        over the runs, rounded down for integer metrics. A metric that is
+        None in any run, such as a time to target that was not reached, is None
+
+    """
+    merged_results = {}
+    for name in results_list[0]:
+        merged_results[name] = {}
+        for metric in results_list[0][name]:
+            values = [results[name][metric] for results in results_list]
+            if None in values:
+                merged_results[name][metric] = None
+            elif all(isinstance(value, int) for value in values):
+                merged_results[name][metric] = int(np.median(values))
+            else:
+                merged_results[name][metric] = float(np.median(values))
+    return merged_results
+
+
+def compare_with_baseline(results, baseline, tolerance=None):
+    """Finds the metrics of results that are worse than those of baseline
+
+    Only the benchmarks and metrics present in both results and baseline
+    are compared, so benchmarks can be added without updating the baseline
+
+    Parameters
+    ----------
+    results: dict
+        A dictionary mapping the name of each benchmark to its metrics
+    baseline: dict
+        A dictionary of the same form holding the baseline metrics
+    tolerance: float
+        The relative amount by which a metric may be worse than the
+        baseline before it is flagged. If None, the tolerance of each
+        metric is taken from TOLERANCES
+
+    Returns
+    -------
+    list
+        A list of dictionaries, one for each regression, with the name of
+        the benchmark, the metric, its baseline value and its new value
+
+    """
+    regressions = []
+    for name in sorted(set(results) & set(baseline)):
+        for metric in HIGHER_IS_BETTER + LOWER_IS_BETTER:
+            new_value = results[name].get(metric)
+            baseline_value = baseline[name].get(metric)
+            if baseline_value is None:
+                continue
+            metric_tolerance = TOLERANCES[metric] if tolerance is None else tolerance
+            if metric in HIGHER_IS_BETTER:
+                is_regression = new_value is None or new_value < baseline_value * (1 - metric_tolerance)
+            else:
+                is_regression = new_value is None or new_value > baseline_value * (1 + metric_tolerance)
+            if is_regression:
+                regressions.append({"benchmark": name, "metric": metric,
+                                    "baseline": baseline_value, "result": new_value})
+    return regressions
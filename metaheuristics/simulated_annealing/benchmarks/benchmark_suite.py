@@ -0,0 +1,474 @@
+"""Defines the benchmarks of the simulated annealing engine and the code
+used to run them. A benchmark is described by a BenchmarkCase, holding a
+picklable problem specification and a fixed cooling schedule, so every
+run of a benchmark performs the same work
+
+"""
+
+import time
+import tracemalloc
+import numpy as np
+from metaheuristics.simulated_annealing.cooling_schedules \
+    import geometric_schedule, ScheduledTemperatureParams
+from metaheuristics.simulated_annealing.problem_specs \
+    import HimmelblauProblemSpec, QuadraticAssignmentProblemSpec
+from metaheuristics.simulated_annealing.simulated_annealing_utils \
+    import AnnealingRun, make_iteration_size_function, run_simulated_annealing_trace
+from metaheuristics.tools.random_buffer import RandomBuffer
+
+
+class BenchmarkCase:
+    """A container class for a benchmark of the simulated annealing engine
+
+    Attributes
+    ----------
+    name: str
+        The name identifying the benchmark in saved results
+    problem_spec: object
+        A problem specification providing build_problem, such as a
+        QuadraticAssignmentProblemSpec
+    temperatures: numpy.ndarray
+        The cooling schedule used by the benchmark
+    iteration_size: int
+        The number of steps taken at each temperature
+    target_objective: float
+        The objective value used to measure the time to target, or None
+        if the time to target is not measured
+    seed: int
+        The seed of the random number generator used by each run
+    calibration: str
+        The calibration loop against which the timed metrics are
+        normalised, either "python" for benchmarks dominated by the
+        interpreter or "numpy" for benchmarks dominated by calls to numpy
+
+    """
+    def __init__(self, name, problem_spec, temperatures, iteration_size, target_objective=None, seed=0,
+                 calibration="python"):
+        if calibration not in CALIBRATION_LOOPS:
+            raise ValueError("calibration must be one of {0}".format(sorted(CALIBRATION_LOOPS)))
+        self._name = name
+        self._problem_spec = problem_spec
+        self._temperatures = np.asarray(temperatures, dtype=float)
+        self._iteration_size = iteration_size
+        self._target_objective = target_objective
+        self._seed = seed
+        self._calibration = calibration
+
+    def get_name(self):
+        """Retrieves the name of the benchmark
+
+        Returns
+        -------
+        str
+            The name identifying the benchmark
+
+        """
+        return self._name
+
+    def get_target_objective(self):
+        """Retrieves the objective value used to measure the time to target
+
+        Returns
+        -------
+        float
+            The target objective value, or None if there is no target
+
+        """
+        return self._target_objective
+
+    def get_iteration_size(self):
+        """Retrieves the number of steps taken at each temperature
+
+        Returns
+        -------
+        int
+            The number of steps taken at each temperature
+
+        """
+        return self._iteration_size
+
+    def get_calibration(self):
+        """Retrieves the calibration loop the timed metrics are normalised by
+
+        Returns
+        -------
+        str
+            The name of the calibration loop, either "python" or "numpy"
+
+        """
+        return self._calibration
+
+    def build_random_buffer(self):
+        """Builds a fresh RandomBuffer for one run of the benchmark
+
+        Returns
+        -------
+        RandomBuffer
+            A RandomBuffer seeded with seed
+
+        """
+        return RandomBuffer(self._seed)
+
+    def build_problem(self, random_buffer=None):
+        """Builds a fresh problem for the benchmark
+
+        Parameters
+        ----------
+        random_buffer: RandomBuffer
+            The RandomBuffer from which the problem draws random numbers. If
+            omitted, a RandomBuffer seeded with seed is used
+
+        Returns
+        -------
+        OptimizationProblem
+            The problem solved by the benchmark
+
+        """
+        if random_buffer is None:
+            random_buffer = self.build_random_buffer()
+        return self._problem_spec.build_problem(random_buffer)
+
+    def build_temperature_params(self):
+        """Builds a fresh TemperatureParams object for the benchmark
+
+        Returns
+        -------
+        ScheduledTemperatureParams
+            A TemperatureParams object stepping through the cooling schedule
+
+        """
+        return ScheduledTemperatureParams(self._temperatures)
+
+    def build_run(self):
+        """Builds a fresh AnnealingRun for one run of the benchmark
+
+        Returns
+        -------
+        AnnealingRun
+            An AnnealingRun solving a fresh problem with the cooling schedule
+            and iteration size of the benchmark. The problem and the run draw
+            random numbers from one RandomBuffer seeded with seed
+
+        """
+        random_buffer = self.build_random_buffer()
+        return AnnealingRun(self.build_temperature_params(), make_iteration_size_function(self._iteration_size),
+                            self.build_problem(random_buffer), random_buffer=random_buffer)
+
+
+def measure_steps(case):
+    """Runs a benchmark once, measuring the steps taken per second and the
+    time taken to reach the target objective value
+
+    Parameters
+    ----------
+    case: BenchmarkCase
+        The benchmark being run
+
+    Returns
+    -------
+    dict
+        A dictionary with the number of steps taken, the steps taken per
+        second, the best objective value found and the time to target in
+        seconds, which is None if the target was not reached. The time to
+        target is measured at the end of each temperature
+
+    """
+    annealing_run = case.build_run()
+    target_objective = case.get_target_objective()
+    steps = 0
+    elapsed_time = 0.0
+    time_to_target = None
+    for record in annealing_run:
+        steps += record.get_steps()
+        elapsed_time = record.get_elapsed_time()
+        if (time_to_target is None and target_objective is not None and
+                record.get_best_objective_value() <= target_objective):
+            time_to_target = elapsed_time
+    return {"steps": steps,
+            "steps_per_second": steps / elapsed_time if elapsed_time > 0 else float("inf"),
+            "best_objective_value": float(annealing_run.get_best_objective_value()),
+            "time_to_target": time_to_target}
+
+
+def measure_evaluations(case, number_of_evaluations):
+    """Measures the candidate solutions evaluated per second, away from
+    the rest of the engine
+
+    A candidate is evaluated the way the engine evaluates it. A move is
+    proposed and its delta calculated for problems supporting the move
+    protocol, otherwise a neighbour solution is found and its objective
+    function evaluated
+
+    Parameters
+    ----------
+    case: BenchmarkCase
+        The benchmark being run
+    number_of_evaluations: int
+        The number of candidate solutions evaluated
+
+    Returns
+    -------
+    float
+        The number of candidate solutions evaluated per second
+
+    """
+    problem = case.build_problem()
+    start_time = time.perf_counter()
+    if problem.supports_moves():
+        for _ in range(number_of_evaluations):
+            problem.get_move_delta(problem.propose_move())
+    else:
+        for _ in range(number_of_evaluations):
+            problem.find_neighbour_solution()
+    elapsed_time = time.perf_counter() - start_time
+    return number_of_evaluations / elapsed_time if elapsed_time > 0 else float("inf")
+
+
+def measure_peak_memory(case):
+    """Measures the peak memory allocated by run_simulated_annealing_trace,
+    which runs the same steps as the timed runs from the same seed
+
+    The run is traced with tracemalloc, which slows it down, so it is kept
+    separate from the timed runs
+
+    Parameters
+    ----------
+    case: BenchmarkCase
+        The benchmark being run
+
+    Returns
+    -------
+    int
+        The peak number of bytes allocated during the run
+
+    """
+    random_buffer = case.build_random_buffer()
+    problem = case.build_problem(random_buffer)
+    temp_params = case.build_temperature_params()
+    tracemalloc.start()
+    try:
+        run_simulated_annealing_trace(temp_params, make_iteration_size_function(case.get_iteration_size()),
+                                      problem, random_buffer=random_buffer)
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak_memory
+
+
+def measure_calibration_speed(number_of_operations=200000):
+    """Measures the speed of the machine on a fixed loop of Python
+    arithmetic, against which the timed metrics of benchmarks dominated by
+    the interpreter are normalised
+
+    The metrics of such benchmarks scale with the speed of the
+    interpreter, so dividing them by the speed of this loop gives values
+    that can be compared between machines
+
+    Parameters
+    ----------
+    number_of_operations: int
+        The number of iterations of the calibration loop
+
+    Returns
+    -------
+    float
+        The number of iterations of the calibration loop run per second
+
+    """
+    value = 0.5
+    start_time = time.perf_counter()
+    for idx in range(number_of_operations):
+        value = (value * 3.7 + idx) % 1.0
+    elapsed_time = time.perf_counter() - start_time
+    return number_of_operations / elapsed_time if elapsed_time > 0 else float("inf")
+
+
+def measure_numpy_calibration_speed(number_of_operations=50000, size=64):
+    """Measures the speed of the machine on a fixed loop of small numpy
+    operations, against which the timed metrics of benchmarks dominated by
+    calls to numpy are normalised
+
+    Each iteration gathers a permuted row of a matrix and takes its dot
+    product with a column, like the swap deltas of the quadratic
+    assignment problem, so the loop tracks the overhead of numpy calls
+    rather than that of the interpreter alone
+
+    Parameters
+    ----------
+    number_of_operations: int
+        The number of iterations of the calibration loop
+    size: int
+        The length of the arrays used by each iteration
+
+    Returns
+    -------
+    float
+        The number of iterations of the calibration loop run per second
+
+    """
+    generator = np.random.default_rng(0)
+    matrix = generator.random((size, size))
+    permutation = generator.permutation(size)
+    value = 0.0
+    start_time = time.perf_counter()
+    for idx in range(number_of_operations):
+        value += float(np.dot(matrix[idx % size, permutation], matrix[:, idx % size]))
+    elapsed_time = time.perf_counter() - start_time
+    return number_of_operations / elapsed_time if elapsed_time > 0 else float("inf")
+
+
+CALIBRATION_LOOPS = {"python": measure_calibration_speed, "numpy": measure_numpy_calibration_speed}
+
+
+def run_benchmark(case, repeats=5, number_of_evaluations=50000):
+    """Runs a benchmark, repeating the timed measurements
+
+    Every repeat is preceded and followed by a run of the calibration loop
+    of the benchmark, so the relative metrics of a repeat are normalised by
+    the speed of the machine at the time the repeat was measured
+
+    Parameters
+    ----------
+    case: BenchmarkCase
+        The benchmark being run
+    repeats: int
+        The number of times the timed measurements are repeated. The best
+        of the repeats is reported, as it is the least disturbed by other
+        processes
+    number_of_evaluations: int
+        The number of candidate solutions evaluated when measuring the
+        evaluations per second
+
+    Returns
+    -------
+    dict
+        A dictionary with the metrics of the benchmark: steps,
+        steps_per_second, evaluations_per_second, time_to_target,
+        best_objective_value and peak_memory_bytes, along with
+        relative_steps_per_second and relative_evaluations_per_second, the
+        rates divided by the speed of the calibration loop, and
+        relative_time_to_target, the time to target multiplied by it
+
+    """
+    calibration_loop = CALIBRATION_LOOPS[case.get_calibration()]
+    step_measurements = []
+    evaluation_rates = []
+    calibration_speeds = []
+    for _ in range(repeats):
+        calibration_speed = calibration_loop()
+        step_measurements.append(measure_steps(case))
+        evaluation_rates.append(measure_evaluations(case, number_of_evaluations))
+        calibration_speeds.append(max(calibration_speed, calibration_loop()))
+    steps_rates = [measurement["steps_per_second"] for measurement in step_measurements]
+    times_to_target = [measurement["time_to_target"] for measurement in step_measurements]
+    time_to_target = None
+    relative_time_to_target = None
+    if None not in times_to_target:
+        time_to_target = min(times_to_target)
+        relative_time_to_target = float(min(np.multiply(times_to_target, calibration_speeds)))
+    return {"steps": step_measurements[0]["steps"],
+            "steps_per_second": max(steps_rates),
+            "evaluations_per_second": max(evaluation_rates),
+            "time_to_target": time_to_target,
+            "relative_steps_per_second": float(max(np.divide(steps_rates, calibration_speeds))),
+            "relative_evaluations_per_second": float(max(np.divide(evaluation_rates, calibration_speeds))),
+            "relative_time_to_target": relative_time_to_target,
+            "best_objective_value": step_measurements[0]["best_objective_value"],
+            "peak_memory_bytes": measure_peak_memory(case)}
+
+
+def run_benchmarks(cases, repeats=5, number_of_evaluations=50000):
+    """Runs every benchmark in cases
+
+    Parameters
+    ----------
+    cases: list
+        A list of BenchmarkCase objects
+    repeats: int
+        The number of times the timed measurements of each benchmark are repeated
+    number_of_evaluations: int
+        The number of candidate solutions evaluated when measuring the
+        evaluations per second
+
+    Returns
+    -------
+    dict
+        A dictionary mapping the name of each benchmark to its metrics
+
+    """
+    return {case.get_name(): run_benchmark(case, repeats, number_of_evaluations) for case in cases}
+
+
+def random_qap_spec(size, seed=0):
+    """Builds a synthetic instance of the quadratic assignment problem
+
+    Locations are random points on a grid, with Manhattan distances between
+    them, and flows are random integers between 0 and 9
+
+    Parameters
+    ----------
+    size: int
+        The number of facilities in the instance
+    seed: int
+        The seed used to generate the instance
+
+    Returns
+    -------
+    QuadraticAssignmentProblemSpec
+        A specification of the instance, starting from the identity ordering
+
+    """
+    generator = np.random.default_rng(seed)
+    locations = generator.integers(0, size, size=(size, 2))
+    dist_matrix = np.abs(locations[:, None, :] - locations[None, :, :]).sum(axis=2)
+    flow_matrix = np.triu(generator.integers(0, 10, size=(size, size)), 1)
+    flow_matrix = flow_matrix + flow_matrix.T
+    return QuadraticAssignmentProblemSpec(flow_matrix, dist_matrix, list(range(size)))
+
+
+def example_qap_spec():
+    """Builds the eight facility instance of the quadratic assignment problem
+    used in the examples
+
+    Returns
+    -------
+    QuadraticAssignmentProblemSpec
+        A specification of the instance, starting from the ordering used
+        in the examples
+
+    """
+    dist_matrix = np.array([[0, 1, 2, 3, 1, 2, 3, 4], [1, 0, 1, 2, 2, 1, 2, 3], [2, 1, 0, 1, 3, 2, 1, 2],
+                            [3, 2, 1, 0, 4, 3, 2, 1], [1, 2, 3, 4, 0, 1, 2, 3], [2, 1, 2, 3, 1, 0, 1, 2],
+                            [3, 2, 1, 2, 2, 1, 0, 1], [4, 3, 2, 1, 3, 2, 1, 0]])
+    flow_matrix = np.array([[0, 5, 2, 4, 1, 0, 0, 6], [5, 0, 3, 0, 2, 2, 2, 0], [2, 3, 0, 0, 0, 0, 0, 5],
+                            [4, 0, 0, 0, 5, 2, 2, 10], [1, 2, 0, 5, 0, 10, 0, 0], [0, 2, 0, 2, 10, 0, 5, 1],
+                            [0, 2, 0, 2, 0, 5, 0, 10], [6, 0, 5, 10, 0, 1, 10, 0]])
+    return QuadraticAssignmentProblemSpec(flow_matrix, dist_matrix, [1, 3, 0, 4, 2, 5, 6, 7])
+
+
+def default_benchmark_cases():
+    """Builds the benchmarks run by default
+
+    The suite covers the himmelblau function, the eight facility instance
+    of the examples and synthetic instances of the quadratic assignment
+    problem with 32, 128 and 512 facilities. The swap deltas of the
+    quadratic assignment problem are computed with numpy, so those
+    benchmarks are normalised by the numpy calibration loop
+
+    Returns
+    -------
+    list
+        A list of BenchmarkCase objects
+
+    """
+    return [BenchmarkCase("himmelblau", HimmelblauProblemSpec(2, 1, 0.1),
+                          geometric_schedule(1500.0, 0.9, 100), 200, target_objective=1e-2),
+            BenchmarkCase("qap_8", example_qap_spec(),
+                          geometric_schedule(1500.0, 0.9, 100), 200, target_objective=214.0,
+                          calibration="numpy"),
+            BenchmarkCase("qap_32", random_qap_spec(32, seed=32),
+                          geometric_schedule(1000.0, 0.95, 100), 200, calibration="numpy"),
+            BenchmarkCase("qap_128", random_qap_spec(128, seed=128),
+                          geometric_schedule(5000.0, 0.95, 50), 200, calibration="numpy"),
+            BenchmarkCase("qap_512_synthetic", random_qap_spec(512, seed=512),
+                          geometric_schedule(20000.0, 0.95, 20), 250, calibration="numpy")]
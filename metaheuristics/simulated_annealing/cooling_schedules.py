@@ -0,0 +1,173 @@
+"""A set of cooling schedules for the simulated annealing algorithm. Each
+schedule has a closed form, so the full sequence of temperatures is computed
+up front as a NumPy array. The ScheduledTemperatureParams class then steps
+through such an array wherever a TemperatureParams object is expected
+
+"""
+
+import numpy as np
+from metaheuristics.simulated_annealing.temperature_params import TemperatureParams
+
+
+def geometric_schedule(initial_temperature, cooling_rate, number_of_temperatures):
+    """Calculates a geometric cooling schedule, in which each temperature
+    is a fixed fraction of the previous one
+
+    Parameters
+    ----------
+    initial_temperature: float
+        The first temperature of the schedule
+    cooling_rate: float
+        The ratio between consecutive temperatures, in the range (0, 1)
+    number_of_temperatures: int
+        The number of temperatures in the schedule
+
+    Returns
+    -------
+    numpy.ndarray
+        The temperatures initial_temperature * cooling_rate ** k
+        for k = 0, ..., number_of_temperatures - 1
+
+    """
+    return initial_temperature * cooling_rate ** np.arange(number_of_temperatures)
+
+
+def linear_schedule(initial_temperature, final_temperature, number_of_temperatures):
+    """Calculates a linear cooling schedule, in which the temperature
+    decreases by the same amount at every change
+
+    Parameters
+    ----------
+    initial_temperature: float
+        The first temperature of the schedule
+    final_temperature: float
+        The last temperature of the schedule
+    number_of_temperatures: int
+        The number of temperatures in the schedule
+
+    Returns
+    -------
+    numpy.ndarray
+        number_of_temperatures evenly spaced temperatures from
+        initial_temperature to final_temperature
+
+    """
+    return np.linspace(initial_temperature, final_temperature, number_of_temperatures)
+
+
+def logarithmic_schedule(initial_temperature, number_of_temperatures):
+    """Calculates a logarithmic cooling schedule, which cools slowly enough
+    for the algorithm to converge to a global optimum in theory
+
+    Parameters
+    ----------
+    initial_temperature: float
+        The first temperature of the schedule
+    number_of_temperatures: int
+        The number of temperatures in the schedule
+
+    Returns
+    -------
+    numpy.ndarray
+        The temperatures initial_temperature * log(2) / log(k + 2)
+        for k = 0, ..., number_of_temperatures - 1
+
+    """
+    return initial_temperature * np.log(2) / np.log(np.arange(number_of_temperatures) + 2)
+
+
+def lundy_mees_schedule(initial_temperature, beta, number_of_temperatures):
+    """Calculates the Lundy-Mees cooling schedule, which applies the update
+    T -> T / (1 + beta * T) at every change of temperature
+
+    Parameters
+    ----------
+    initial_temperature: float
+        The first temperature of the schedule
+    beta: float
+        A positive constant controlling the speed of cooling
+    number_of_temperatures: int
+        The number of temperatures in the schedule
+
+    Returns
+    -------
+    numpy.ndarray
+        The temperatures initial_temperature / (1 + k * beta * initial_temperature)
+        for k = 0, ..., number_of_temperatures - 1, which is the closed form
+        of the Lundy-Mees update
+
+    """
+    return initial_temperature / (1 + np.arange(number_of_temperatures) * beta * initial_temperature)
+
+
+def cyclic_schedule(base_schedule, number_of_cycles, reheat_factor=1.0):
+    """Calculates a reheating schedule by repeating a base schedule
+
+    Parameters
+    ----------
+    base_schedule: numpy.ndarray
+        The temperatures of a single cooling cycle
+    number_of_cycles: int
+        The number of times the base schedule is repeated
+    reheat_factor: float
+        The temperatures of cycle c are those of base_schedule multiplied
+        by reheat_factor ** c, so a value below 1 reheats to a lower
+        temperature at every cycle
+
+    Returns
+    -------
+    numpy.ndarray
+        The concatenated temperatures of every cycle
+
+    """
+    base_schedule = np.asarray(base_schedule, dtype=float)
+    cycle_factors = reheat_factor ** np.arange(number_of_cycles)
+    return np.outer(cycle_factors, base_schedule).ravel()
+
+
+class ScheduledTemperatureParams(TemperatureParams):
+    """A TemperatureParams object whose temperatures are taken in order
+    from a precomputed schedule, such as one returned by geometric_schedule
+
+    Unlike a TemperatureParams built from a lambda, a ScheduledTemperatureParams
+    object can be pickled and sent to worker processes
+
+    Attributes
+    ----------
+    temperatures: numpy.ndarray
+        The temperatures of the schedule, in the order they are used
+    temperature_index: int
+        The position of the current temperature in the schedule
+
+    """
+    def __init__(self, temperatures):
+        self._temperatures = np.asarray(temperatures, dtype=float)
+        self._temperature_index = 0
+        super().__init__(float(self._temperatures[0]), len(self._temperatures), None)
+
+    def get_temperatures(self):
+        """Retrieves every temperature of the schedule
+
+        Returns
+        -------
+        numpy.ndarray
+            The temperatures of the schedule, in the order they are used
+
+        """
+        return self._temperatures
+
+    def update_temperature(self):
+        """Moves to the next temperature of the schedule. The last temperature
+        is kept once the end of the schedule is reached
+
+        Returns
+        -------
+        None
+
+        Side Effect
+        -----------
+        Sets the current temperature to the next temperature of the schedule
+
+        """
+        self._temperature_index = min(self._temperature_index + 1, len(self._temperatures) - 1)
+        self._current_temperature = float(self._temperatures[self._temperature_index])
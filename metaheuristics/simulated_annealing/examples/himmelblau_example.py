@@ -12,8 +12,9 @@ temperature_params = TemperatureParams(initial_temperature=1000.0,
                                        temperature_changes=300,
                                        temperature_updater=temperature_update_func)
 
-final_solution = himmelblau_simulated_annealing_solver(
-        2, 1, 0.1, iteration_size, temperature_params)
+result = himmelblau_simulated_annealing_solver(
+        2, 1, 0.1, iteration_size, temperature_params, plot=True)
 
-print("The final solution is {0} with objective value {1}"
+final_solution = result.get_best_solution()
+print("The best solution is {0} with objective value {1}"
       .format(final_solution.get_solution_value(), final_solution.get_objective_value()))
@@ -0,0 +1,24 @@
+import sys
+from metaheuristics.simulated_annealing.cooling_schedules import geometric_schedule, ScheduledTemperatureParams
+from metaheuristics.simulated_annealing.simulated_annealing_utils import quadratic_assignment_simulated_annealing_solver
+from metaheuristics.tools.qaplib import load_qaplib
+
+
+# the path of a QAPLIB instance, such as tai256c.dat
+qaplib_path = sys.argv[1]
+
+# the first load parses the file and caches it, later loads memory-map the cache
+flow_matrix, dist_matrix = load_qaplib(qaplib_path)
+initial_solution = list(range(len(flow_matrix)))
+
+iteration_size = 1000
+
+temperature_params = ScheduledTemperatureParams(geometric_schedule(10000.0, 0.95, 200))
+
+
+result = quadratic_assignment_simulated_annealing_solver(
+        flow_matrix, dist_matrix, initial_solution, iteration_size, temperature_params, seed=0)
+
+final_solution = result.get_best_solution()
+print("The best solution is {0} with objective value {1}"
+      .format(final_solution.get_solution_value(), final_solution.get_objective_value()))
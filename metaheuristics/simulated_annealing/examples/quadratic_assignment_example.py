@@ -28,8 +28,9 @@ temperature_params = TemperatureParams(initial_temperature=1500.0,
                                        temperature_updater=temperature_update_func)
 
 
-final_solution = quadratic_assignment_simulated_annealing_solver(
-        Flow, Dist, initial_solution, iteration_size, temperature_params)
+result = quadratic_assignment_simulated_annealing_solver(
+        Flow, Dist, initial_solution, iteration_size, temperature_params, plot=True)
 
-print("The final solution is {0} with objective value {1}"
+final_solution = result.get_best_solution()
+print("The best solution is {0} with objective value {1}"
       .format(final_solution.get_solution_value(), final_solution.get_objective_value()))
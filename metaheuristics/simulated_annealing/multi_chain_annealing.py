@@ -0,0 +1,253 @@
+"""A vectorized version of the simulated annealing algorithm for continuous
+optimization problems. Rather than running one chain at a time, a batch of
+independent chains is advanced together, with the positions, proposals,
+objective values and acceptance decisions of every chain held in NumPy arrays
+
+"""
+
+import numpy as np
+from metaheuristics.tools.functions import himmelblau_batch
+from metaheuristics.tools.optimization_solution import OptimizationSolution
+
+
+class MultiChainResult:
+    """A container class for the outcome of a multi chain run of the
+    simulated annealing algorithm
+
+    Attributes
+    ----------
+    final_positions: numpy.ndarray
+        An array of shape (K, d) with the position of each chain at the
+        end of the algorithm
+    final_objective_values: numpy.ndarray
+        An array of length K with the objective value of each chain at
+        the end of the algorithm
+    best_positions: numpy.ndarray
+        An array of shape (K, d) with the best position visited by each chain
+    best_objective_values: numpy.ndarray
+        An array of length K with the objective value of the best position
+        visited by each chain
+    acceptance_counts: numpy.ndarray
+        An array of length K with the number of proposals accepted by each chain
+    steps: int
+        The number of steps taken by every chain
+
+    """
+    def __init__(self, final_positions, final_objective_values, best_positions,
+                 best_objective_values, acceptance_counts, steps):
+        self._final_positions = final_positions
+        self._final_objective_values = final_objective_values
+        self._best_positions = best_positions
+        self._best_objective_values = best_objective_values
+        self._acceptance_counts = acceptance_counts
+        self._steps = steps
+
+    def get_best_chain(self):
+        """Retrieves the index of the chain that visited the best position
+
+        Returns
+        -------
+        int
+            The index of the chain with the lowest best objective value
+
+        """
+        return int(np.argmin(self._best_objective_values))
+
+    def get_best_solution(self):
+        """Retrieves the best solution visited by any chain
+
+        Returns
+        -------
+        OptimizationSolution
+            An OptimizationSolution whose solution value is the best
+            position found, as a numpy array, and whose objective value
+            is the objective value at that position
+
+        """
+        best_chain = self.get_best_chain()
+        return OptimizationSolution(self._best_positions[best_chain].copy(),
+                                    float(self._best_objective_values[best_chain]))
+
+    def get_final_positions(self):
+        """Retrieves the position of each chain at the end of the algorithm
+
+        Returns
+        -------
+        numpy.ndarray
+            An array of shape (K, d) with the final position of each chain
+
+        """
+        return self._final_positions
+
+    def get_final_objective_values(self):
+        """Retrieves the objective value of each chain at the end of the algorithm
+
+        Returns
+        -------
+        numpy.ndarray
+            An array of length K with the final objective value of each chain
+
+        """
+        return self._final_objective_values
+
+    def get_best_positions(self):
+        """Retrieves the best position visited by each chain
+
+        Returns
+        -------
+        numpy.ndarray
+            An array of shape (K, d) with the best position of each chain
+
+        """
+        return self._best_positions
+
+    def get_best_objective_values(self):
+        """Retrieves the best objective value reached by each chain
+
+        Returns
+        -------
+        numpy.ndarray
+            An array of length K with the best objective value of each chain
+
+        """
+        return self._best_objective_values
+
+    def get_acceptance_rates(self):
+        """Retrieves the fraction of proposals accepted by each chain
+
+        Returns
+        -------
+        numpy.ndarray
+            An array of length K with the acceptance rate of each chain
+
+        """
+        if self._steps == 0:
+            return np.zeros(len(self._acceptance_counts))
+        return self._acceptance_counts / self._steps
+
+
+def himmelblau_multi_chain_solver(initial_positions, multiplicative_constant, iteration_size,
+                                  temp_params, seed=None):
+    """Runs a batch of independent simulated annealing chains to minimize
+    the himmelblau function
+
+    Parameters
+    ----------
+    initial_positions: numpy.ndarray
+        An array of shape (K, 2) with the initial x and y coordinates
+        of each of the K chains
+    multiplicative_constant: float
+        A sensitivity parameter used to move from one solution to another. A
+        smaller value indicates that the two solutions are separated by a
+        smaller distance
+    iteration_size: int
+        The number of iterations at each temperature
+    temp_params: TemperatureParams
+        The TemperatureParams object specifying the temperature parameters needed
+        for the simulated annealing algorithm
+    seed: int
+        An optional seed for the random number generator used by the chains
+
+    Returns
+    -------
+    MultiChainResult
+        A MultiChainResult object describing the outcome of every chain
+
+    """
+    iteration_size_function = lambda temperature: iteration_size
+    return run_multi_chain_annealing(temp_params, iteration_size_function, initial_positions,
+                                     himmelblau_batch, multiplicative_constant, seed)
+
+
+def run_multi_chain_annealing(temp_params, iteration_size, initial_positions,
+                              batch_objective_function, step_size, seed=None):
+    """Runs the simulated annealing algorithm on K independent chains
+    for a continuous optimization problem
+
+    At each step every chain proposes a neighbour by adding an adjustment
+    drawn uniformly from [-step_size, step_size] to each coordinate. All
+    proposals are scored with a single call to batch_objective_function
+    and accepted or rejected together using the Metropolis criterion
+
+    Parameters
+    ----------
+    temp_params: TemperatureParams
+        A TemperatureParams object for handling the temperature parameter
+        throughout the simulated annealing algorithm
+    iteration_size: function
+        A function to calculate the number of steps taken at each temperature.
+        The function accepts one parameter, a float specifying the current
+        temperature, and returns an integer
+    initial_positions: numpy.ndarray
+        An array of shape (K, d) with the initial position of each chain
+    batch_objective_function: function
+        A function that takes an array of shape (N, d) of solutions and
+        returns an array of length N with their objective values
+    step_size: float or numpy.ndarray
+        The largest adjustment made to a coordinate when proposing a
+        neighbour. An array of length d gives a step size per coordinate
+    seed: int or numpy.random.Generator
+        An optional seed, or generator, for the random numbers used by the chains
+
+    Returns
+    -------
+    MultiChainResult
+        A MultiChainResult object describing the outcome of every chain
+
+    """
+    rng = np.random.default_rng(seed)
+    positions = np.array(initial_positions, dtype=float)
+    objective_values = np.asarray(batch_objective_function(positions), dtype=float)
+    best_positions = positions.copy()
+    best_objective_values = objective_values.copy()
+    acceptance_counts = np.zeros(len(positions), dtype=int)
+    steps = 0
+    for _ in range(temp_params.get_number_of_temperatures()):
+        curr_temp = temp_params.get_current_temperature()
+        for _ in range(iteration_size(curr_temp)):
+            proposals = positions + rng.uniform(-step_size, step_size, size=positions.shape)
+            proposal_values = np.asarray(batch_objective_function(proposals), dtype=float)
+            accepted = metropolis_acceptance(
+                    objective_values, proposal_values, curr_temp, rng.random(len(positions)))
+            positions[accepted] = proposals[accepted]
+            objective_values[accepted] = proposal_values[accepted]
+            acceptance_counts += accepted
+            improved = objective_values < best_objective_values
+            best_positions[improved] = positions[improved]
+            best_objective_values[improved] = objective_values[improved]
+            steps += 1
+        temp_params.update_temperature()
+    return MultiChainResult(positions, objective_values, best_positions,
+                            best_objective_values, acceptance_counts, steps)
+
+
+def metropolis_acceptance(old_objective_values, new_objective_values, temperature, random_numbers):
+    """Decides which of a batch of candidate solutions should be accepted
+
+    A candidate is accepted if it has a better objective value or if
+    the value of the simulated annealing function is at least as large
+    as the corresponding random number
+
+    Parameters
+    ----------
+    old_objective_values: numpy.ndarray
+        The objective values of the current solutions
+    new_objective_values: numpy.ndarray
+        The objective values of the candidate solutions
+    temperature: float
+        The current temperature at that point in the algorithm
+    random_numbers: numpy.ndarray
+        Random numbers in the range [0, 1], one for each candidate
+
+    Returns
+    -------
+    numpy.ndarray
+        A boolean array indicating which candidates are accepted
+
+    """
+    deltas = new_objective_values - old_objective_values
+    accepted = deltas < 0
+    if temperature > 0:
+        uphill = ~accepted
+        accepted[uphill] = random_numbers[uphill] <= np.exp(-deltas[uphill] / temperature)
+    return accepted
@@ -0,0 +1,136 @@
+"""Runs independent restarts of the simulated annealing algorithm in parallel
+using a pool of worker processes. Each restart builds its own problem from
+a picklable problem specification and is seeded from its own child of a
+single seed sequence, so the results do not depend on which worker ran
+which restart
+
+"""
+
+import random
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import Manager
+import numpy as np
+from metaheuristics.simulated_annealing.annealing_result import AnnealingResult
+from metaheuristics.simulated_annealing.simulated_annealing_utils \
+    import AnnealingRun, make_iteration_size_function
+from metaheuristics.tools.random_buffer import RandomBuffer
+
+
+def run_parallel_restarts(problem_spec, temp_params, iteration_size, number_of_restarts,
+                          seed=None, max_workers=None, target_objective=None):
+    """Runs number_of_restarts independent restarts of the simulated
+    annealing algorithm across a pool of worker processes
+
+    Parameters
+    ----------
+    problem_spec: object
+        A picklable problem specification, such as a HimmelblauProblemSpec,
+        providing a build_problem method that takes a RandomBuffer and returns
+        an OptimizationProblem drawing its neighbours from that buffer,
+        and a convert_solution method used to report its solutions
+    temp_params: TemperatureParams
+        The TemperatureParams object specifying the temperature parameters
+        needed for the simulated annealing algorithm. Every restart receives
+        its own copy, so its temperature_updater must be picklable
+    iteration_size: int or function
+        The number of iterations at each temperature, or a picklable
+        iteration_size function such as an AdaptiveIterationSize object
+    number_of_restarts: int
+        The number of independent restarts to run
+    seed: int
+        An optional seed from which the seed of every restart is derived
+    max_workers: int
+        The number of worker processes. Defaults to the number of processors
+    target_objective: float
+        An optional objective value. Once a restart reaches an objective value
+        at most target_objective, restarts that have not started are cancelled
+        and running restarts stop at the end of their current temperature
+
+    Returns
+    -------
+    OptimizationSolution, list
+        The best solution found by any completed restart, and a list with
+        an AnnealingResult for each restart, in restart order. The entry for
+        a cancelled restart is None
+
+    """
+    seed_sequences = np.random.SeedSequence(seed).spawn(number_of_restarts)
+    results = [None for _ in range(number_of_restarts)]
+    manager = Manager() if target_objective is not None else None
+    stop_event = manager.Event() if manager is not None else None
+    try:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(run_restart, problem_spec, temp_params, iteration_size, seed_sequence,
+                                       target_objective, stop_event): idx
+                       for idx, seed_sequence in enumerate(seed_sequences)}
+            for future in as_completed(futures):
+                if future.cancelled():
+                    continue
+                result = future.result()
+                results[futures[future]] = result
+                if (target_objective is not None and
+                        result.get_best_solution().get_objective_value() <= target_objective):
+                    for pending_future in futures:
+                        pending_future.cancel()
+    finally:
+        if manager is not None:
+            manager.shutdown()
+    completed_results = [result for result in results if result is not None]
+    best_result = min(completed_results, key=lambda result: result.get_best_solution().get_objective_value())
+    return best_result.get_best_solution(), results
+
+
+def run_restart(problem_spec, temp_params, iteration_size, seed_sequence, target_objective=None, stop_event=None):
+    """Runs one restart of the simulated annealing algorithm
+
+    Parameters
+    ----------
+    problem_spec: object
+        A problem specification providing build_problem and convert_solution
+    temp_params: TemperatureParams
+        The TemperatureParams object specifying the temperature parameters
+        needed for the simulated annealing algorithm
+    iteration_size: int or function
+        The number of iterations at each temperature, or a picklable
+        iteration_size function such as an AdaptiveIterationSize object
+    seed_sequence: numpy.random.SeedSequence
+        The seed sequence used to seed the random number generators of this
+        restart. The restart draws its random numbers from a RandomBuffer
+        seeded with it, and the global random states are seeded as well for
+        problems that do not use the buffer
+    target_objective: float
+        An optional objective value. The restart stops at the end of the first
+        temperature by which its best objective value is at most target_objective
+    stop_event: multiprocessing.Event
+        An optional event shared between restarts. It is set when this restart
+        reaches target_objective, and the restart stops at the end of the
+        current temperature once it has been set by any restart
+
+    Returns
+    -------
+    AnnealingResult
+        An AnnealingResult with the final and best solutions of the restart
+        and the objective value held at the end of each temperature
+
+    """
+    numpy_seed, python_seed = seed_sequence.generate_state(2)
+    np.random.seed(numpy_seed)
+    random.seed(int(python_seed))
+    random_buffer = RandomBuffer(seed_sequence)
+    problem = problem_spec.build_problem(random_buffer)
+    iteration_size_function = make_iteration_size_function(iteration_size)
+    temperatures = []
+    objective_values = []
+    annealing_run = AnnealingRun(temp_params, iteration_size_function, problem, random_buffer=random_buffer)
+    for record in annealing_run:
+        temperatures.append(record.get_temperature())
+        objective_values.append(record.get_current_objective_value())
+        if target_objective is not None and record.get_best_objective_value() <= target_objective:
+            if stop_event is not None:
+                stop_event.set()
+            break
+        if stop_event is not None and stop_event.is_set():
+            break
+    final_solution = problem_spec.convert_solution(problem, problem.get_current_optimization_solution())
+    best_solution = problem_spec.convert_solution(problem, annealing_run.get_best_solution())
+    return AnnealingResult(final_solution, best_solution, temperatures, objective_values)
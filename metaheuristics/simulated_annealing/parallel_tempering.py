@@ -0,0 +1,489 @@
+"""Runs the parallel tempering algorithm, also known as replica exchange.
+Several replicas of a problem are annealed at once, each at a fixed
+temperature of a ladder, using the Metropolis steps of the simulated
+annealing algorithm. After every sweep of steps, replicas at neighbouring
+temperatures may exchange temperatures, so good solutions found at high
+temperatures move down the ladder to be refined, while solutions stuck in
+a local optimum at a low temperature move up the ladder to escape it.
+
+The replicas are split into groups, each held by a worker process for the
+whole run. Exchanging the temperatures of two replicas rather than their
+solutions means only temperatures and objective values are sent between
+processes. Every replica draws its random numbers from its own child of a
+single seed sequence and exchanges are decided in the main process, so the
+result does not depend on the number of workers
+
+"""
+
+from functools import partial
+from multiprocessing import Pipe, Process
+import traceback
+import numpy as np
+from metaheuristics.simulated_annealing.simulated_annealing_utils \
+    import run_annealing_move_step, run_annealing_step, should_change_solution
+from metaheuristics.tools.random_buffer import RandomBuffer
+
+# the number of seconds a worker is given to stop before it is terminated
+WORKER_STOP_TIMEOUT = 5.0
+
+
+class Replica:
+    """One replica of a problem in the parallel tempering algorithm
+
+    Attributes
+    ----------
+    problem: OptimizationProblem
+        The problem built for the replica
+    random_buffer: RandomBuffer
+        The RandomBuffer supplying the random numbers of the replica
+    best_solution: OptimizationSolution
+        The solution with the lowest objective value held by the replica
+
+    Parameters
+    ----------
+    problem_spec: object
+        A problem specification providing build_problem and convert_solution
+    seed_sequence: numpy.random.SeedSequence
+        The seed sequence of the random numbers of the replica
+
+    """
+    def __init__(self, problem_spec, seed_sequence):
+        self._random_buffer = RandomBuffer(seed_sequence)
+        self._problem = problem_spec.build_problem(self._random_buffer)
+        self._acceptance_function = partial(should_change_solution, random_buffer=self._random_buffer)
+        self._best_solution = self._problem.get_current_optimization_solution()
+
+    def get_problem(self):
+        """Retrieves the problem built for the replica
+
+        Returns
+        -------
+        OptimizationProblem
+            The problem annealed by the replica
+
+        """
+        return self._problem
+
+    def get_best_solution(self):
+        """Retrieves the best solution held by the replica
+
+        Returns
+        -------
+        OptimizationSolution
+            The solution with the lowest objective value held by the replica
+
+        """
+        return self._best_solution
+
+    def sweep(self, temperature, steps):
+        """Takes steps of the simulated annealing algorithm at a fixed temperature
+
+        Parameters
+        ----------
+        temperature: float
+            The temperature of the replica for the sweep
+        steps: int
+            The number of steps taken
+
+        Returns
+        -------
+        float
+            The objective value of the current solution after the sweep
+
+        Side Effect
+        -----------
+        Updates the current and best solutions of the replica
+
+        """
+        problem = self._problem
+        uses_moves = problem.supports_moves()
+        for _ in range(steps):
+            if uses_moves:
+                accepted = run_annealing_move_step(temperature, problem, self._acceptance_function)
+            else:
+                curr_solution = problem.get_current_optimization_solution()
+                new_solution = run_annealing_step(temperature, problem, self._acceptance_function)
+                accepted = new_solution is not curr_solution
+                if accepted:
+                    problem.accept_solution(new_solution)
+            if accepted and problem.get_current_objective_value() < self._best_solution.get_objective_value():
+                self._best_solution = problem.get_current_optimization_solution()
+        return problem.get_current_objective_value()
+
+
+class ReplicaGroup:
+    """A group of replicas held by one process
+
+    Attributes
+    ----------
+    problem_spec: object
+        The problem specification from which the replicas were built
+    replicas: list
+        The Replica objects of the group
+
+    Parameters
+    ----------
+    problem_spec: object
+        A problem specification providing build_problem and convert_solution
+    seed_sequences: list
+        A seed sequence for each replica of the group
+
+    """
+    def __init__(self, problem_spec, seed_sequences):
+        self._problem_spec = problem_spec
+        self._replicas = [Replica(problem_spec, seed_sequence) for seed_sequence in seed_sequences]
+
+    def sweep(self, temperatures, steps):
+        """Sweeps every replica of the group at its temperature
+
+        Parameters
+        ----------
+        temperatures: list
+            The temperature of each replica of the group
+        steps: int
+            The number of steps taken by each replica
+
+        Returns
+        -------
+        list
+            A two element tuple for each replica of the group, with the
+            objective values of its current and best solutions
+
+        """
+        return [(replica.sweep(temperature, steps), replica.get_best_solution().get_objective_value())
+                for replica, temperature in zip(self._replicas, temperatures)]
+
+    def get_best_solutions(self):
+        """Retrieves the best solution of each replica of the group
+
+        Returns
+        -------
+        list
+            The best solution of each replica, converted with the
+            convert_solution method of problem_spec
+
+        """
+        return [self._problem_spec.convert_solution(replica.get_problem(), replica.get_best_solution())
+                for replica in self._replicas]
+
+
+class ParallelTemperingResult:
+    """A container class for the outcome of the parallel tempering algorithm
+
+    Attributes
+    ----------
+    best_solution: OptimizationSolution
+        The solution with the lowest objective value found by any replica
+    replica_best_solutions: list
+        The best solution found by each replica
+    temperatures: numpy.ndarray
+        The ladder of temperatures, from the lowest to the highest
+    swap_acceptance_rates: numpy.ndarray
+        For each pair of neighbouring temperatures, the fraction of
+        attempted exchanges between them that were accepted
+    best_objective_values: list
+        The best objective value found by any replica after each sweep
+
+    """
+    def __init__(self, best_solution, replica_best_solutions, temperatures, swap_acceptance_rates,
+                 best_objective_values):
+        self._best_solution = best_solution
+        self._replica_best_solutions = replica_best_solutions
+        self._temperatures = temperatures
+        self._swap_acceptance_rates = swap_acceptance_rates
+        self._best_objective_values = best_objective_values
+
+    def get_best_solution(self):
+        """Retrieves the best solution found by any replica
+
+        Returns
+        -------
+        OptimizationSolution
+            The solution with the lowest objective value found
+
+        """
+        return self._best_solution
+
+    def get_replica_best_solutions(self):
+        """Retrieves the best solution found by each replica
+
+        Returns
+        -------
+        list
+            The best solution of each replica, in the order the replicas
+            were created
+
+        """
+        return self._replica_best_solutions
+
+    def get_temperatures(self):
+        """Retrieves the ladder of temperatures
+
+        Returns
+        -------
+        numpy.ndarray
+            The temperatures of the ladder, from the lowest to the highest
+
+        """
+        return self._temperatures
+
+    def get_swap_acceptance_rates(self):
+        """Retrieves the acceptance rate of exchanges between each pair of
+        neighbouring temperatures, which is used to tune the ladder
+
+        Returns
+        -------
+        numpy.ndarray
+            An array whose entry k is the fraction of exchanges accepted
+            between temperatures k and k + 1 of the ladder
+
+        """
+        return self._swap_acceptance_rates
+
+    def get_best_objective_values(self):
+        """Retrieves the best objective value found after each sweep
+
+        Returns
+        -------
+        list
+            The best objective value found by any replica after each sweep
+
+        """
+        return self._best_objective_values
+
+
+def should_swap_replicas(cold_objective_value, hot_objective_value, cold_temperature, hot_temperature,
+                         random_number):
+    """Decides whether replicas at neighbouring temperatures exchange temperatures
+
+    The exchange is accepted with probability
+    min(1, exp((1 / cold_temperature - 1 / hot_temperature) * (cold_objective_value - hot_objective_value))),
+    so it is always accepted if the replica at the higher temperature
+    holds the better solution
+
+    Parameters
+    ----------
+    cold_objective_value: float
+        The objective value of the replica at the lower temperature
+    hot_objective_value: float
+        The objective value of the replica at the higher temperature
+    cold_temperature: float
+        The lower of the two temperatures
+    hot_temperature: float
+        The higher of the two temperatures
+    random_number: float
+        A random number in the range [0, 1)
+
+    Returns
+    -------
+    bool
+        True if the replicas should exchange temperatures
+
+    """
+    exponent = (1 / cold_temperature - 1 / hot_temperature) * (cold_objective_value - hot_objective_value)
+    return exponent >= 0 or random_number < np.exp(exponent)
+
+
+def run_replica_group(connection, problem_spec, seed_sequences):
+    """Holds a ReplicaGroup in a worker process, running the commands
+    received on connection until told to stop
+
+    Parameters
+    ----------
+    connection: multiprocessing.connection.Connection
+        The end of a pipe on which commands are received and results sent
+    problem_spec: object
+        A problem specification providing build_problem and convert_solution
+    seed_sequences: list
+        A seed sequence for each replica of the group
+
+    Returns
+    -------
+    None
+
+    Side Effect
+    -----------
+    Sends each result on connection as a tuple ("result", value). If an
+    error is raised, sends ("error", error, formatted traceback) instead and
+    stops, so the error can be raised again in the main process
+
+    """
+    try:
+        replica_group = ReplicaGroup(problem_spec, seed_sequences)
+        while True:
+            command = connection.recv()
+            if command[0] == "sweep":
+                connection.send(("result", replica_group.sweep(command[1], command[2])))
+            elif command[0] == "best":
+                connection.send(("result", replica_group.get_best_solutions()))
+            else:
+                break
+    except Exception as error:
+        formatted_traceback = traceback.format_exc()
+        try:
+            connection.send(("error", error, formatted_traceback))
+        except Exception:
+            # the error cannot be pickled, so only its description is sent
+            connection.send(("error", RuntimeError(repr(error)), formatted_traceback))
+    finally:
+        connection.close()
+
+
+class _RemoteTraceback(Exception):
+    # shows the traceback of an error raised in a worker as the cause of the error
+    def __str__(self):
+        return "\n\"\"\"\n{0}\"\"\"".format(self.args[0])
+
+
+def receive_result(group):
+    """Receives the result of the last command sent to a group of replicas
+
+    Parameters
+    ----------
+    group: multiprocessing.connection.Connection
+        The end of the pipe to a worker running run_replica_group, or a
+        group of replicas run in the main process
+
+    Returns
+    -------
+    object
+        The result of the command
+
+    Raises
+    ------
+    Exception
+        The error raised by the group while running the command, with the
+        traceback from the worker as its cause
+
+    """
+    message = group.recv()
+    if message[0] == "error":
+        raise message[1] from _RemoteTraceback(message[2])
+    return message[1]
+
+
+class _LocalReplicaGroup:
+    # runs a ReplicaGroup in the main process behind the interface of a worker
+    def __init__(self, problem_spec, seed_sequences):
+        self._replica_group = ReplicaGroup(problem_spec, seed_sequences)
+        self._result = None
+
+    def send(self, command):
+        if command[0] == "sweep":
+            self._result = self._replica_group.sweep(command[1], command[2])
+        elif command[0] == "best":
+            self._result = self._replica_group.get_best_solutions()
+
+    def recv(self):
+        return "result", self._result
+
+
+def run_parallel_tempering(problem_spec, temperatures, steps_per_sweep, number_of_sweeps, seed=None,
+                           number_of_workers=None, target_objective=None):
+    """Runs the parallel tempering algorithm with one replica at each
+    temperature of a ladder
+
+    Parameters
+    ----------
+    problem_spec: object
+        A picklable problem specification, such as a QuadraticAssignmentProblemSpec,
+        from which every replica builds its problem
+    temperatures: list
+        The ladder of temperatures, which must be positive. One replica is
+        created for each temperature
+    steps_per_sweep: int
+        The number of steps each replica takes between exchanges
+    number_of_sweeps: int
+        The largest number of sweeps. After each sweep, exchanges are
+        attempted between alternately the even and the odd pairs of
+        neighbouring temperatures
+    seed: int
+        An optional seed from which the random numbers of every replica
+        and of the exchanges are derived
+    number_of_workers: int
+        The number of worker processes the replicas are spread over. If
+        None, every replica is run in the current process
+    target_objective: float
+        An optional objective value. The algorithm stops after the first
+        sweep at which any replica has reached it
+
+    Returns
+    -------
+    ParallelTemperingResult
+        A ParallelTemperingResult with the best solutions and the
+        acceptance rates of the exchanges
+
+    Raises
+    ------
+    ValueError
+        If any temperature is not positive
+
+    """
+    ladder = np.sort(np.asarray(temperatures, dtype=float))
+    if len(ladder) == 0 or ladder[0] <= 0:
+        raise ValueError("parallel tempering needs at least one temperature and every temperature must be positive")
+    number_of_replicas = len(ladder)
+    seed_sequences = np.random.SeedSequence(seed).spawn(number_of_replicas + 1)
+    exchange_generator = np.random.default_rng(seed_sequences[-1])
+    group_bounds = np.linspace(0, number_of_replicas, min(number_of_workers or 1, number_of_replicas) + 1).astype(int)
+    groups = []
+    processes = []
+    try:
+        for start, end in zip(group_bounds[:-1], group_bounds[1:]):
+            if number_of_workers is None:
+                groups.append(_LocalReplicaGroup(problem_spec, seed_sequences[start:end]))
+            else:
+                parent_connection, child_connection = Pipe()
+                process = Process(target=run_replica_group,
+                                  args=(child_connection, problem_spec, seed_sequences[start:end]), daemon=True)
+                process.start()
+                child_connection.close()
+                groups.append(parent_connection)
+                processes.append(process)
+        # replica_at_temperature[k] is the replica currently at temperature k of the ladder
+        replica_at_temperature = list(range(number_of_replicas))
+        temperature_of_replica = list(range(number_of_replicas))
+        swap_attempts = np.zeros(number_of_replicas - 1)
+        swap_acceptances = np.zeros(number_of_replicas - 1)
+        best_objective_values = []
+        for sweep in range(number_of_sweeps):
+            for group, start, end in zip(groups, group_bounds[:-1], group_bounds[1:]):
+                group.send(("sweep", [ladder[temperature_of_replica[replica]] for replica in range(start, end)],
+                            steps_per_sweep))
+            sweep_results = [sweep_result for group in groups for sweep_result in receive_result(group)]
+            objective_values = [current_value for current_value, _ in sweep_results]
+            for k in range(sweep % 2, number_of_replicas - 1, 2):
+                cold_replica = replica_at_temperature[k]
+                hot_replica = replica_at_temperature[k + 1]
+                swap_attempts[k] += 1
+                if should_swap_replicas(objective_values[cold_replica], objective_values[hot_replica],
+                                        ladder[k], ladder[k + 1], exchange_generator.random()):
+                    swap_acceptances[k] += 1
+                    replica_at_temperature[k], replica_at_temperature[k + 1] = hot_replica, cold_replica
+                    temperature_of_replica[cold_replica] = k + 1
+                    temperature_of_replica[hot_replica] = k
+            best_objective_values.append(min(best_value for _, best_value in sweep_results))
+            if target_objective is not None and best_objective_values[-1] <= target_objective:
+                break
+        for group in groups:
+            group.send(("best",))
+        replica_best_solutions = [solution for group in groups for solution in receive_result(group)]
+    finally:
+        if processes:
+            for group in groups:
+                try:
+                    group.send(("stop",))
+                except OSError:
+                    # the worker has already exited, so its end of the pipe is closed
+                    pass
+                group.close()
+        for process in processes:
+            process.join(WORKER_STOP_TIMEOUT)
+            if process.is_alive():
+                process.terminate()
+                process.join()
+    swap_acceptance_rates = np.divide(swap_acceptances, swap_attempts,
+                                      out=np.zeros_like(swap_acceptances), where=swap_attempts > 0)
+    best_solution = min(replica_best_solutions, key=lambda solution: solution.get_objective_value())
+    return ParallelTemperingResult(best_solution, replica_best_solutions, ladder, swap_acceptance_rates,
+                                   best_objective_values)
@@ -0,0 +1,70 @@
+"""Plotting helpers for the simulated annealing algorithm. This module imports
+matplotlib, so it is kept separate from the solvers and is only imported when
+a plot is requested
+
+"""
+
+import numpy as np
+from matplotlib import pyplot as plt
+
+
+def plot_annealing_result(annealing_result, problem_name):
+    """Uses matplotlib to plot the final objective value for each
+    temperature recorded in annealing_result
+
+    Parameters
+    ----------
+    annealing_result: AnnealingResult
+        The outcome of a run of the simulated annealing algorithm
+    problem_name: str
+        The name of the problem to which the simulated
+        annealing algorithm was applied
+
+    Returns
+    -------
+    None
+
+    Side Effect
+    -----------
+    Produces a plot of objective values versus temperatures
+
+    """
+    plot_final_objective_value_per_temperature(annealing_result.get_temperatures(),
+                                               annealing_result.get_objective_values(),
+                                               problem_name)
+
+
+def plot_final_objective_value_per_temperature(temperatures, objective_values, problem_name):
+    """Uses matplotlib to plot the final objective value for each
+    temperature used in the simulated annealing algorithm
+
+    Parameters
+    ----------
+    temperatures: list
+        The set of temperatures used in the algorithm
+    objective_values: list
+        The final objective value accepted by the simulated
+        annealing algorithm for each temperature
+    problem_name: str
+        The name of the problem to which the simulated
+        annuealing algorithm was applied
+
+    Returns
+    -------
+    None
+
+    Side Effect
+    -----------
+    Produces a plot of objective_values versus temperatures
+
+    """
+    max_temp = max(temperatures)
+    min_temp = min(temperatures)
+    plt.plot(temperatures, objective_values)
+    plt.title("Final Cost by Temperature for {} Problem".format(problem_name), fontsize=20, fontweight="bold")
+    plt.xlabel("Temperatures", fontsize=18, fontweight="bold")
+    plt.ylabel("Final Cost", fontsize=18, fontweight="bold")
+    plt.xlim(max_temp, min_temp)
+    plt.xticks(np.arange(min_temp, max_temp, 100), fontweight="bold")
+    plt.yticks(fontweight="bold")
+    plt.show()
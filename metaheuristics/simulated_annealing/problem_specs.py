@@ -0,0 +1,308 @@
+"""Problem specifications describe how to build an OptimizationProblem without
+holding one. Unlike the problems built inside the solvers, whose neighbour
+and objective functions are lambdas, a specification can be pickled and
+sent to a worker process, which then builds its own copy of the problem
+
+"""
+
+from functools import partial
+import numpy as np
+from metaheuristics.simulated_annealing.simulated_annealing_utils \
+    import pick_neighbour_for_himmelblau
+from metaheuristics.tools.continuous_problem import ContinuousProblem
+from metaheuristics.tools.functions import himmelblau, himmelblau_batch
+from metaheuristics.tools.optimization_problem import OptimizationProblem
+from metaheuristics.tools.optimization_solution import OptimizationSolution
+from metaheuristics.tools.qap_instance import QAPInstance
+from metaheuristics.tools.qaplib import load_qaplib
+from metaheuristics.tools.quadratic_assignment_problem \
+    import QuadraticAssignmentProblem
+
+
+class HimmelblauProblemSpec:
+    """A picklable specification of the problem of minimizing the
+    himmelblau function
+
+    Attributes
+    ----------
+    initial_x: float
+        The x coordinate of an initial solution to the himmelblau function
+    initial_y: float
+        The y coordinate of an initial solution to the himmelblau function
+    multiplicative_constant: float
+        A sensitivity parameter used to move from one solution to another. A
+        smaller value indicates that the two solutions are separated by a
+        smaller distance
+
+    """
+    def __init__(self, initial_x, initial_y, multiplicative_constant):
+        self._initial_x = initial_x
+        self._initial_y = initial_y
+        self._multiplicative_constant = multiplicative_constant
+
+    def build_problem(self, random_buffer=None):
+        """Builds the optimization problem described by the specification
+
+        Parameters
+        ----------
+        random_buffer: RandomBuffer
+            An optional RandomBuffer from which neighbours are drawn. If
+            omitted, the global random state is used
+
+        Returns
+        -------
+        OptimizationProblem
+            An OptimizationProblem for minimizing the himmelblau function
+
+        """
+        neighbour_finder = partial(pick_neighbour_for_himmelblau,
+                                   multiplicative_constant=self._multiplicative_constant,
+                                   random_buffer=random_buffer)
+        return OptimizationProblem((self._initial_x, self._initial_y), himmelblau, neighbour_finder, himmelblau_batch)
+
+    def convert_solution(self, problem, solution):
+        """Converts a solution of the built problem to the form reported to users
+
+        Parameters
+        ----------
+        problem: OptimizationProblem
+            The problem built by build_problem
+        solution: OptimizationSolution
+            A solution to problem
+
+        Returns
+        -------
+        OptimizationSolution
+            The solution, unchanged
+
+        """
+        return solution
+
+
+class QuadraticAssignmentProblemSpec:
+    """A picklable specification of a quadratic assignment problem
+
+    Attributes
+    ----------
+    qap_instance: QAPInstance
+        The instance of the quadratic assignment problem
+    initial_permutation: numpy.ndarray
+        An initial solution to the quadratic assignment problem, as an
+        array of facility indices
+
+    Parameters
+    ----------
+    flow_matrix: pandas.DataFrame
+        A square matrix, specifying the flows between facilities
+    dist_matrix: pandas.DataFrame
+        A square matrix, specifying the distances between the facilities
+    initial_facility_order: list
+        An initial solution to the quadratic assignment problem, that is
+        a list representing an ordering of the facilities
+
+    """
+    def __init__(self, flow_matrix, dist_matrix, initial_facility_order):
+        self._qap_instance = QAPInstance(flow_matrix, dist_matrix)
+        self._initial_permutation = self._qap_instance.encode(initial_facility_order)
+
+    def build_problem(self, random_buffer=None):
+        """Builds the optimization problem described by the specification
+
+        Parameters
+        ----------
+        random_buffer: RandomBuffer
+            An optional RandomBuffer from which neighbours are drawn. If
+            omitted, the global random state is used
+
+        Returns
+        -------
+        QuadraticAssignmentProblem
+            The quadratic assignment problem described by the specification
+
+        """
+        return QuadraticAssignmentProblem(self._qap_instance, self._initial_permutation.copy(), random_buffer)
+
+    def convert_solution(self, problem, solution):
+        """Converts a solution of the built problem to the form reported to users
+
+        Parameters
+        ----------
+        problem: QuadraticAssignmentProblem
+            The problem built by build_problem
+        solution: OptimizationSolution
+            A solution to problem, whose solution value is a permutation
+            of facility indices
+
+        Returns
+        -------
+        OptimizationSolution
+            The solution with its permutation replaced by the corresponding
+            ordering of facility labels
+
+        """
+        return OptimizationSolution(problem.get_facility_order(solution.get_solution_value()),
+                                    solution.get_objective_value())
+
+
+class QAPLIBProblemSpec:
+    """A picklable specification of a quadratic assignment problem read
+    from a QAPLIB file
+
+    Only the path of the file is pickled. Each worker process loads the
+    instance when building its problem, memory-mapping the binary cache
+    written by load_qaplib rather than parsing the text file again
+
+    Attributes
+    ----------
+    file_path: str
+        The path of the QAPLIB file
+    initial_permutation: numpy.ndarray
+        An initial solution to the quadratic assignment problem, as an array
+        of facility indices, or None to start from the identity permutation
+    cache_dir: str
+        An optional directory holding the binary cache of the instance
+    qap_instance: QAPInstance
+        The instance loaded by the last call to build_problem in this process
+
+    """
+    def __init__(self, file_path, initial_permutation=None, cache_dir=None):
+        self._file_path = file_path
+        self._initial_permutation = initial_permutation
+        self._cache_dir = cache_dir
+        self._qap_instance = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_qap_instance"] = None
+        return state
+
+    def get_qap_instance(self):
+        """Retrieves the instance described by the specification, loading
+        it on first use
+
+        Returns
+        -------
+        QAPInstance
+            The instance of the quadratic assignment problem, whose matrices
+            are memory-mapped from the binary cache
+
+        """
+        if self._qap_instance is None:
+            flow_matrix, dist_matrix = load_qaplib(self._file_path, self._cache_dir)
+            self._qap_instance = QAPInstance(flow_matrix, dist_matrix)
+        return self._qap_instance
+
+    def build_problem(self, random_buffer=None):
+        """Builds the optimization problem described by the specification
+
+        Parameters
+        ----------
+        random_buffer: RandomBuffer
+            An optional RandomBuffer from which neighbours are drawn. If
+            omitted, the global random state is used
+
+        Returns
+        -------
+        QuadraticAssignmentProblem
+            The quadratic assignment problem described by the specification
+
+        """
+        qap_instance = self.get_qap_instance()
+        initial_permutation = self._initial_permutation
+        if initial_permutation is None:
+            initial_permutation = np.arange(qap_instance.get_size())
+        return QuadraticAssignmentProblem(qap_instance, initial_permutation, random_buffer)
+
+    def convert_solution(self, problem, solution):
+        """Converts a solution of the built problem to the form reported to users
+
+        Parameters
+        ----------
+        problem: QuadraticAssignmentProblem
+            The problem built by build_problem
+        solution: OptimizationSolution
+            A solution to problem, whose solution value is a permutation
+            of facility indices
+
+        Returns
+        -------
+        OptimizationSolution
+            The solution with its permutation given as a list of the
+            facility indices 0 to n - 1
+
+        """
+        return OptimizationSolution(problem.get_facility_order(solution.get_solution_value()),
+                                    solution.get_objective_value())
+
+
+class ContinuousProblemSpec:
+    """A picklable specification of a box constrained continuous
+    optimization problem
+
+    Attributes
+    ----------
+    initial_solution: numpy.ndarray
+        An initial solution within the bounds
+    objective_function: function
+        A picklable function, such as a module level function, taking a
+        one dimensional array and returning its objective value
+    problem_options: dict
+        Further keyword arguments passed to ContinuousProblem, such as the
+        bounds, step_sizes and proposal
+
+    Parameters
+    ----------
+    initial_solution: numpy.ndarray
+        An initial solution within the bounds
+    objective_function: function
+        A picklable function taking a one dimensional array and returning
+        its objective value
+    lower_bounds: numpy.ndarray or float
+        The lower bound of each coordinate
+    upper_bounds: numpy.ndarray or float
+        The upper bound of each coordinate
+    **problem_options
+        Further keyword arguments passed to ContinuousProblem
+
+    """
+    def __init__(self, initial_solution, objective_function, lower_bounds, upper_bounds, **problem_options):
+        self._initial_solution = np.array(initial_solution, dtype=float)
+        self._objective_function = objective_function
+        self._problem_options = dict(problem_options, lower_bounds=lower_bounds, upper_bounds=upper_bounds)
+
+    def build_problem(self, random_buffer=None):
+        """Builds the optimization problem described by the specification
+
+        Parameters
+        ----------
+        random_buffer: RandomBuffer
+            An optional RandomBuffer from which the steps are drawn. If
+            omitted, an unseeded RandomBuffer is used
+
+        Returns
+        -------
+        ContinuousProblem
+            The continuous problem described by the specification, with its
+            own copy of the initial solution
+
+        """
+        return ContinuousProblem(self._initial_solution.copy(), self._objective_function,
+                                 random_buffer=random_buffer, **self._problem_options)
+
+    def convert_solution(self, problem, solution):
+        """Converts a solution of the built problem to the form reported to users
+
+        Parameters
+        ----------
+        problem: ContinuousProblem
+            The problem built by build_problem
+        solution: OptimizationSolution
+            A solution to problem
+
+        Returns
+        -------
+        OptimizationSolution
+            The solution, unchanged
+
+        """
+        return solution
@@ -1,13 +1,28 @@
 import numpy as np
-import pandas as pd
-from matplotlib import pyplot as plt
 from metaheuristics.simulated_annealing.temperature_params import TemperatureParams
 import random
-import copy
+import time
+from functools import partial
 from metaheuristics.tools.functions \
-    import quadratic_assignment_objective, himmelblau
+    import himmelblau, himmelblau_batch
 from metaheuristics.tools.optimization_problem \
     import OptimizationProblem
+from metaheuristics.tools.optimization_solution \
+    import OptimizationSolution
+from metaheuristics.simulated_annealing.adaptive_iteration_size \
+    import AdaptiveIterationSize
+from metaheuristics.simulated_annealing.annealing_result \
+    import AnnealingResult
+from metaheuristics.simulated_annealing.temperature_record \
+    import TemperatureRecord
+from metaheuristics.tools.qap_instance \
+    import QAPInstance
+from metaheuristics.tools.quadratic_assignment_problem \
+    import QuadraticAssignmentProblem
+from metaheuristics.tools.random_buffer \
+    import RandomBuffer
+from metaheuristics.tools.steepest_descent \
+    import run_steepest_descent
 
 
 def calculate_adjustment(additive_adjustment, multiplicative_adjustment, multiplicative_constant):
@@ -37,7 +52,7 @@ def calculate_adjustment(additive_adjustment, multiplicative_adjustment, multipl
     return sign * multiplicative_constant * multiplicative_adjustment
 
 
-def pick_neighbour_for_himmelblau(solution_tuple, multiplicative_constant):
+def pick_neighbour_for_himmelblau(solution_tuple, multiplicative_constant, random_buffer=None):
     """Picks a solution in the neighbourhood of solution_tuple for
     the himmelblau function
 
@@ -50,6 +65,9 @@ def pick_neighbour_for_himmelblau(solution_tuple, multiplicative_constant):
         A sensitivity parameter that determines the magnitude of the
         distance between solution_tuple and its neighbour. A smaller
         number implies a smaller distance between the two solutions
+    random_buffer: RandomBuffer
+        An optional RandomBuffer supplying the random numbers. If omitted,
+        the global numpy random state is used
 
     Returns
     -------
@@ -59,10 +77,11 @@ def pick_neighbour_for_himmelblau(solution_tuple, multiplicative_constant):
         solution_tuple
 
     """
-    x_additive_adjustment = np.random.rand()
-    x_multiplicative_adjustment = np.random.rand()
-    y_additive_adjustment = np.random.rand()
-    y_multiplicative_adjustment = np.random.rand()
+    random_number = np.random.rand if random_buffer is None else random_buffer.uniform
+    x_additive_adjustment = random_number()
+    x_multiplicative_adjustment = random_number()
+    y_additive_adjustment = random_number()
+    y_multiplicative_adjustment = random_number()
     return (solution_tuple[0] + calculate_adjustment(
             x_additive_adjustment, x_multiplicative_adjustment, multiplicative_constant),
             solution_tuple[1] + calculate_adjustment(
@@ -70,7 +89,7 @@ def pick_neighbour_for_himmelblau(solution_tuple, multiplicative_constant):
 
 
 
-def pick_neighbour_for_qap(solution):
+def pick_neighbour_for_qap(solution, random_buffer=None):
     """selects a neighbour of solution
 
     A neighbour is selected by swapping two randomly chosen elements
@@ -78,25 +97,53 @@ def pick_neighbour_for_qap(solution):
 
     Parameters
     ----------
-    solution: list
+    solution: list or numpy.ndarray
         A solution to the quadratic assignment problem, specifying an
         ordering of the facilities
+    random_buffer: RandomBuffer
+        An optional RandomBuffer supplying the random numbers. If omitted,
+        the global random state is used
 
     Returns
     -------
-    list
+    list or numpy.ndarray
         Another solution to the quadratic assignment problem, obtained
         by swapping two random facilities in the ordering given by solution
 
     """
-    a, b = random.sample(range(0, len(solution)), 2)
-    new_solution = copy.deepcopy(solution)
+    if random_buffer is None:
+        a, b = random.sample(range(0, len(solution)), 2)
+    else:
+        a, b = random_buffer.index_pair(len(solution))
+    new_solution = solution.copy()
     new_solution[a] = solution[b]
     new_solution[b] = solution[a]
     return new_solution
 
 
-def himmelblau_simulated_annealing_solver(initial_x, initial_y, multiplicative_constant, iteration_size, temp_params):
+def make_run_random_buffer(seed=None):
+    """Builds the RandomBuffer used by a run of a solver
+
+    Parameters
+    ----------
+    seed: int
+        An optional seed for the buffer. If omitted, the seed is drawn from
+        the global numpy random state
+
+    Returns
+    -------
+    RandomBuffer
+        A RandomBuffer from which the run draws its random numbers
+
+    """
+    if seed is None:
+        seed = int(np.random.randint(2 ** 32, dtype=np.int64))
+    return RandomBuffer(seed)
+
+
+def himmelblau_simulated_annealing_solver(initial_x, initial_y, multiplicative_constant, iteration_size, temp_params,
+                                          plot=False, termination_criteria=None, seed=None,
+                                          statistics=None, checkpointer=None):
     """Runs the simulated annealing algorithm to minimize the himmelblau
     function, starting from the initial solution initial_x and initial_y
 
@@ -110,64 +157,158 @@ def himmelblau_simulated_annealing_solver(initial_x, initial_y, multiplicative_c
         A sensitivity parameter used to move from one solution to another. A
         smaller value indicates that the two solutions are separated by a
         smaller distance
-    iteration_size: function
-        Determines the number of iterations at each temperature
+    iteration_size: int or function
+        Determines the number of iterations at each temperature. Either a
+        fixed number of iterations or an iteration_size function, such as
+        an AdaptiveIterationSize object
     temp_params: TemperatureParams
         The TemperatureParams object specifying the temperature parameters needed
         for the simulated annealing algorithm
+    plot: bool
+        If True, the final objective value for each temperature is plotted
+        using matplotlib, which is only imported in this case
+    termination_criteria: list
+        An optional list of termination criteria. The algorithm stops once
+        any of them is met, even if temperatures remain
+    seed: int
+        An optional seed for the random number generator of the run, which
+        makes the run reproducible. If omitted, the seed is drawn from the
+        global numpy random state, so seeding it beforehand also makes the
+        run reproducible
+    statistics: AnnealingStatistics
+        An optional AnnealingStatistics object in which per temperature
+        counters and phase times are collected
+    checkpointer: AnnealingCheckpointer
+        An optional AnnealingCheckpointer. The run resumes from its
+        checkpoint file if it exists and checkpoints are saved as it runs.
+        A resumed run must be given the same arguments, including seed
 
     Returns
     -------
-    OptimizationSolution
-        An OptimizationSolution object, representing the final solution found by
-        the simualated annealing algorithm
+    AnnealingResult
+        An AnnealingResult object, holding the final and best solutions found
+        by the simulated annealing algorithm and the objective value at the
+        end of each temperature
 
     """
-    neighbour_finder = lambda solution: pick_neighbour_for_himmelblau(solution, multiplicative_constant)
-    himmelblau_problem = OptimizationProblem((initial_x, initial_y), himmelblau, neighbour_finder)
-    iteration_size_function = lambda temperature: iteration_size
-    temperatures, solutions = run_simulated_annealing(temp_params, iteration_size_function, himmelblau_problem)
-    solution_vals = [solution.get_solution_value() for solution in solutions]
-    plot_final_objective_value_per_temperature(temperatures, solution_vals, "Himmelblau Minimization")
-    return solutions[-1]
-
-
-def quadratic_assignment_simulated_annealing_solver(flow_matrix, dist_matrix, initial_array, iteration_size, temp_params):
+    random_buffer = make_run_random_buffer(seed)
+    neighbour_finder = lambda solution: pick_neighbour_for_himmelblau(solution, multiplicative_constant, random_buffer)
+    himmelblau_problem = OptimizationProblem((initial_x, initial_y), himmelblau, neighbour_finder, himmelblau_batch)
+    iteration_size_function = make_iteration_size_function(iteration_size)
+    result = run_simulated_annealing_trace(
+            temp_params, iteration_size_function, himmelblau_problem, termination_criteria, random_buffer,
+            statistics, checkpointer)
+    if plot:
+        from metaheuristics.simulated_annealing.plotting import plot_annealing_result
+        plot_annealing_result(result, "Himmelblau Minimization")
+    return result
+
+
+def quadratic_assignment_simulated_annealing_solver(flow_matrix, dist_matrix, initial_array, iteration_size, temp_params,
+                                                    plot=False, termination_criteria=None, seed=None,
+                                                    statistics=None, checkpointer=None, polish=False):
     """Runs the simulated annealing algorithm for the quadratic assignment
     problem, starting from the initial solution given by initial_array
 
     Parameters
     ----------
-    flow_matrix: pandas.DataFrame
+    flow_matrix: pandas.DataFrame or numpy.ndarray
         A square matrix, specifying the flows between facilities
-    dist_matrix: pandas.DataFrame
-        A square matrix, specifying the distances between the facilities
+    dist_matrix: pandas.DataFrame or numpy.ndarray
+        A square matrix, specifying the distances between the facilities.
+        Arrays, such as the memory-mapped matrices returned by load_qaplib,
+        are used without copying and label the facilities 0 to n - 1
     inital_array: list
         An initial solution to the quadratic assignment problem, that is
         the list represents an ordering of the facilities
-    iteration_size: function
-        Determines the number of iterations at each temperature
+    iteration_size: int or function
+        Determines the number of iterations at each temperature. Either a
+        fixed number of iterations or an iteration_size function, such as
+        an AdaptiveIterationSize object
     temp_params: TemperatureParams
         The TemperatureParams object specifying the temperature parameters needed
         for the simulated annealing algorithm
+    plot: bool
+        If True, the final objective value for each temperature is plotted
+        using matplotlib, which is only imported in this case
+    termination_criteria: list
+        An optional list of termination criteria. The algorithm stops once
+        any of them is met, even if temperatures remain
+    seed: int
+        An optional seed for the random number generator of the run, which
+        makes the run reproducible. If omitted, the seed is drawn from the
+        global numpy random state, so seeding it beforehand also makes the
+        run reproducible
+    statistics: AnnealingStatistics
+        An optional AnnealingStatistics object in which per temperature
+        counters and phase times are collected
+    checkpointer: AnnealingCheckpointer
+        An optional AnnealingCheckpointer. The run resumes from its
+        checkpoint file if it exists and checkpoints are saved as it runs.
+        A resumed run must be given the same arguments, including seed
+    polish: bool
+        If True, the best solution found by the algorithm is polished with
+        a steepest descent over swaps, so that the best solution returned
+        is a local optimum
 
     Returns
     -------
-    OptimizationSolution
-        An OptimizationSolution object, representing the final solution found by
-        the simualated annealing algorithm
+    AnnealingResult
+        An AnnealingResult object, holding the final and best solutions found
+        by the simulated annealing algorithm and the objective value at the
+        end of each temperature. The solutions are given as orderings of
+        the facility labels
+
+    """
+    random_buffer = make_run_random_buffer(seed)
+    qap_instance = QAPInstance(flow_matrix, dist_matrix)
+    qap_problem = QuadraticAssignmentProblem(qap_instance, qap_instance.encode(initial_array), random_buffer)
+    iteration_size_function = make_iteration_size_function(iteration_size)
+    permutation_result = run_simulated_annealing_trace(
+            temp_params, iteration_size_function, qap_problem, termination_criteria, random_buffer, statistics,
+            checkpointer)
+    final_solution = permutation_result.get_final_solution()
+    best_solution = permutation_result.get_best_solution()
+    if polish:
+        polished_problem = QuadraticAssignmentProblem(qap_instance, best_solution.get_solution_value())
+        run_steepest_descent(polished_problem)
+        best_solution = polished_problem.get_current_optimization_solution()
+    result = AnnealingResult(
+            OptimizationSolution(qap_problem.get_facility_order(final_solution.get_solution_value()),
+                                 final_solution.get_objective_value()),
+            OptimizationSolution(qap_problem.get_facility_order(best_solution.get_solution_value()),
+                                 best_solution.get_objective_value()),
+            permutation_result.get_temperatures(), permutation_result.get_objective_values())
+    if plot:
+        from metaheuristics.simulated_annealing.plotting import plot_annealing_result
+        plot_annealing_result(result, "Quadratic Assignment Problem")
+    return result
+
+
+def make_iteration_size_function(iteration_size):
+    """Converts a fixed number of iterations to an iteration_size function
+
+    Parameters
+    ----------
+    iteration_size: int or function
+        Either the number of iterations at every temperature, or a
+        function of the temperature giving the number of iterations
+
+    Returns
+    -------
+    function
+        A function that accepts a temperature and returns the number of
+        iterations at that temperature. If iteration_size is already
+        callable it is returned unchanged
 
     """
-    qap_obj_function = lambda solution: quadratic_assignment_problem_objective(dist_matrix, flow_matrix, solution)
-    qap_problem = OptimizationProblem(initial_array, qap_obj_function, pick_neighbour_for_qap)
-    iteration_size_function = lambda temperature: iteration_size
-    temperatures, solutions = run_simulated_annealing(temp_params, iteration_size_function, qap_problem)
-    solution_vals = [solution.get_solution_value() for solution in solutions]
-    plot_final_objective_value_per_temperature(temperatures, solution_vals, "Quadratic Assignment Problem")
-    return solutions[-1]
+    if callable(iteration_size):
+        return iteration_size
+    return lambda temperature: iteration_size
 
 
-def run_simulated_annealing(temp_params, iteration_size, optimization_problem):
+def run_simulated_annealing(temp_params, iteration_size, optimization_problem, termination_criteria=None,
+                            random_buffer=None, statistics=None, checkpointer=None):
     """Runs the simulated annealing algorithm for a combinatorial problem
 
     Parameters
@@ -181,7 +322,21 @@ def run_simulated_annealing(temp_params, iteration_size, optimization_problem):
         temperature. It then returns an integer specifying the number of steps
         for the simulated annealing algorithm to take at that temperature
     optimization_problem: OptimizationProblem
-        The optimization problem being solved by the algorithm
+        The optimization problem being solved by the algorithm. If it
+        supports the move protocol, moves are applied to the current
+        solution in place instead of building every neighbour solution
+    termination_criteria: list
+        An optional list of termination criteria. The algorithm stops once
+        any of them is met, even if temperatures remain
+    random_buffer: RandomBuffer
+        An optional RandomBuffer supplying the random numbers used to accept
+        candidate solutions. If omitted, the global numpy random state is used
+    statistics: AnnealingStatistics
+        An optional AnnealingStatistics object in which per temperature
+        counters and phase times are collected
+    checkpointer: AnnealingCheckpointer
+        An optional AnnealingCheckpointer. The run resumes from its
+        checkpoint file if it exists and checkpoints are saved as it runs
 
     Returns
     -------
@@ -189,22 +344,472 @@ def run_simulated_annealing(temp_params, iteration_size, optimization_problem):
         Two lists of equal size. The first list contains floats of the
         temperatures used in the algorithm. The second list contains
         OptimizationSolution objects specifying the final solution
-        taken for each temperature
+        taken for each temperature. The best solution held at any point
+        is returned by run_simulated_annealing_trace
 
     """
-    temperatures = [None for _ in range(temp_params.get_number_of_temperatures())]
-    final_solution_per_temperature = [None for _ in range(temp_params.get_number_of_temperatures())]
-    for t in range(temp_params.get_number_of_temperatures()):
-        for step in range(iteration_size(t)):
-            new_solution = run_annealing_step(temp_params.get_current_temperature(), optimization_problem)
-            optimization_problem.update_current_solution(new_solution)
-        temperatures[t] = temp_params.get_current_temperature()
-        final_solution_per_temperature[t] = optimization_problem.get_current_solution()
-        temp_params.update_temperature()
+    temperatures = []
+    final_solution_per_temperature = []
+    annealing_run = AnnealingRun(
+            temp_params, iteration_size, optimization_problem, termination_criteria, random_buffer, statistics)
+    if checkpointer is not None:
+        restored, trace = checkpointer.restore(annealing_run)
+        if restored:
+            temperatures, final_solution_per_temperature = trace
+    for record in annealing_run:
+        temperatures.append(record.get_temperature())
+        final_solution_per_temperature.append(optimization_problem.get_current_optimization_solution())
+        if checkpointer is not None:
+            checkpointer.record(annealing_run, (temperatures, final_solution_per_temperature))
     return temperatures, final_solution_per_temperature
 
 
-def run_annealing_step(curr_temp, optimization_problem):
+def run_simulated_annealing_trace(temp_params, iteration_size, optimization_problem, termination_criteria=None,
+                                  random_buffer=None, statistics=None, checkpointer=None):
+    """Runs the simulated annealing algorithm keeping only the objective
+    value held at the end of each temperature, rather than every solution
+
+    Parameters
+    ----------
+    temp_params: TemperatureParams
+        A TemperatureParams object for handling the temperature parameter
+        throughout the simulated annealing algorithm
+    iteration_size: function
+        A function to calculate the number of steps taken at each temperature
+    optimization_problem: OptimizationProblem
+        The optimization problem being solved by the algorithm
+    termination_criteria: list
+        An optional list of termination criteria. The algorithm stops once
+        any of them is met, even if temperatures remain
+    random_buffer: RandomBuffer
+        An optional RandomBuffer supplying the random numbers used to accept
+        candidate solutions. If omitted, the global numpy random state is used
+    statistics: AnnealingStatistics
+        An optional AnnealingStatistics object in which per temperature
+        counters and phase times are collected
+    checkpointer: AnnealingCheckpointer
+        An optional AnnealingCheckpointer. The run resumes from its
+        checkpoint file if it exists and checkpoints are saved as it runs
+
+    Returns
+    -------
+    AnnealingResult
+        An AnnealingResult with the final and best solutions and the
+        objective value held at the end of each temperature
+
+    """
+    temperatures = []
+    objective_values = []
+    annealing_run = AnnealingRun(
+            temp_params, iteration_size, optimization_problem, termination_criteria, random_buffer, statistics)
+    if checkpointer is not None:
+        restored, trace = checkpointer.restore(annealing_run)
+        if restored:
+            temperatures, objective_values = trace
+    for record in annealing_run:
+        temperatures.append(record.get_temperature())
+        objective_values.append(record.get_current_objective_value())
+        if checkpointer is not None:
+            checkpointer.record(annealing_run, (temperatures, objective_values))
+    return AnnealingResult(optimization_problem.get_current_optimization_solution(),
+                           annealing_run.get_best_solution(), temperatures, objective_values)
+
+
+class AnnealingRun:
+    """An iterator running the simulated annealing algorithm one temperature
+    at a time
+
+    Each call to next runs every step at the current temperature, lowers
+    the temperature and returns a TemperatureRecord summarizing it. The
+    caller can therefore stream the records, stop the run early by no
+    longer iterating, or inspect the optimization problem between
+    temperatures
+
+    Attributes
+    ----------
+    temp_params: TemperatureParams
+        A TemperatureParams object for handling the temperature parameter
+        throughout the simulated annealing algorithm
+    iteration_size: function
+        A function to calculate the number of steps taken at each temperature
+    optimization_problem: OptimizationProblem
+        The optimization problem being solved by the algorithm
+    temperature_index: int
+        The number of temperatures completed so far
+    terminating_criterion: object
+        The termination criterion that stopped the run, if any
+    best_solution: OptimizationSolution
+        The solution with the lowest objective value held so far. It is
+        only replaced, and for problems using the move protocol copied,
+        when the current solution improves on it
+    random_buffer: RandomBuffer
+        The RandomBuffer supplying the random numbers of the run, or None
+    statistics: AnnealingStatistics
+        The object collecting statistics about the run, or None
+
+    Parameters
+    ----------
+    temp_params: TemperatureParams
+        A TemperatureParams object for handling the temperature parameter
+        throughout the simulated annealing algorithm
+    iteration_size: function
+        A function to calculate the number of steps taken at each temperature.
+        The function accepts one parameter, a float specifying the current
+        temperature, and returns an integer specifying the number of steps
+        for the simulated annealing algorithm to take. If it is an
+        AdaptiveIterationSize object, a temperature can also end early and
+        the outcome of every temperature is recorded with it
+    optimization_problem: OptimizationProblem
+        The optimization problem being solved by the algorithm. If it
+        supports the move protocol, moves are applied to the current
+        solution in place instead of building every neighbour solution
+    termination_criteria: list
+        An optional list of termination criteria, such as MinimumTemperature
+        or Stagnation objects. Each criterion is checked with the record of
+        every temperature and the run stops once any of them is met
+    random_buffer: RandomBuffer
+        An optional RandomBuffer supplying the random numbers used to accept
+        candidate solutions. If omitted, the global numpy random state is used.
+        For a run to be reproducible from one seed, optimization_problem
+        should draw its neighbours from the same buffer
+    statistics: AnnealingStatistics
+        An optional AnnealingStatistics object. If given, the counters and
+        phase times of every temperature are collected in it, at the cost
+        of timing every step. If omitted, no statistics are collected
+
+    """
+    def __init__(self, temp_params, iteration_size, optimization_problem, termination_criteria=None,
+                 random_buffer=None, statistics=None):
+        self._temp_params = temp_params
+        self._iteration_size = iteration_size
+        self._optimization_problem = optimization_problem
+        self._uses_moves = optimization_problem.supports_moves()
+        self._is_adaptive = isinstance(iteration_size, AdaptiveIterationSize)
+        self._temperature_index = 0
+        self._best_solution = optimization_problem.get_current_optimization_solution()
+        self._start_time = None
+        self._termination_criteria = termination_criteria if termination_criteria is not None else []
+        self._acceptance_function = None
+        if random_buffer is not None:
+            self._acceptance_function = partial(should_change_solution, random_buffer=random_buffer)
+        self._terminating_criterion = None
+        self._random_buffer = random_buffer
+        self._statistics = statistics
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        """Runs every step at the current temperature
+
+        Returns
+        -------
+        TemperatureRecord
+            A TemperatureRecord summarizing the temperature
+
+        Side Effect
+        -----------
+        Updates the current solution of the optimization problem and
+        moves temp_params to the next temperature
+
+        """
+        if self.is_finished():
+            raise StopIteration
+        if self._start_time is None:
+            self._start_time = time.perf_counter()
+        curr_temp = self._temp_params.get_current_temperature()
+        if self._statistics is None:
+            steps, acceptances = self._run_steps(curr_temp)
+        else:
+            temperature_statistics = self._statistics.start_temperature(self._temperature_index, curr_temp)
+            steps, acceptances = self._run_instrumented_steps(curr_temp, temperature_statistics)
+            self._statistics.end_temperature(temperature_statistics)
+        if self._is_adaptive:
+            self._iteration_size.record_temperature(curr_temp, steps, acceptances)
+        record = TemperatureRecord(
+                self._temperature_index, curr_temp, self._optimization_problem.get_current_objective_value(),
+                self._best_solution.get_objective_value(), acceptances, steps,
+                time.perf_counter() - self._start_time)
+        self._temperature_index += 1
+        self._temp_params.update_temperature()
+        for criterion in self._termination_criteria:
+            if criterion.should_terminate(record):
+                self._terminating_criterion = criterion
+                break
+        return record
+
+    def get_temperature_index(self):
+        """Retrieves the number of temperatures completed so far
+
+        Returns
+        -------
+        int
+            The number of temperatures completed so far
+
+        """
+        return self._temperature_index
+
+    def is_finished(self):
+        """Determines whether the run has finished
+
+        Returns
+        -------
+        bool
+            True if a termination criterion has been met or every
+            temperature has been used, otherwise False
+
+        """
+        return (self._terminating_criterion is not None or
+                self._temperature_index >= self._temp_params.get_number_of_temperatures())
+
+    def get_terminating_criterion(self):
+        """Retrieves the termination criterion that stopped the run
+
+        Returns
+        -------
+        object
+            The first termination criterion that was met, or None if the run
+            has not been stopped by a termination criterion
+
+        """
+        return self._terminating_criterion
+
+    def get_best_solution(self):
+        """Retrieves the best solution held so far in the run
+
+        Returns
+        -------
+        OptimizationSolution
+            The solution with the lowest objective value held so far
+
+        """
+        return self._best_solution
+
+    def get_best_objective_value(self):
+        """Retrieves the lowest objective value held so far in the run
+
+        Returns
+        -------
+        float
+            The lowest objective value of any solution held so far
+
+        """
+        return self._best_solution.get_objective_value()
+
+    def get_statistics(self):
+        """Retrieves the statistics collected during the run
+
+        Returns
+        -------
+        AnnealingStatistics
+            The AnnealingStatistics object collecting the statistics, or None
+            if statistics are not collected
+
+        """
+        return self._statistics
+
+    def get_state(self):
+        """Retrieves the state of the run between two temperatures, from
+        which an identical run can continue
+
+        Returns
+        -------
+        dict
+            A picklable dictionary holding the number of temperatures
+            completed, the current and best solutions, the state of the
+            optimization problem, the elapsed time,
+            the state of the random number generator of the run and the
+            states of the adaptive iteration size, termination criteria and
+            statistics. The global numpy and random states are only held
+            for a run without a RandomBuffer. A termination criterion
+            without a get_state method is assumed to track nothing
+
+        """
+        elapsed_time = 0.0 if self._start_time is None else time.perf_counter() - self._start_time
+        terminating_index = None
+        for idx, criterion in enumerate(self._termination_criteria):
+            if criterion is self._terminating_criterion:
+                terminating_index = idx
+        return {"temperature_index": self._temperature_index,
+                "current_solution": self._optimization_problem.get_current_optimization_solution(),
+                "problem_state": self._optimization_problem.get_state(),
+                "best_solution": self._best_solution,
+                "elapsed_time": elapsed_time,
+                "terminating_criterion_index": terminating_index,
+                "random_buffer": None if self._random_buffer is None else self._random_buffer.get_state(),
+                "numpy_random_state": np.random.get_state() if self._random_buffer is None else None,
+                "python_random_state": random.getstate() if self._random_buffer is None else None,
+                "iteration_size": self._iteration_size.get_state() if self._is_adaptive else None,
+                "termination_criteria": [get_criterion_state(criterion)
+                                         for criterion in self._termination_criteria],
+                "temperature_statistics": (None if self._statistics is None
+                                           else list(self._statistics.get_temperature_statistics()))}
+
+    def set_state(self, state):
+        """Restores a state retrieved by get_state, so the run continues
+        exactly as the run it was taken from would have
+
+        The run must not have started, and must have been built in the same
+        way as the run the state was taken from. The temperature parameters
+        are moved to the right temperature by applying update_temperature
+        once for every completed temperature
+
+        Parameters
+        ----------
+        state: dict
+            A dictionary returned by get_state
+
+        Returns
+        -------
+        None
+
+        Side Effect
+        -----------
+        Restores the current solution and state of the optimization
+        problem, the temperature, the random number generator of the run and every
+        counter of the run. The global numpy and random states are only
+        restored for a run without a RandomBuffer
+
+        Raises
+        ------
+        ValueError
+            If the run has already started
+
+        """
+        if self._start_time is not None or self._temperature_index != 0:
+            raise ValueError("a state can only be restored before the run starts")
+        for _ in range(state["temperature_index"]):
+            self._temp_params.update_temperature()
+        self._temperature_index = state["temperature_index"]
+        self._optimization_problem.accept_solution(state["current_solution"])
+        self._optimization_problem.set_state(state["problem_state"])
+        self._best_solution = state["best_solution"]
+        self._start_time = time.perf_counter() - state["elapsed_time"]
+        if state["random_buffer"] is not None and self._random_buffer is not None:
+            self._random_buffer.set_state(state["random_buffer"])
+        # the global random states are only used, and so only restored, by runs without a RandomBuffer
+        if self._random_buffer is None and state["numpy_random_state"] is not None:
+            np.random.set_state(state["numpy_random_state"])
+            random.setstate(state["python_random_state"])
+        if self._is_adaptive and state["iteration_size"] is not None:
+            self._iteration_size.set_state(state["iteration_size"])
+        for criterion, criterion_state in zip(self._termination_criteria, state["termination_criteria"]):
+            if criterion_state is not None:
+                criterion.set_state(criterion_state)
+        if state["terminating_criterion_index"] is not None:
+            self._terminating_criterion = self._termination_criteria[state["terminating_criterion_index"]]
+        if self._statistics is not None and state["temperature_statistics"] is not None:
+            self._statistics.get_temperature_statistics()[:] = state["temperature_statistics"]
+
+    def _run_steps(self, curr_temp):
+        steps = 0
+        acceptances = 0
+        for _ in range(self._iteration_size(curr_temp)):
+            steps += 1
+            if self._take_step(curr_temp):
+                acceptances += 1
+                if self._optimization_problem.get_current_objective_value() < self._best_solution.get_objective_value():
+                    self._best_solution = self._optimization_problem.get_current_optimization_solution()
+            if self._is_adaptive and self._iteration_size.should_end_temperature(steps, acceptances):
+                break
+        return steps, acceptances
+
+    def _run_instrumented_steps(self, curr_temp, temperature_statistics):
+        # the same steps as _run_steps, split into phases so each phase can be timed
+        problem = self._optimization_problem
+        acceptance_function = self._acceptance_function
+        if acceptance_function is None:
+            acceptance_function = should_change_solution
+        perf_counter = time.perf_counter
+        steps = 0
+        acceptances = 0
+        uphill_acceptances = 0
+        improvements = 0
+        neighbour_time = 0.0
+        evaluation_time = 0.0
+        acceptance_time = 0.0
+        bookkeeping_time = 0.0
+        for _ in range(self._iteration_size(curr_temp)):
+            steps += 1
+            step_start = perf_counter()
+            if self._uses_moves:
+                move = problem.propose_move()
+                proposed = perf_counter()
+                delta = problem.get_move_delta(move)
+                evaluated = perf_counter()
+                curr_objective_value = problem.get_current_objective_value()
+                new_objective_value = curr_objective_value + delta
+                accepted = acceptance_function(curr_objective_value, new_objective_value, curr_temp)
+                decided = perf_counter()
+                if accepted:
+                    problem.apply_move(move, delta)
+                else:
+                    problem.reject_move(move)
+            else:
+                curr_objective_value = problem.get_current_objective_value()
+                new_solution_value = problem.find_neighbour_solution_value()
+                proposed = perf_counter()
+                new_objective_value = problem.get_objective_function()(new_solution_value)
+                evaluated = perf_counter()
+                new_solution = OptimizationSolution(new_solution_value, new_objective_value)
+                accepted = acceptance_function(curr_objective_value, new_objective_value, curr_temp)
+                decided = perf_counter()
+                if accepted:
+                    problem.accept_solution(new_solution)
+            if accepted:
+                acceptances += 1
+                if new_objective_value > curr_objective_value:
+                    uphill_acceptances += 1
+                if problem.get_current_objective_value() < self._best_solution.get_objective_value():
+                    self._best_solution = problem.get_current_optimization_solution()
+                    improvements += 1
+            stop = self._is_adaptive and self._iteration_size.should_end_temperature(steps, acceptances)
+            step_end = perf_counter()
+            neighbour_time += proposed - step_start
+            evaluation_time += evaluated - proposed
+            acceptance_time += decided - evaluated
+            bookkeeping_time += step_end - decided
+            if stop:
+                break
+        temperature_statistics.record_steps(
+                steps, steps, acceptances, uphill_acceptances, improvements,
+                {"neighbour": neighbour_time, "evaluation": evaluation_time,
+                 "acceptance": acceptance_time, "bookkeeping": bookkeeping_time})
+        return steps, acceptances
+
+    def _take_step(self, curr_temp):
+        if self._uses_moves:
+            return run_annealing_move_step(curr_temp, self._optimization_problem, self._acceptance_function)
+        curr_solution = self._optimization_problem.get_current_optimization_solution()
+        new_solution = run_annealing_step(curr_temp, self._optimization_problem, self._acceptance_function)
+        # run_annealing_step returns the current solution itself when the candidate is rejected
+        if new_solution is curr_solution:
+            return False
+        self._optimization_problem.accept_solution(new_solution)
+        return True
+
+
+def get_criterion_state(criterion):
+    """Retrieves the state of a termination criterion for a checkpoint
+
+    Parameters
+    ----------
+    criterion: object
+        A termination criterion
+
+    Returns
+    -------
+    dict
+        The state returned by the get_state method of criterion, or None
+        if criterion has no get_state method and so is assumed to track
+        nothing
+
+    """
+    get_state = getattr(criterion, "get_state", None)
+    return None if get_state is None else get_state()
+
+
+def run_annealing_step(curr_temp, optimization_problem, acceptance_function=None):
     """Runs one step of the combinatorial version of the simulated
     annealing algorithm at the current temperature and solution
 
@@ -220,6 +825,9 @@ def run_annealing_step(curr_temp, optimization_problem):
         The current temperature at this step in the algorithm
     optimization_problem: OptimizationProblem
         The optimization problem being solved by simulated annealing
+    acceptance_function: function
+        An optional function with the same parameters as should_change_solution,
+        used in its place to decide whether the candidate solution is accepted
 
     Returns
     -------
@@ -227,13 +835,53 @@ def run_annealing_step(curr_temp, optimization_problem):
         The OptimizationSolution calculated in the current step
 
     """
-    curr_solution = optimization_problem.get_current_solution()
+    if acceptance_function is None:
+        acceptance_function = should_change_solution
+    curr_solution = optimization_problem.get_current_optimization_solution()
     new_solution = optimization_problem.find_neighbour_solution()
-    if should_change_solution(curr_solution.get_objective_value(), new_solution.get_objective_value(), curr_temp):
+    if acceptance_function(curr_solution.get_objective_value(), new_solution.get_objective_value(), curr_temp):
         return new_solution
     return curr_solution
 
 
+def run_annealing_move_step(curr_temp, optimization_problem, acceptance_function=None):
+    """Runs one step of the simulated annealing algorithm at the current
+    temperature using the move protocol of optimization_problem
+
+    A move is proposed and the change in objective value it causes is
+    calculated. The move is applied to the current solution in place if
+    should_change_solution accepts the resulting objective value, and
+    rejected otherwise, so no neighbour solution is built
+
+    Parameters
+    ----------
+    curr_temp: float
+        The current temperature at this step in the algorithm
+    optimization_problem: OptimizationProblem
+        The optimization problem being solved by simulated annealing,
+        which must support the move protocol
+    acceptance_function: function
+        An optional function with the same parameters as should_change_solution,
+        used in its place to decide whether the move is accepted
+
+    Returns
+    -------
+    bool
+        True if the proposed move was applied, otherwise False
+
+    """
+    if acceptance_function is None:
+        acceptance_function = should_change_solution
+    move = optimization_problem.propose_move()
+    delta = optimization_problem.get_move_delta(move)
+    curr_objective_value = optimization_problem.get_current_objective_value()
+    if acceptance_function(curr_objective_value, curr_objective_value + delta, curr_temp):
+        optimization_problem.apply_move(move, delta)
+        return True
+    optimization_problem.reject_move(move)
+    return False
+
+
 def simulated_annealing_function(old_objective_value, new_objective_value, temperature):
     """Calculates the value of the simulated annealing function
 
@@ -265,10 +913,11 @@ def simulated_annealing_function(old_objective_value, new_objective_value, tempe
     if temperature == 0:
         return 0
     exponent = (new_objective_value - old_objective_value) / temperature
-    return 1 / (np.exp(exponent))
+    # exp(-exponent) underflows to 0 for large deltas, where 1 / exp(exponent) overflows
+    return np.exp(-exponent)
 
 
-def should_change_solution(old_objective_value, new_objective_value, temperature):
+def should_change_solution(old_objective_value, new_objective_value, temperature, random_buffer=None):
     """Determines whether the candidate solution should be accepted
     instead of the current solution.
 
@@ -276,6 +925,13 @@ def should_change_solution(old_objective_value, new_objective_value, temperature
     value or if the value of the simulated annealing function is at
     least as large as a random number between 0 and 1
 
+    When random_buffer is given the same rule is applied without calling
+    exp. Since u <= exp(-delta / T) exactly when delta <= -T * log(u), the
+    increase in objective value is compared with T times an exponential
+    random number -log(u), which the buffer precomputes in batches. This
+    is a single comparison per step and is safe for any delta, including
+    at a temperature of 0 where worse solutions are never accepted
+
     Parameters
     ----------
     old_objective_value: float
@@ -289,6 +945,10 @@ def should_change_solution(old_objective_value, new_objective_value, temperature
         temperature decreases, causing the value of the simulated
         annealing function to decrease. This signifies a reduced
         willingness to accept worse solutions as the algorithm progresses
+    random_buffer: RandomBuffer
+        An optional RandomBuffer supplying the acceptance threshold. If
+        omitted, a random number is drawn from the global numpy random state
+        and compared with the value of the simulated annealing function
 
     Returns
     -------
@@ -302,42 +962,9 @@ def should_change_solution(old_objective_value, new_objective_value, temperature
     """
     if new_objective_value < old_objective_value:
         return True
+    if random_buffer is not None:
+        threshold = temperature * random_buffer.exponential()
+        return temperature > 0 and new_objective_value - old_objective_value <= threshold
     random_number = np.random.rand()
     annealing_value = simulated_annealing_function(old_objective_value, new_objective_value, temperature)
     return random_number <= annealing_value
-
-
-def plot_final_objective_value_per_temperature(temperatures, objective_values, problem_name):
-    """Uses matplotlib to plot the final objective value for each
-    temperature used in the simulated annealing algorithm
-
-    Parameters
-    ----------
-    temperatures: list
-        The set of temperatures used in the algorithm
-    objective_values: list
-        The final objective value accepted by the simulated
-        annealing algorithm for each temperature
-    problem_name: str
-        The name of the problem to which the simulated
-        annuealing algorithm was applied
-
-    Returns
-    -------
-    None
-
-    Side Effect
-    -----------
-    Produces a plot of objective_values versus temperatures
-
-    """
-    max_temp = max(temperatures)
-    min_temp = min(temperatures)
-    plt.plot(temperatures, objective_values)
-    plt.title("Final Cost by Temperature for {} Problem".format(problem_name), fontsize=20, fontweight="bold")
-    plt.xlabel("Temperatures", fontsize=18, fontweight="bold")
-    plt.ylabel("Final Cost", fontsize=18, fontweight="bold")
-    plt.xlim(max_temp, min_temp)
-    plt.xticks(np.arange(min_temp, max_temp, 100), fontweight="bold")
-    plt.yticks(fontweight="bold")
-    plt.show()
@@ -0,0 +1,163 @@
+"""Runs the simulated annealing algorithm with speculative evaluation of
+neighbours, for objective functions so expensive that the time spent
+evaluating them dwarfs everything else.
+
+Several neighbours of the current solution are generated and submitted to
+an evaluator at once, so their objective values are computed concurrently.
+They are then considered in the order they were generated, exactly as if
+they had been proposed one at a time. Every neighbour rejected was a
+neighbour of the current solution, so each decision is the same Metropolis
+decision a sequential run would make. Once a neighbour is accepted, the
+current solution changes and the remaining neighbours are discarded.
+
+At low temperatures, where almost every neighbour is rejected, nearly all
+evaluations are used and the throughput grows with the number of concurrent
+evaluations. At high temperatures more of them are discarded
+
+"""
+
+from metaheuristics.simulated_annealing.annealing_result import AnnealingResult
+from metaheuristics.simulated_annealing.simulated_annealing_utils \
+    import AnnealingRun, should_change_solution
+from metaheuristics.tools.optimization_solution import OptimizationSolution
+
+
+class SpeculativeAnnealingRun(AnnealingRun):
+    """An AnnealingRun evaluating several neighbours concurrently at each step
+
+    The run produces the same TemperatureRecord objects as an AnnealingRun,
+    where a step is one neighbour considered. Neighbours are generated with
+    find_neighbour_solution_value and evaluated by evaluator, so the
+    objective function of the optimization problem is only used to evaluate
+    its initial solution
+
+    Attributes
+    ----------
+    evaluator: object
+        An evaluator, such as an ExecutorEvaluator or AsyncioEvaluator,
+        providing a submit method that returns a future objective value
+    speculation: int
+        The number of neighbours evaluated concurrently
+    evaluations: int
+        The number of neighbours submitted to evaluator, including those
+        discarded after an earlier neighbour was accepted
+
+    Parameters
+    ----------
+    temp_params: TemperatureParams
+        A TemperatureParams object for handling the temperature parameter
+        throughout the simulated annealing algorithm
+    iteration_size: function
+        A function to calculate the number of steps taken at each temperature
+    optimization_problem: OptimizationProblem
+        The optimization problem being solved by the algorithm
+    evaluator: object
+        An evaluator providing a submit method that returns a future
+        objective value
+    speculation: int
+        The number of neighbours evaluated concurrently. A value of 1
+        reproduces the steps of an AnnealingRun
+    termination_criteria: list
+        An optional list of termination criteria
+    random_buffer: RandomBuffer
+        An optional RandomBuffer supplying the random numbers used to accept
+        candidate solutions
+
+    """
+    def __init__(self, temp_params, iteration_size, optimization_problem, evaluator, speculation=4,
+                 termination_criteria=None, random_buffer=None):
+        if speculation < 1:
+            raise ValueError("speculation must be at least 1")
+        super().__init__(temp_params, iteration_size, optimization_problem, termination_criteria, random_buffer)
+        self._evaluator = evaluator
+        self._speculation = speculation
+        self._evaluations = 0
+
+    def get_evaluations(self):
+        """Retrieves the number of neighbours submitted for evaluation
+
+        Returns
+        -------
+        int
+            The number of neighbours submitted, including those discarded
+
+        """
+        return self._evaluations
+
+    def _run_steps(self, curr_temp):
+        problem = self._optimization_problem
+        acceptance_function = self._acceptance_function
+        if acceptance_function is None:
+            acceptance_function = should_change_solution
+        max_steps = self._iteration_size(curr_temp)
+        steps = 0
+        acceptances = 0
+        while steps < max_steps:
+            curr_objective_value = problem.get_current_objective_value()
+            solution_values = [problem.find_neighbour_solution_value()
+                               for _ in range(min(self._speculation, max_steps - steps))]
+            futures = [self._evaluator.submit(solution_value) for solution_value in solution_values]
+            self._evaluations += len(futures)
+            ended = False
+            for position, (solution_value, future) in enumerate(zip(solution_values, futures)):
+                steps += 1
+                new_objective_value = future.result()
+                accepted = acceptance_function(curr_objective_value, new_objective_value, curr_temp)
+                if accepted:
+                    acceptances += 1
+                    problem.accept_solution(OptimizationSolution(solution_value, new_objective_value))
+                    if new_objective_value < self._best_solution.get_objective_value():
+                        self._best_solution = problem.get_current_optimization_solution()
+                ended = self._is_adaptive and self._iteration_size.should_end_temperature(steps, acceptances)
+                if accepted or ended:
+                    # the remaining neighbours belong to a solution that is no longer current
+                    for pending_future in futures[position + 1:]:
+                        pending_future.cancel()
+                    break
+            if ended:
+                break
+        return steps, acceptances
+
+
+def run_speculative_simulated_annealing(temp_params, iteration_size, optimization_problem, evaluator,
+                                        speculation=4, termination_criteria=None, random_buffer=None):
+    """Runs the simulated annealing algorithm evaluating several neighbours
+    concurrently, keeping the objective value held at the end of each temperature
+
+    Parameters
+    ----------
+    temp_params: TemperatureParams
+        A TemperatureParams object for handling the temperature parameter
+        throughout the simulated annealing algorithm
+    iteration_size: function
+        A function to calculate the number of steps taken at each temperature
+    optimization_problem: OptimizationProblem
+        The optimization problem being solved by the algorithm
+    evaluator: object
+        An evaluator, such as an ExecutorEvaluator or AsyncioEvaluator,
+        providing a submit method that returns a future objective value
+    speculation: int
+        The number of neighbours evaluated concurrently, which should be
+        about the number of evaluations the evaluator can run at once
+    termination_criteria: list
+        An optional list of termination criteria
+    random_buffer: RandomBuffer
+        An optional RandomBuffer supplying the random numbers used to accept
+        candidate solutions
+
+    Returns
+    -------
+    AnnealingResult
+        An AnnealingResult with the final and best solutions and the
+        objective value held at the end of each temperature
+
+    """
+    temperatures = []
+    objective_values = []
+    annealing_run = SpeculativeAnnealingRun(temp_params, iteration_size, optimization_problem, evaluator,
+                                            speculation, termination_criteria, random_buffer)
+    for record in annealing_run:
+        temperatures.append(record.get_temperature())
+        objective_values.append(record.get_current_objective_value())
+    return AnnealingResult(optimization_problem.get_current_optimization_solution(),
+                           annealing_run.get_best_solution(), temperatures, objective_values)
@@ -0,0 +1,117 @@
+"""The TemperatureRecord class acts as a container class for a summary of
+the simulated annealing algorithm at the end of one temperature. Records
+are produced one at a time while the algorithm runs, so they can be streamed
+to disk or monitored without keeping the state of the whole run in memory
+
+"""
+
+class TemperatureRecord:
+    """A container class summarizing one temperature of the simulated
+    annealing algorithm
+
+    Attributes
+    ----------
+    temperature_index: int
+        The position of the temperature in the run, starting from 0
+    temperature: float
+        The temperature at which the steps were taken
+    current_objective_value: float
+        The objective value of the current solution at the end of the temperature
+    best_objective_value: float
+        The best objective value reached so far in the run
+    acceptances: int
+        The number of candidate solutions accepted at the temperature
+    steps: int
+        The number of steps taken at the temperature
+    elapsed_time: float
+        The number of seconds since the run started
+
+    """
+    def __init__(self, temperature_index, temperature, current_objective_value, best_objective_value,
+                 acceptances, steps, elapsed_time):
+        self._temperature_index = temperature_index
+        self._temperature = temperature
+        self._current_objective_value = current_objective_value
+        self._best_objective_value = best_objective_value
+        self._acceptances = acceptances
+        self._steps = steps
+        self._elapsed_time = elapsed_time
+
+    def get_temperature_index(self):
+        """Retrieves the position of the temperature in the run
+
+        Returns
+        -------
+        int
+            The position of the temperature, starting from 0
+
+        """
+        return self._temperature_index
+
+    def get_temperature(self):
+        """Retrieves the temperature at which the steps were taken
+
+        Returns
+        -------
+        float
+            The temperature summarized by the record
+
+        """
+        return self._temperature
+
+    def get_current_objective_value(self):
+        """Retrieves the objective value held at the end of the temperature
+
+        Returns
+        -------
+        float
+            The objective value of the current solution at the end
+            of the temperature
+
+        """
+        return self._current_objective_value
+
+    def get_best_objective_value(self):
+        """Retrieves the best objective value reached so far in the run
+
+        Returns
+        -------
+        float
+            The lowest objective value of any accepted solution so far
+
+        """
+        return self._best_objective_value
+
+    def get_acceptances(self):
+        """Retrieves the number of candidate solutions accepted at the temperature
+
+        Returns
+        -------
+        int
+            The number of accepted candidate solutions
+
+        """
+        return self._acceptances
+
+    def get_steps(self):
+        """Retrieves the number of steps taken at the temperature
+
+        Returns
+        -------
+        int
+            The number of steps taken
+
+        """
+        return self._steps
+
+    def get_elapsed_time(self):
+        """Retrieves the time since the run started
+
+        Returns
+        -------
+        float
+            The number of seconds between the start of the run and the
+            end of the temperature
+
+        """
+        return self._elapsed_time
@@ -0,0 +1,270 @@
+"""A set of termination criteria for the simulated annealing algorithm. A
+criterion is checked against the TemperatureRecord produced at the end of
+every temperature, and the run stops once any criterion is met, rather than
+only after a fixed number of temperatures.
+
+Some criteria keep track of earlier records, so a criterion object should
+only be used for one run. Every criterion provides get_state and set_state,
+so that what it has tracked can be saved with a checkpoint and restored
+
+"""
+
+class MinimumTemperature:
+    """Terminates the algorithm once the temperature falls to a minimum
+
+    Attributes
+    ----------
+    min_temperature: float
+        The temperature at or below which the algorithm terminates
+
+    """
+    def __init__(self, min_temperature):
+        self._min_temperature = min_temperature
+
+    def should_terminate(self, record):
+        """Decides whether the algorithm should terminate
+
+        Parameters
+        ----------
+        record: TemperatureRecord
+            The record of the temperature that just ended
+
+        Returns
+        -------
+        bool
+            True if the temperature is at most min_temperature
+
+        """
+        return record.get_temperature() <= self._min_temperature
+
+    def get_state(self):
+        """Retrieves the state tracked during a run. The criterion does not
+        track earlier records, so the state is empty
+
+        Returns
+        -------
+        dict
+            An empty dictionary
+
+        """
+        return {}
+
+    def set_state(self, state):
+        """Restores a state retrieved by get_state, which is empty
+
+        Parameters
+        ----------
+        state: dict
+            A dictionary returned by get_state
+
+        Returns
+        -------
+        None
+
+        """
+        pass
+
+
+class Stagnation:
+    """Terminates the algorithm once the best objective value has not
+    improved over a number of consecutive temperatures
+
+    Attributes
+    ----------
+    levels: int
+        The number of consecutive temperatures without improvement after
+        which the algorithm terminates
+    tolerance: float
+        The amount by which the best objective value must decrease to
+        count as an improvement
+    best_objective_value: float
+        The best objective value when it last improved
+    levels_without_improvement: int
+        The number of consecutive temperatures without improvement
+
+    """
+    def __init__(self, levels, tolerance=0.0):
+        self._levels = levels
+        self._tolerance = tolerance
+        self._best_objective_value = None
+        self._levels_without_improvement = 0
+
+    def should_terminate(self, record):
+        """Decides whether the algorithm should terminate
+
+        Parameters
+        ----------
+        record: TemperatureRecord
+            The record of the temperature that just ended
+
+        Returns
+        -------
+        bool
+            True if the best objective value has not improved by more than
+            tolerance over the last levels temperatures
+
+        """
+        best_objective_value = record.get_best_objective_value()
+        if (self._best_objective_value is None or
+                best_objective_value < self._best_objective_value - self._tolerance):
+            self._best_objective_value = best_objective_value
+            self._levels_without_improvement = 0
+            return False
+        self._levels_without_improvement += 1
+        return self._levels_without_improvement >= self._levels
+
+    def get_state(self):
+        """Retrieves the state tracked during a run
+
+        Returns
+        -------
+        dict
+            A picklable dictionary holding best_objective_value and
+            levels_without_improvement
+
+        """
+        return {"best_objective_value": self._best_objective_value,
+                "levels_without_improvement": self._levels_without_improvement}
+
+    def set_state(self, state):
+        """Restores a state retrieved by get_state
+
+        Parameters
+        ----------
+        state: dict
+            A dictionary returned by get_state
+
+        Returns
+        -------
+        None
+
+        Side Effect
+        -----------
+        Resets best_objective_value and levels_without_improvement to the
+        values held in state
+
+        """
+        self._best_objective_value = state["best_objective_value"]
+        self._levels_without_improvement = state["levels_without_improvement"]
+
+
+class WallClockBudget:
+    """Terminates the algorithm once a time budget has been used. The
+    budget is checked at the end of each temperature
+
+    Attributes
+    ----------
+    seconds: float
+        The number of seconds the algorithm may run for
+
+    """
+    def __init__(self, seconds):
+        self._seconds = seconds
+
+    def should_terminate(self, record):
+        """Decides whether the algorithm should terminate
+
+        Parameters
+        ----------
+        record: TemperatureRecord
+            The record of the temperature that just ended
+
+        Returns
+        -------
+        bool
+            True if the run has lasted at least seconds
+
+        """
+        return record.get_elapsed_time() >= self._seconds
+
+    def get_state(self):
+        """Retrieves the state tracked during a run. The criterion does not
+        track earlier records, so the state is empty
+
+        Returns
+        -------
+        dict
+            An empty dictionary
+
+        """
+        return {}
+
+    def set_state(self, state):
+        """Restores a state retrieved by get_state, which is empty
+
+        Parameters
+        ----------
+        state: dict
+            A dictionary returned by get_state
+
+        Returns
+        -------
+        None
+
+        """
+        pass
+
+
+class EvaluationBudget:
+    """Terminates the algorithm once a number of objective evaluations has
+    been used. Every step evaluates one candidate solution, and the budget
+    is checked at the end of each temperature
+
+    Attributes
+    ----------
+    max_evaluations: int
+        The number of evaluations the algorithm may use
+    evaluations: int
+        The number of evaluations used so far
+
+    """
+    def __init__(self, max_evaluations):
+        self._max_evaluations = max_evaluations
+        self._evaluations = 0
+
+    def should_terminate(self, record):
+        """Decides whether the algorithm should terminate
+
+        Parameters
+        ----------
+        record: TemperatureRecord
+            The record of the temperature that just ended
+
+        Returns
+        -------
+        bool
+            True if at least max_evaluations evaluations have been used
+
+        """
+        self._evaluations += record.get_steps()
+        return self._evaluations >= self._max_evaluations
+
+    def get_state(self):
+        """Retrieves the state tracked during a run
+
+        Returns
+        -------
+        dict
+            A picklable dictionary holding the number of evaluations used
+
+        """
+        return {"evaluations": self._evaluations}
+
+    def set_state(self, state):
+        """Restores a state retrieved by get_state
+
+        Parameters
+        ----------
+        state: dict
+            A dictionary returned by get_state
+
+        Returns
+        -------
+        None
+
+        Side Effect
+        -----------
+        Resets the number of evaluations used to the value held in state
+
+        """
+        self._evaluations = state["evaluations"]
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+
+from metaheuristics.simulated_annealing.adaptive_iteration_size \
+    import AdaptiveIterationSize
+from metaheuristics.simulated_annealing.simulated_annealing_utils \
+    import AnnealingRun, make_iteration_size_function
+from metaheuristics.simulated_annealing.temperature_params \
+    import TemperatureParams
+from metaheuristics.tools.optimization_problem import OptimizationProblem
+from unittest.mock import patch, MagicMock
+
+
+def test_uses_base_steps_before_first_temperature():
+    iteration_size = AdaptiveIterationSize(50)
+    assert iteration_size(1000) == 50
+    assert iteration_size.get_last_acceptance_rate() is None
+
+
+def test_spends_more_steps_near_critical_temperature():
+    iteration_size = AdaptiveIterationSize(50, critical_acceptance_range=(0.2, 0.6), critical_multiplier=3)
+    iteration_size.record_temperature(500, 50, 20)
+    assert iteration_size.get_last_acceptance_rate() == 0.4
+    assert iteration_size(400) == 150
+    iteration_size.record_temperature(400, 150, 135)
+    assert iteration_size(300) == 50
+
+
+def test_restores_last_acceptance_rate():
+    iteration_size = AdaptiveIterationSize(50)
+    iteration_size.record_temperature(500, 50, 20)
+    restored_iteration_size = AdaptiveIterationSize(50)
+    restored_iteration_size.set_state(iteration_size.get_state())
+    assert restored_iteration_size.get_last_acceptance_rate() == 0.4
+
+
+def test_spends_fewer_steps_when_frozen():
+    iteration_size = AdaptiveIterationSize(50, min_steps=5, frozen_acceptance_rate=0.05)
+    iteration_size.record_temperature(1, 50, 1)
+    assert iteration_size(0.5) == 5
+    no_minimum = AdaptiveIterationSize(50, frozen_acceptance_rate=0.05)
+    no_minimum.record_temperature(1, 50, 1)
+    assert no_minimum(0.5) == 50
+
+
+def test_should_end_temperature_at_target_acceptances():
+    assert not AdaptiveIterationSize(50).should_end_temperature(49, 49)
+    iteration_size = AdaptiveIterationSize(50, target_acceptances=10)
+    assert not iteration_size.should_end_temperature(30, 9)
+    assert iteration_size.should_end_temperature(12, 10)
+
+
+def test_make_iteration_size_function():
+    assert make_iteration_size_function(7)(123.4) == 7
+    iteration_size = AdaptiveIterationSize(10)
+    assert make_iteration_size_function(iteration_size) is iteration_size
+
+
+def test_annealing_run_ends_temperature_early():
+    optimization_problem = OptimizationProblem(
+            0, lambda solution: -solution, lambda solution: solution + 1)
+    temp_params = TemperatureParams(100, 2, lambda temperature: temperature / 2)
+    iteration_size = AdaptiveIterationSize(20, target_acceptances=4)
+    with patch("metaheuristics.simulated_annealing.simulated_annealing_utils.should_change_solution",
+               side_effect=[False, True] * 20):
+        records = list(AnnealingRun(temp_params, iteration_size, optimization_problem))
+    assert [record.get_steps() for record in records] == [8, 8]
+    assert [record.get_acceptances() for record in records] == [4, 4]
+    assert iteration_size.get_last_acceptance_rate() == 0.5
+
+
+def test_annealing_run_passes_temperature_to_iteration_size():
+    optimization_problem = OptimizationProblem(0, lambda solution: solution, lambda solution: solution)
+    temp_params = TemperatureParams(100, 3, lambda temperature: temperature - 25)
+    mock_iteration_size = MagicMock(return_value=1)
+    list(AnnealingRun(temp_params, mock_iteration_size, optimization_problem))
+    assert [call[0][0] for call in mock_iteration_size.call_args_list] == [100, 75, 50]
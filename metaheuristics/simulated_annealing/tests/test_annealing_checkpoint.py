@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+
+import pickle
+import pytest
+import numpy as np
+from metaheuristics.simulated_annealing.adaptive_iteration_size import AdaptiveIterationSize
+from metaheuristics.simulated_annealing.annealing_checkpoint import AnnealingCheckpointer
+from metaheuristics.simulated_annealing.annealing_statistics import AnnealingStatistics
+from metaheuristics.simulated_annealing.simulated_annealing_utils \
+    import AnnealingRun, quadratic_assignment_simulated_annealing_solver
+from metaheuristics.simulated_annealing.temperature_params import TemperatureParams
+from metaheuristics.simulated_annealing.termination_criteria import Stagnation
+from metaheuristics.tools.qap_instance import QAPInstance
+from metaheuristics.tools.quadratic_assignment_problem import QuadraticAssignmentProblem
+from metaheuristics.tools.random_buffer import RandomBuffer
+
+
+class PreemptedError(Exception):
+    pass
+
+
+def make_temp_params():
+    return TemperatureParams(initial_temperature=100.0, temperature_changes=8,
+                             temperature_updater=lambda temperature: 0.7 * temperature)
+
+
+def make_qap_matrices():
+    generator = np.random.default_rng(6)
+    return generator.integers(0, 10, size=(8, 8)), generator.integers(0, 10, size=(8, 8))
+
+
+def make_run():
+    flow_matrix, dist_matrix = make_qap_matrices()
+    random_buffer = RandomBuffer(seed=12, buffer_size=16)
+    problem = QuadraticAssignmentProblem(QAPInstance(flow_matrix, dist_matrix), np.arange(8), random_buffer)
+    return AnnealingRun(make_temp_params(), AdaptiveIterationSize(15, target_acceptances=6),
+                        problem, [Stagnation(20)], random_buffer)
+
+
+def summarize(record):
+    return (record.get_temperature_index(), record.get_temperature(), record.get_current_objective_value(),
+            record.get_best_objective_value(), record.get_acceptances(), record.get_steps())
+
+
+def test_resumed_run_matches_uninterrupted_run():
+    expected_records = [summarize(record) for record in make_run()]
+    interrupted_run = make_run()
+    first_records = [summarize(next(interrupted_run)) for _ in range(3)]
+    state = pickle.loads(pickle.dumps(interrupted_run.get_state()))
+    resumed_run = make_run()
+    resumed_run.set_state(state)
+    assert resumed_run.get_temperature_index() == 3
+    assert first_records + [summarize(record) for record in resumed_run] == expected_records
+
+
+def test_restoring_a_buffered_run_leaves_global_random_state_alone():
+    annealing_run = make_run()
+    next(annealing_run)
+    state = annealing_run.get_state()
+    assert state["numpy_random_state"] is None
+    np.random.seed(3)
+    expected_number = np.random.rand()
+    np.random.seed(3)
+    make_run().set_state(state)
+    assert np.random.rand() == expected_number
+
+
+def test_cannot_restore_started_run():
+    annealing_run = make_run()
+    state = annealing_run.get_state()
+    next(annealing_run)
+    with pytest.raises(ValueError):
+        annealing_run.set_state(state)
+
+
+def test_solver_resumes_after_preemption(tmp_path):
+    flow_matrix, dist_matrix = make_qap_matrices()
+    expected_result = quadratic_assignment_simulated_annealing_solver(
+            flow_matrix, dist_matrix, list(range(8)), 20, make_temp_params(), seed=4)
+
+    def preempt(temperature_statistics):
+        if temperature_statistics.get_temperature_index() == 5:
+            raise PreemptedError()
+
+    checkpoint_path = str(tmp_path / "run.ckpt")
+    with pytest.raises(PreemptedError):
+        quadratic_assignment_simulated_annealing_solver(
+                flow_matrix, dist_matrix, list(range(8)), 20, make_temp_params(), seed=4,
+                statistics=AnnealingStatistics(preempt), checkpointer=AnnealingCheckpointer(checkpoint_path, 2))
+    with open(checkpoint_path, "rb") as checkpoint_file:
+        assert pickle.load(checkpoint_file)["state"]["temperature_index"] == 4
+    resumed_result = quadratic_assignment_simulated_annealing_solver(
+            flow_matrix, dist_matrix, list(range(8)), 20, make_temp_params(), seed=4,
+            checkpointer=AnnealingCheckpointer(checkpoint_path, 2))
+    assert resumed_result.get_temperatures() == expected_result.get_temperatures()
+    assert resumed_result.get_objective_values() == expected_result.get_objective_values()
+    assert resumed_result.get_best_solution().get_solution_value() == \
+        expected_result.get_best_solution().get_solution_value()
+
+
+def test_checkpointer_saves_at_interval_and_end(tmp_path):
+    checkpointer = AnnealingCheckpointer(str(tmp_path / "run.ckpt"), checkpoint_interval=3)
+    annealing_run = make_run()
+    saved = []
+    for _ in annealing_run:
+        saved.append(checkpointer.record(annealing_run))
+    assert saved == [False, False, True, False, False, True, False, True]
+
+
+def test_restore_without_checkpoint(tmp_path):
+    checkpointer = AnnealingCheckpointer(str(tmp_path / "missing.ckpt"))
+    assert checkpointer.restore(make_run()) == (False, None)
+
+
+def test_restore_incompatible_checkpoint(tmp_path):
+    checkpoint_path = tmp_path / "old.ckpt"
+    checkpoint_path.write_bytes(pickle.dumps({"version": 0}))
+    with pytest.raises(ValueError):
+        AnnealingCheckpointer(str(checkpoint_path)).restore(make_run())
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+import numpy as np
+from metaheuristics.simulated_annealing.simulated_annealing_utils \
+    import AnnealingRun
+from metaheuristics.simulated_annealing.temperature_params \
+    import TemperatureParams
+from metaheuristics.tools.optimization_problem import OptimizationProblem
+from metaheuristics.tools.qap_instance import QAPInstance
+from metaheuristics.tools.quadratic_assignment_problem import QuadraticAssignmentProblem
+from unittest.mock import patch, MagicMock
+
+
+def make_problem(objective_values):
+    mock_objective_function = MagicMock(side_effect=objective_values)
+    mock_updater = MagicMock(side_effect=lambda solution: solution + 1)
+    return OptimizationProblem(0, mock_objective_function, mock_updater)
+
+
+def test_yields_one_record_per_temperature():
+    optimization_problem = make_problem([10, 8, 9, 12, 6, 7])
+    temp_params = TemperatureParams(100, 2, lambda temperature: temperature / 2)
+    decisions = [True, False, True, True, False]
+    with patch("metaheuristics.simulated_annealing.simulated_annealing_utils.should_change_solution",
+               side_effect=decisions):
+        records = list(AnnealingRun(temp_params, lambda temperature: {100: 3, 50: 2}[temperature], optimization_problem))
+    assert [record.get_temperature_index() for record in records] == [0, 1]
+    assert [record.get_temperature() for record in records] == [100, 50]
+    assert [record.get_steps() for record in records] == [3, 2]
+    assert [record.get_acceptances() for record in records] == [2, 1]
+    assert [record.get_current_objective_value() for record in records] == [12, 6]
+    assert [record.get_best_objective_value() for record in records] == [8, 6]
+    assert records[0].get_elapsed_time() <= records[1].get_elapsed_time()
+    assert optimization_problem.get_current_solution() == 3
+
+
+def test_can_stop_early_and_continue():
+    optimization_problem = make_problem([5 - idx for idx in range(20)])
+    temp_params = TemperatureParams(0, 4, lambda temperature: temperature)
+    annealing_run = AnnealingRun(temp_params, lambda temperature: 2, optimization_problem)
+    first_record = next(annealing_run)
+    assert first_record.get_best_objective_value() == 3
+    assert annealing_run.get_temperature_index() == 1
+    remaining_records = list(annealing_run)
+    assert len(remaining_records) == 3
+    assert annealing_run.get_best_objective_value() == -3
+    with pytest.raises(StopIteration):
+        next(annealing_run)
+
+
+def test_keeps_best_solution_after_moving_away_from_it():
+    optimization_problem = make_problem([10, 4, 9, 12])
+    temp_params = TemperatureParams(100, 1, lambda temperature: temperature)
+    with patch("metaheuristics.simulated_annealing.simulated_annealing_utils.should_change_solution",
+               return_value=True):
+        annealing_run = AnnealingRun(temp_params, lambda temperature: 3, optimization_problem)
+        record = next(annealing_run)
+    best_solution = annealing_run.get_best_solution()
+    assert best_solution.get_solution_value() == 1
+    assert best_solution.get_objective_value() == 4
+    assert record.get_best_objective_value() == 4
+    assert optimization_problem.get_current_objective_value() == 12
+
+
+def test_best_solution_is_a_copy_for_in_place_moves():
+    flow_matrix = np.array([[0, 3, 1, 4], [3, 0, 2, 0], [1, 2, 0, 5], [4, 0, 5, 0]])
+    dist_matrix = np.array([[0, 1, 2, 3], [1, 0, 1, 2], [2, 1, 0, 1], [3, 2, 1, 0]])
+    qap_instance = QAPInstance(flow_matrix, dist_matrix)
+    qap_problem = QuadraticAssignmentProblem(qap_instance, np.array([3, 2, 1, 0]))
+    temp_params = TemperatureParams(1000, 5, lambda temperature: temperature)
+    annealing_run = AnnealingRun(temp_params, lambda temperature: 20, qap_problem)
+    list(annealing_run)
+    best_solution = annealing_run.get_best_solution()
+    assert best_solution.get_solution_value() is not qap_problem.get_current_solution()
+    assert best_solution.get_objective_value() == qap_instance.calculate_objective(
+            best_solution.get_solution_value())
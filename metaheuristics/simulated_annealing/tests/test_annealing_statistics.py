@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+from metaheuristics.simulated_annealing.annealing_statistics \
+    import AnnealingStatistics, TemperatureStatistics, PHASES
+from metaheuristics.simulated_annealing.simulated_annealing_utils \
+    import himmelblau_simulated_annealing_solver, quadratic_assignment_simulated_annealing_solver
+from metaheuristics.simulated_annealing.temperature_params \
+    import TemperatureParams
+from unittest.mock import MagicMock
+
+
+def make_temp_params():
+    return TemperatureParams(initial_temperature=100.0, temperature_changes=6,
+                             temperature_updater=lambda temperature: 0.5 * temperature)
+
+
+def make_qap_matrices():
+    generator = np.random.default_rng(4)
+    flow_matrix = generator.integers(0, 10, size=(7, 7))
+    dist_matrix = generator.integers(0, 10, size=(7, 7))
+    return flow_matrix, dist_matrix
+
+
+def test_temperature_statistics_record_steps():
+    temperature_statistics = TemperatureStatistics(2, 50.0)
+    temperature_statistics.record_steps(10, 10, 4, 1, 2, {"neighbour": 0.5, "evaluation": 0.25})
+    temperature_statistics.record_steps(5, 4, 1, 0, 0, {"neighbour": 0.5})
+    assert temperature_statistics.get_temperature_index() == 2
+    assert temperature_statistics.get_temperature() == 50.0
+    assert temperature_statistics.get_proposals() == 15
+    assert temperature_statistics.get_evaluations() == 14
+    assert temperature_statistics.get_acceptances() == 5
+    assert temperature_statistics.get_uphill_acceptances() == 1
+    assert temperature_statistics.get_improvements() == 2
+    assert temperature_statistics.get_phase_times() == {
+            "neighbour": 1.0, "evaluation": 0.25, "acceptance": 0.0, "bookkeeping": 0.0}
+
+
+def test_callback_is_called_periodically():
+    mock_callback = MagicMock()
+    statistics = AnnealingStatistics(mock_callback, callback_interval=2)
+    temperature_statistics = [statistics.start_temperature(idx, 10.0) for idx in range(5)]
+    for stats in temperature_statistics:
+        statistics.end_temperature(stats)
+    assert [call[0][0] for call in mock_callback.call_args_list] == \
+        [temperature_statistics[1], temperature_statistics[3]]
+    assert statistics.get_temperature_statistics() == temperature_statistics
+
+
+def test_statistics_of_qap_run():
+    flow_matrix, dist_matrix = make_qap_matrices()
+    statistics = AnnealingStatistics()
+    result = quadratic_assignment_simulated_annealing_solver(
+            flow_matrix, dist_matrix, list(range(7)), 20, make_temp_params(), seed=3, statistics=statistics)
+    temperature_statistics = statistics.get_temperature_statistics()
+    assert [stats.get_temperature() for stats in temperature_statistics] == result.get_temperatures()
+    totals = statistics.get_totals()
+    assert totals["proposals"] == totals["evaluations"] == 120
+    assert totals["uphill_acceptances"] <= totals["acceptances"]
+    assert totals["improvements"] >= 1
+    assert set(statistics.get_phase_times()) == set(PHASES)
+    assert statistics.get_phase_times()["evaluation"] > 0
+
+
+def test_statistics_do_not_change_qap_run():
+    flow_matrix, dist_matrix = make_qap_matrices()
+    plain_result = quadratic_assignment_simulated_annealing_solver(
+            flow_matrix, dist_matrix, list(range(7)), 20, make_temp_params(), seed=9)
+    instrumented_result = quadratic_assignment_simulated_annealing_solver(
+            flow_matrix, dist_matrix, list(range(7)), 20, make_temp_params(), seed=9,
+            statistics=AnnealingStatistics())
+    assert plain_result.get_objective_values() == instrumented_result.get_objective_values()
+    assert plain_result.get_best_solution().get_solution_value() == \
+        instrumented_result.get_best_solution().get_solution_value()
+
+
+def test_statistics_do_not_change_himmelblau_run():
+    plain_result = himmelblau_simulated_annealing_solver(2, 1, 0.1, 10, make_temp_params(), seed=5)
+    statistics = AnnealingStatistics()
+    instrumented_result = himmelblau_simulated_annealing_solver(
+            2, 1, 0.1, 10, make_temp_params(), seed=5, statistics=statistics)
+    assert plain_result.get_objective_values() == instrumented_result.get_objective_values()
+    assert statistics.get_totals()["proposals"] == 60
+    assert statistics.get_phase_times()["evaluation"] > 0
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+from metaheuristics.simulated_annealing.benchmarks.baseline_comparison \
+    import compare_with_baseline, load_results, merge_results, save_results
+from metaheuristics.simulated_annealing.benchmarks.benchmark_suite \
+    import BenchmarkCase, random_qap_spec, run_benchmark, run_benchmarks
+from metaheuristics.simulated_annealing.cooling_schedules import geometric_schedule
+from metaheuristics.simulated_annealing.problem_specs import HimmelblauProblemSpec
+
+
+def make_baseline_metrics():
+    return {"relative_steps_per_second": 1000.0, "relative_evaluations_per_second": 2000.0,
+            "relative_time_to_target": 1.0, "peak_memory_bytes": 500}
+
+
+def test_run_benchmark_reports_every_metric():
+    case = BenchmarkCase("himmelblau", HimmelblauProblemSpec(2, 1, 0.1),
+                         geometric_schedule(100.0, 0.8, 5), 10, target_objective=1e6)
+    metrics = run_benchmark(case, repeats=2, number_of_evaluations=20)
+    assert metrics["steps"] == 50
+    assert metrics["steps_per_second"] > 0
+    assert metrics["evaluations_per_second"] > 0
+    assert metrics["time_to_target"] is not None
+    assert metrics["peak_memory_bytes"] > 0
+
+
+def test_run_benchmark_is_deterministic_for_a_seed():
+    case = BenchmarkCase("qap", random_qap_spec(6, seed=1), geometric_schedule(100.0, 0.8, 5), 10)
+    first_metrics = run_benchmark(case, repeats=1, number_of_evaluations=5)
+    second_metrics = run_benchmark(case, repeats=1, number_of_evaluations=5)
+    assert first_metrics["time_to_target"] is None
+    assert first_metrics["best_objective_value"] == second_metrics["best_objective_value"]
+
+
+def test_run_benchmarks_reports_relative_metrics():
+    cases = [BenchmarkCase("himmelblau", HimmelblauProblemSpec(2, 1, 0.1),
+                           geometric_schedule(100.0, 0.8, 5), 10, target_objective=1e6),
+             BenchmarkCase("qap", random_qap_spec(6, seed=1), geometric_schedule(100.0, 0.8, 5), 10,
+                           calibration="numpy")]
+    results = run_benchmarks(cases, repeats=1, number_of_evaluations=20)
+    for metrics in results.values():
+        assert metrics["relative_steps_per_second"] > 0
+        assert metrics["relative_evaluations_per_second"] > 0
+    assert results["himmelblau"]["relative_time_to_target"] is not None
+    assert results["qap"]["relative_time_to_target"] is None
+
+
+def test_unknown_calibration():
+    with pytest.raises(ValueError):
+        BenchmarkCase("qap", random_qap_spec(6, seed=1), geometric_schedule(100.0, 0.8, 5), 10,
+                      calibration="fortran")
+
+
+def test_merge_results_takes_the_median():
+    results_list = [{"qap": {"relative_steps_per_second": value, "relative_time_to_target": time_to_target}}
+                    for value, time_to_target in [(3.0, 1.0), (1.0, None), (2.0, 2.0)]]
+    assert merge_results(results_list) == {"qap": {"relative_steps_per_second": 2.0,
+                                                   "relative_time_to_target": None}}
+
+
+def test_save_and_load_results(tmp_path):
+    results = {"qap": make_baseline_metrics()}
+    file_path = str(tmp_path / "results.json")
+    save_results(results, file_path)
+    assert load_results(file_path) == results
+
+
+def test_compare_within_tolerance():
+    results = {"qap": {"relative_steps_per_second": 850.0, "relative_evaluations_per_second": 2500.0,
+                       "relative_time_to_target": 1.1, "peak_memory_bytes": 450}}
+    assert compare_with_baseline(results, {"qap": make_baseline_metrics()}, tolerance=0.2) == []
+
+
+def test_compare_flags_regressions():
+    results = {"qap": {"relative_steps_per_second": 700.0, "relative_evaluations_per_second": 2000.0,
+                       "relative_time_to_target": None, "peak_memory_bytes": 800}}
+    regressions = compare_with_baseline(results, {"qap": make_baseline_metrics()}, tolerance=0.2)
+    assert [regression["metric"] for regression in regressions] == \
+        ["relative_steps_per_second", "relative_time_to_target", "peak_memory_bytes"]
+    assert regressions[0] == {"benchmark": "qap", "metric": "relative_steps_per_second",
+                              "baseline": 1000.0, "result": 700.0}
+
+
+def test_compare_skips_unmatched_benchmarks():
+    results = {"new": make_baseline_metrics()}
+    assert compare_with_baseline(results, {"qap": make_baseline_metrics()}) == []
+
+
+def test_compare_uses_the_tolerance_of_each_metric():
+    results = {"qap": {"relative_steps_per_second": 700.0, "relative_evaluations_per_second": 2000.0,
+                       "relative_time_to_target": 1.4, "peak_memory_bytes": 600}}
+    regressions = compare_with_baseline(results, {"qap": make_baseline_metrics()})
+    assert [regression["metric"] for regression in regressions] == ["peak_memory_bytes"]
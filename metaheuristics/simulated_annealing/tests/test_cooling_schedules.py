@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+
+import pickle
+import numpy as np
+from metaheuristics.simulated_annealing.cooling_schedules \
+    import geometric_schedule, linear_schedule, logarithmic_schedule, \
+    lundy_mees_schedule, cyclic_schedule, ScheduledTemperatureParams
+
+
+def test_geometric_schedule():
+    assert np.allclose(geometric_schedule(1000, 0.5, 4), [1000, 500, 250, 125])
+
+
+def test_linear_schedule():
+    assert np.allclose(linear_schedule(100, 10, 4), [100, 70, 40, 10])
+
+
+def test_logarithmic_schedule():
+    temperatures = logarithmic_schedule(200, 3)
+    assert np.allclose(temperatures, [200, 200 * np.log(2) / np.log(3), 100])
+
+
+def test_lundy_mees_schedule_matches_recursive_update():
+    temperatures = lundy_mees_schedule(500, 0.001, 6)
+    temperature = 500
+    for expected in temperatures:
+        assert np.isclose(temperature, expected)
+        temperature = temperature / (1 + 0.001 * temperature)
+
+
+def test_cyclic_schedule():
+    temperatures = cyclic_schedule(np.array([8, 4, 2]), 3, reheat_factor=0.5)
+    assert np.allclose(temperatures, [8, 4, 2, 4, 2, 1, 2, 1, 0.5])
+
+
+def test_scheduled_temperature_params():
+    temp_params = ScheduledTemperatureParams(geometric_schedule(100, 0.9, 3))
+    assert temp_params.get_initial_temperature() == 100
+    assert temp_params.get_number_of_temperatures() == 3
+    seen_temperatures = [temp_params.get_current_temperature()]
+    for _ in range(3):
+        temp_params.update_temperature()
+        seen_temperatures.append(temp_params.get_current_temperature())
+    assert np.allclose(seen_temperatures, [100, 90, 81, 81])
+
+
+def test_scheduled_temperature_params_can_be_pickled():
+    temp_params = ScheduledTemperatureParams(linear_schedule(10, 1, 10))
+    temp_params.update_temperature()
+    copied_params = pickle.loads(pickle.dumps(temp_params))
+    assert copied_params.get_current_temperature() == 9
+    copied_params.update_temperature()
+    assert copied_params.get_current_temperature() == 8
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+
+import subprocess
+import sys
+import numpy as np
+import pandas as pd
+from metaheuristics.simulated_annealing.annealing_result import AnnealingResult
+from metaheuristics.simulated_annealing.simulated_annealing_utils \
+    import himmelblau_simulated_annealing_solver, quadratic_assignment_simulated_annealing_solver
+from metaheuristics.simulated_annealing.temperature_params \
+    import TemperatureParams
+from unittest.mock import patch
+
+
+def make_temp_params():
+    return TemperatureParams(initial_temperature=100.0, temperature_changes=10,
+                             temperature_updater=lambda temperature: 0.8 * temperature)
+
+
+def test_importing_solvers_does_not_import_plotting_libraries():
+    code = ("import sys\n"
+            "import metaheuristics.simulated_annealing.simulated_annealing_utils\n"
+            "print('matplotlib' in sys.modules, 'pandas' in sys.modules)")
+    output = subprocess.check_output([sys.executable, "-c", code], universal_newlines=True)
+    assert output.split() == ["False", "False"]
+
+
+def test_himmelblau_solver_returns_trace_without_plotting():
+    with patch("metaheuristics.simulated_annealing.plotting.plot_annealing_result") as mock_plot:
+        result = himmelblau_simulated_annealing_solver(2, 1, 0.1, 5, make_temp_params())
+    mock_plot.assert_not_called()
+    assert isinstance(result, AnnealingResult)
+    assert len(result.get_temperatures()) == 10
+    assert result.get_objective_values()[-1] == result.get_final_solution().get_objective_value()
+
+
+def test_qap_solver_plots_only_when_requested():
+    facilities = ["A", "B", "C"]
+    flow_matrix = pd.DataFrame([[0, 3, 1], [3, 0, 2], [1, 2, 0]], columns=facilities, index=facilities)
+    dist_matrix = pd.DataFrame([[0, 1, 2], [1, 0, 1], [2, 1, 0]], columns=facilities, index=facilities)
+    with patch("metaheuristics.simulated_annealing.plotting.plot_annealing_result") as mock_plot:
+        result = quadratic_assignment_simulated_annealing_solver(
+                flow_matrix, dist_matrix, ["C", "A", "B"], 5, make_temp_params(), plot=True)
+    mock_plot.assert_called_once_with(result, "Quadratic Assignment Problem")
+    assert sorted(result.get_final_solution().get_solution_value()) == facilities
+
+
+def test_himmelblau_solver_is_reproducible_from_seed():
+    first_result = himmelblau_simulated_annealing_solver(2, 1, 0.1, 5, make_temp_params(), seed=42)
+    second_result = himmelblau_simulated_annealing_solver(2, 1, 0.1, 5, make_temp_params(), seed=42)
+    assert first_result.get_objective_values() == second_result.get_objective_values()
+    assert first_result.get_best_solution().get_solution_value() == \
+        second_result.get_best_solution().get_solution_value()
+
+
+def test_himmelblau_solver_without_seed_uses_global_random_state():
+    results = []
+    for _ in range(2):
+        np.random.seed(21)
+        results.append(himmelblau_simulated_annealing_solver(2, 1, 0.1, 5, make_temp_params()))
+    assert results[0].get_objective_values() == results[1].get_objective_values()
+
+
+def test_himmelblau_solver_without_seed_draws_a_buffer_seed_from_global_state():
+    np.random.seed(21)
+    seed = int(np.random.randint(2 ** 32, dtype=np.int64))
+    seeded_result = himmelblau_simulated_annealing_solver(2, 1, 0.1, 5, make_temp_params(), seed=seed)
+    np.random.seed(21)
+    unseeded_result = himmelblau_simulated_annealing_solver(2, 1, 0.1, 5, make_temp_params())
+    assert unseeded_result.get_objective_values() == seeded_result.get_objective_values()
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+from metaheuristics.simulated_annealing.multi_chain_annealing \
+    import himmelblau_multi_chain_solver, metropolis_acceptance, run_multi_chain_annealing
+from metaheuristics.simulated_annealing.temperature_params \
+    import TemperatureParams
+from metaheuristics.tools.functions import himmelblau, himmelblau_batch
+from unittest.mock import MagicMock
+
+
+def test_metropolis_acceptance_always_accepts_better_values():
+    accepted = metropolis_acceptance(np.array([5.0, 5.0]), np.array([4.0, 1.0]), 0, np.array([1.0, 1.0]))
+    assert accepted.tolist() == [True, True]
+
+
+def test_metropolis_acceptance_with_worse_values():
+    old_values = np.array([10.0, 10.0, 10.0])
+    new_values = np.array([12.5, 12.5, 1000.0])
+    random_numbers = np.array([0.9, 0.99, 0.001])
+    accepted = metropolis_acceptance(old_values, new_values, 100, random_numbers)
+    assert accepted.tolist() == [True, False, False]
+
+
+def test_metropolis_acceptance_with_zero_temperature():
+    accepted = metropolis_acceptance(np.array([3.0, 3.0]), np.array([3.0, 3.5]), 0, np.array([0.0, 0.0]))
+    assert accepted.tolist() == [False, False]
+
+
+def test_zero_temperature_chains_never_get_worse():
+    temp_params = TemperatureParams(0, 5, lambda temperature: temperature)
+    initial_positions = np.array([[2.0, 1.0], [-1.0, -1.0], [0.0, 4.0]])
+    mock_batch_objective = MagicMock(side_effect=himmelblau_batch)
+    result = run_multi_chain_annealing(
+            temp_params, lambda temperature: 10, initial_positions, mock_batch_objective, 0.1, seed=3)
+    initial_values = himmelblau_batch(initial_positions)
+    assert mock_batch_objective.call_count == 51
+    assert np.all(result.get_final_objective_values() <= initial_values)
+    assert np.array_equal(result.get_final_objective_values(), result.get_best_objective_values())
+    assert np.all(result.get_acceptance_rates() <= 1)
+
+
+def test_himmelblau_solver_finds_a_minimum():
+    temp_params = TemperatureParams(100.0, 60, lambda temperature: 0.85 * temperature)
+    initial_positions = np.tile([2.0, 1.0], (8, 1))
+    result = himmelblau_multi_chain_solver(initial_positions, 0.1, 15, temp_params, seed=7)
+    best_solution = result.get_best_solution()
+    assert result.get_final_positions().shape == (8, 2)
+    assert best_solution.get_objective_value() == result.get_best_objective_values().min()
+    assert best_solution.get_objective_value() < 0.1
+    assert best_solution.get_objective_value() == himmelblau(tuple(best_solution.get_solution_value()))
+
+
+def test_runs_are_reproducible_with_a_seed():
+    results = []
+    for _ in range(2):
+        temp_params = TemperatureParams(50.0, 10, lambda temperature: 0.9 * temperature)
+        results.append(himmelblau_multi_chain_solver(np.zeros((4, 2)), 0.2, 5, temp_params, seed=11))
+    assert np.array_equal(results[0].get_final_positions(), results[1].get_final_positions())
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+
+import pickle
+import pytest
+import numpy as np
+import pandas as pd
+from metaheuristics.tools.functions import himmelblau
+from metaheuristics.simulated_annealing.parallel_restarts \
+    import run_parallel_restarts, run_restart
+from metaheuristics.simulated_annealing.problem_specs \
+    import ContinuousProblemSpec, HimmelblauProblemSpec, QAPLIBProblemSpec, QuadraticAssignmentProblemSpec
+from metaheuristics.simulated_annealing.temperature_params \
+    import TemperatureParams
+
+
+def temperature_update_func(current_temp):
+    return 0.8 * current_temp
+
+
+def make_temp_params():
+    return TemperatureParams(initial_temperature=100.0, temperature_changes=20,
+                             temperature_updater=temperature_update_func)
+
+
+def test_run_restart_for_qap_reports_facility_labels():
+    facilities = ["A", "B", "C", "D"]
+    flow_matrix = pd.DataFrame([[0, 3, 1, 4], [3, 0, 2, 0], [1, 2, 0, 5], [4, 0, 5, 0]],
+                               columns=facilities, index=facilities)
+    dist_matrix = pd.DataFrame([[0, 1, 2, 3], [1, 0, 1, 2], [2, 1, 0, 1], [3, 2, 1, 0]],
+                               columns=facilities, index=facilities)
+    problem_spec = QuadraticAssignmentProblemSpec(flow_matrix, dist_matrix, ["D", "C", "B", "A"])
+    seed_sequence = np.random.SeedSequence(5)
+    result = run_restart(problem_spec, make_temp_params(), 5, seed_sequence)
+    final_solution = result.get_final_solution()
+    assert sorted(final_solution.get_solution_value()) == facilities
+    assert len(result.get_temperatures()) == 20
+    assert result.get_objective_values()[-1] == final_solution.get_objective_value()
+    assert result.get_best_solution().get_objective_value() <= min(result.get_objective_values())
+
+
+def test_restarts_are_reproducible_and_best_is_returned():
+    problem_spec = HimmelblauProblemSpec(2, 1, 0.1)
+    runs = [run_parallel_restarts(problem_spec, make_temp_params(), 10, 4, seed=42, max_workers=2)
+            for _ in range(2)]
+    for (best_solution, results) in runs:
+        assert len(results) == 4
+        best_values = [result.get_best_solution().get_objective_value() for result in results]
+        assert best_solution.get_objective_value() == min(best_values)
+    first_values = [result.get_objective_values() for result in runs[0][1]]
+    second_values = [result.get_objective_values() for result in runs[1][1]]
+    assert first_values == second_values
+    assert len(set(tuple(values) for values in first_values)) == 4
+
+
+def test_pending_restarts_are_cancelled_once_target_is_reached():
+    problem_spec = HimmelblauProblemSpec(2, 1, 0.1)
+    best_solution, results = run_parallel_restarts(
+            problem_spec, make_temp_params(), 10, 8, seed=1, max_workers=1, target_objective=np.inf)
+    completed_results = [result for result in results if result is not None]
+    assert 0 < len(completed_results) < 8
+    assert best_solution.get_objective_value() == min(
+            result.get_best_solution().get_objective_value() for result in completed_results)
+
+
+def test_running_restarts_stop_once_target_is_reached():
+    problem_spec = HimmelblauProblemSpec(2, 1, 0.1)
+    best_solution, results = run_parallel_restarts(
+            problem_spec, make_temp_params(), 10, 4, seed=3, max_workers=4, target_objective=np.inf)
+    completed_results = [result for result in results if result is not None]
+    assert len(completed_results) > 0
+    for result in completed_results:
+        assert len(result.get_temperatures()) < 20
+
+
+def test_qaplib_spec_pickles_only_the_path(tmp_path):
+    file_path = tmp_path / "tiny4.dat"
+    file_path.write_text("4\n0 3 1 4\n3 0 2 0\n1 2 0 5\n4 0 5 0\n"
+                         "0 1 2 3\n1 0 1 2\n2 1 0 1\n3 2 1 0\n")
+    problem_spec = QAPLIBProblemSpec(str(file_path))
+    assert problem_spec.get_qap_instance().get_size() == 4
+    restored_spec = pickle.loads(pickle.dumps(problem_spec))
+    assert restored_spec._qap_instance is None
+    result = run_restart(restored_spec, make_temp_params(), 5, np.random.SeedSequence(3))
+    assert sorted(result.get_best_solution().get_solution_value()) == [0, 1, 2, 3]
+
+
+def test_run_restart_for_continuous_problem():
+    problem_spec = ContinuousProblemSpec([0.0, 0.0], himmelblau, -5.0, 5.0, proposal="cauchy")
+    restored_spec = pickle.loads(pickle.dumps(problem_spec))
+    result = run_restart(restored_spec, make_temp_params(), 50, np.random.SeedSequence(4))
+    best_solution = result.get_best_solution()
+    assert best_solution.get_objective_value() < himmelblau((0.0, 0.0))
+    assert best_solution.get_objective_value() == pytest.approx(himmelblau(best_solution.get_solution_value()))
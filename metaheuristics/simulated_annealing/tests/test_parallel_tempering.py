@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+import numpy as np
+from metaheuristics.simulated_annealing.benchmarks.benchmark_suite import random_qap_spec
+from metaheuristics.simulated_annealing.parallel_tempering \
+    import Replica, run_parallel_tempering, should_swap_replicas
+from metaheuristics.simulated_annealing.problem_specs import HimmelblauProblemSpec
+from metaheuristics.tools.functions import himmelblau
+from metaheuristics.tools.optimization_problem import OptimizationProblem
+
+
+def failing_neighbour(solution):
+    raise RuntimeError("cannot pick a neighbour")
+
+
+class FailingProblemSpec:
+    def build_problem(self, random_buffer):
+        return OptimizationProblem((2, 1), himmelblau, failing_neighbour)
+
+
+def test_swap_when_hot_replica_is_better():
+    assert should_swap_replicas(10, 5, 1, 2, 0.99)
+
+
+def test_swap_when_random_number_below_probability():
+    # the probability of the exchange is exp((1 - 0.5) * (5 - 10)) = 0.082
+    assert should_swap_replicas(5, 10, 1, 2, 0.08)
+    assert not should_swap_replicas(5, 10, 1, 2, 0.09)
+
+
+def test_replica_tracks_best_solution():
+    replica = Replica(HimmelblauProblemSpec(2, 1, 0.1), np.random.SeedSequence(1))
+    current_value = replica.sweep(10.0, 50)
+    assert current_value == replica.get_problem().get_current_objective_value()
+    assert replica.get_best_solution().get_objective_value() <= current_value
+
+
+def test_result_does_not_depend_on_number_of_workers():
+    problem_spec = random_qap_spec(8, seed=2)
+    local_result = run_parallel_tempering(problem_spec, [1, 10, 100], 20, 6, seed=5)
+    worker_result = run_parallel_tempering(problem_spec, [100, 1, 10], 20, 6, seed=5, number_of_workers=2)
+    assert list(worker_result.get_temperatures()) == [1, 10, 100]
+    assert worker_result.get_best_objective_values() == local_result.get_best_objective_values()
+    assert worker_result.get_best_solution().get_solution_value() == \
+        local_result.get_best_solution().get_solution_value()
+    assert np.array_equal(worker_result.get_swap_acceptance_rates(), local_result.get_swap_acceptance_rates())
+
+
+def test_result_statistics():
+    problem_spec = random_qap_spec(8, seed=2)
+    result = run_parallel_tempering(problem_spec, [1, 10, 100, 1000], 20, 10, seed=5)
+    swap_acceptance_rates = result.get_swap_acceptance_rates()
+    assert len(swap_acceptance_rates) == 3
+    assert np.all((swap_acceptance_rates >= 0) & (swap_acceptance_rates <= 1))
+    assert len(result.get_replica_best_solutions()) == 4
+    assert len(result.get_best_objective_values()) == 10
+    assert result.get_best_solution().get_objective_value() == result.get_best_objective_values()[-1]
+    assert sorted(result.get_best_solution().get_solution_value()) == list(range(8))
+
+
+def test_stops_at_target_objective():
+    result = run_parallel_tempering(HimmelblauProblemSpec(2, 1, 0.1), [1, 10], 10, 50, seed=1,
+                                    target_objective=1e6)
+    assert len(result.get_best_objective_values()) == 1
+
+
+def test_temperatures_must_be_positive():
+    with pytest.raises(ValueError):
+        run_parallel_tempering(HimmelblauProblemSpec(2, 1, 0.1), [0, 10], 10, 5)
+
+
+def test_worker_error_is_raised_in_the_main_process():
+    with pytest.raises(RuntimeError, match="cannot pick a neighbour") as error_info:
+        run_parallel_tempering(FailingProblemSpec(), [1, 10], 10, 5, seed=1, number_of_workers=2)
+    assert "failing_neighbour" in str(error_info.value.__cause__)
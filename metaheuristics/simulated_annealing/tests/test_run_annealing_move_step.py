@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+
+from metaheuristics.simulated_annealing.simulated_annealing_utils \
+    import run_annealing_move_step
+from unittest.mock import patch, MagicMock
+
+
+def test_when_move_is_applied():
+    mock_optimization_problem = MagicMock()
+    mock_optimization_problem.propose_move = MagicMock(return_value=(0, 3))
+    mock_optimization_problem.get_move_delta = MagicMock(return_value=-4)
+    mock_optimization_problem.get_current_objective_value = MagicMock(return_value=12)
+    with patch("metaheuristics.simulated_annealing.simulated_annealing_utils.should_change_solution",
+               return_value=True) as mock_decision:
+        result = run_annealing_move_step(1200, mock_optimization_problem)
+    assert result
+    mock_optimization_problem.get_move_delta.assert_called_once_with((0, 3))
+    mock_decision.assert_called_once_with(12, 8, 1200)
+    mock_optimization_problem.apply_move.assert_called_once_with((0, 3), -4)
+    mock_optimization_problem.reject_move.assert_not_called()
+    mock_optimization_problem.find_neighbour_solution.assert_not_called()
+
+
+def test_when_move_is_rejected():
+    mock_optimization_problem = MagicMock()
+    mock_optimization_problem.propose_move = MagicMock(return_value=(2, 1))
+    mock_optimization_problem.get_move_delta = MagicMock(return_value=5.5)
+    mock_optimization_problem.get_current_objective_value = MagicMock(return_value=17.5)
+    with patch("metaheuristics.simulated_annealing.simulated_annealing_utils.should_change_solution",
+               return_value=False) as mock_decision:
+        result = run_annealing_move_step(150, mock_optimization_problem)
+    assert not result
+    mock_decision.assert_called_once_with(17.5, 23, 150)
+    mock_optimization_problem.apply_move.assert_not_called()
+    mock_optimization_problem.reject_move.assert_called_once_with((2, 1))
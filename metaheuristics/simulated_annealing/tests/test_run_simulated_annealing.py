@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+
+from metaheuristics.simulated_annealing.simulated_annealing_utils \
+    import run_simulated_annealing
+from metaheuristics.simulated_annealing.temperature_params \
+    import TemperatureParams
+from unittest.mock import patch, MagicMock
+
+
+def test_uses_solution_updater_when_moves_not_supported():
+    mock_optimization_problem = MagicMock()
+    mock_optimization_problem.supports_moves = MagicMock(return_value=False)
+    mock_optimization_problem.get_current_objective_value = MagicMock(return_value=5)
+    mock_optimization_problem.get_current_optimization_solution.return_value.get_objective_value = \
+        MagicMock(return_value=5)
+    mock_new_solution = MagicMock()
+    temp_params = TemperatureParams(100, 2, lambda temperature: temperature / 2)
+    with patch("metaheuristics.simulated_annealing.simulated_annealing_utils.run_annealing_step",
+               return_value=mock_new_solution) as mock_step:
+        temperatures, solutions = run_simulated_annealing(
+                temp_params, lambda temperature: 3, mock_optimization_problem)
+    assert temperatures == [100, 50]
+    assert mock_step.call_count == 6
+    assert mock_optimization_problem.accept_solution.call_count == 6
+    mock_optimization_problem.accept_solution.assert_called_with(mock_new_solution)
+    mock_optimization_problem.get_objective_function.assert_not_called()
+    assert len(solutions) == 2
+
+
+def test_uses_moves_when_supported():
+    mock_optimization_problem = MagicMock()
+    mock_optimization_problem.supports_moves = MagicMock(return_value=True)
+    mock_optimization_problem.get_current_objective_value = MagicMock(return_value=5)
+    mock_optimization_problem.get_current_optimization_solution.return_value.get_objective_value = \
+        MagicMock(return_value=5)
+    temp_params = TemperatureParams(100, 3, lambda temperature: temperature - 10)
+    with patch("metaheuristics.simulated_annealing.simulated_annealing_utils.run_annealing_move_step",
+               return_value=True) as mock_move_step, \
+            patch("metaheuristics.simulated_annealing.simulated_annealing_utils.run_annealing_step") as mock_step:
+        temperatures, solutions = run_simulated_annealing(
+                temp_params, lambda temperature: 2, mock_optimization_problem)
+    assert temperatures == [100, 90, 80]
+    assert mock_move_step.call_count == 6
+    mock_step.assert_not_called()
+    mock_optimization_problem.accept_solution.assert_not_called()
+    assert mock_optimization_problem.get_current_optimization_solution.call_count == 4
+    assert solutions == [mock_optimization_problem.get_current_optimization_solution.return_value] * 3
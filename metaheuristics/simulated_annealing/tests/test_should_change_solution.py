@@ -42,3 +42,41 @@ def test_when_random_num_greater_than_func_val(mock_annealing_func, monkeypatch)
     assert not should_change_solution(29.8, 38.1, 1000)
     mock_annealing_func.assert_called_once_with(29.8, 38.1, 1000)
     mock_random.assert_called_once()
+
+
+def test_threshold_with_better_objective_value():
+    mock_buffer = MagicMock()
+    assert should_change_solution(25, 20, 300, mock_buffer)
+    mock_buffer.exponential.assert_not_called()
+
+
+def test_threshold_when_increase_below_threshold():
+    mock_buffer = MagicMock()
+    mock_buffer.exponential.return_value = 0.5
+    assert should_change_solution(10, 12.5, 10, mock_buffer)
+    mock_buffer.exponential.assert_called_once()
+
+
+def test_threshold_when_increase_equals_threshold():
+    mock_buffer = MagicMock()
+    mock_buffer.exponential.return_value = 0.25
+    assert should_change_solution(10, 12.5, 10, mock_buffer)
+
+
+def test_threshold_when_increase_above_threshold():
+    mock_buffer = MagicMock()
+    mock_buffer.exponential.return_value = 0.2
+    assert not should_change_solution(10, 12.5, 10, mock_buffer)
+
+
+def test_threshold_with_zero_temperature():
+    mock_buffer = MagicMock()
+    mock_buffer.exponential.return_value = 5.0
+    assert not should_change_solution(10, 10, 0, mock_buffer)
+    assert not should_change_solution(10, 12.5, 0, mock_buffer)
+
+
+def test_threshold_with_very_large_increase():
+    mock_buffer = MagicMock()
+    mock_buffer.exponential.return_value = 3.0
+    assert not should_change_solution(0, 1e308, 1e-300, mock_buffer)
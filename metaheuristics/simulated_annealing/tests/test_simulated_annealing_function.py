@@ -30,3 +30,7 @@ def test_with_small_temperature():
 def test_with_large_temperature():
     result = simulated_annealing_function(50, 100, 1000)
     assert round(result, 2) == 0.95
+
+
+def test_with_very_large_objective_increase():
+    assert simulated_annealing_function(0, 1e6, 1) == 0
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from metaheuristics.simulated_annealing.simulated_annealing_utils \
+    import AnnealingRun, make_iteration_size_function, pick_neighbour_for_himmelblau
+from metaheuristics.simulated_annealing.speculative_annealing \
+    import SpeculativeAnnealingRun, run_speculative_simulated_annealing
+from metaheuristics.simulated_annealing.temperature_params import TemperatureParams
+from metaheuristics.tools.evaluators import AsyncioEvaluator, ExecutorEvaluator
+from metaheuristics.tools.functions import himmelblau
+from metaheuristics.tools.optimization_problem import OptimizationProblem
+from metaheuristics.tools.random_buffer import RandomBuffer
+
+
+def make_temp_params(initial_temperature=100.0):
+    return TemperatureParams(initial_temperature=initial_temperature, temperature_changes=5,
+                             temperature_updater=lambda temperature: 0.5 * temperature)
+
+
+def make_himmelblau_problem(random_buffer):
+    return OptimizationProblem((2, 1), himmelblau,
+                               lambda solution: pick_neighbour_for_himmelblau(solution, 0.1, random_buffer))
+
+
+def test_speculation_of_one_matches_annealing_run():
+    random_buffer = RandomBuffer(seed=7)
+    sequential_run = AnnealingRun(make_temp_params(), make_iteration_size_function(20),
+                                  make_himmelblau_problem(random_buffer), random_buffer=random_buffer)
+    expected_values = [record.get_current_objective_value() for record in sequential_run]
+    random_buffer = RandomBuffer(seed=7)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        result = run_speculative_simulated_annealing(
+                make_temp_params(), make_iteration_size_function(20), make_himmelblau_problem(random_buffer),
+                ExecutorEvaluator(himmelblau, executor), speculation=1, random_buffer=random_buffer)
+    assert result.get_objective_values() == expected_values
+    assert result.get_best_solution().get_objective_value() == sequential_run.get_best_objective_value()
+
+
+def test_rejected_neighbours_are_evaluated_concurrently():
+    problem = OptimizationProblem(0, lambda solution: 0.0, lambda solution: solution + 1)
+    temp_params = TemperatureParams(initial_temperature=1e-9, temperature_changes=1,
+                                    temperature_updater=lambda temperature: temperature)
+    # every evaluation waits until four are running at once, which only
+    # happens if the four speculative neighbours are submitted together
+    barrier = threading.Barrier(4, timeout=10)
+
+    def concurrent_objective(solution):
+        barrier.wait()
+        return 1.0 + solution
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        annealing_run = SpeculativeAnnealingRun(temp_params, make_iteration_size_function(16), problem,
+                                                ExecutorEvaluator(concurrent_objective, executor), speculation=4)
+        record = next(annealing_run)
+    assert record.get_steps() == 16
+    assert record.get_acceptances() == 0
+    assert annealing_run.get_evaluations() == 16
+
+
+def test_neighbours_after_an_acceptance_are_discarded():
+    problem = OptimizationProblem(0, lambda solution: 0.0, lambda solution: solution + 1)
+    temp_params = TemperatureParams(initial_temperature=1e9, temperature_changes=1,
+                                    temperature_updater=lambda temperature: temperature)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        annealing_run = SpeculativeAnnealingRun(temp_params, make_iteration_size_function(8), problem,
+                                                ExecutorEvaluator(lambda solution: float(solution), executor),
+                                                speculation=4)
+        record = next(annealing_run)
+    assert record.get_acceptances() == 8
+    assert problem.get_current_solution() == 8
+    assert annealing_run.get_evaluations() == 26
+
+
+def test_asyncio_evaluator():
+    async def objective(solution):
+        await asyncio.sleep(0.01)
+        return himmelblau(solution)
+
+    random_buffer = RandomBuffer(seed=3)
+    with AsyncioEvaluator(objective) as evaluator:
+        assert evaluator.evaluate((3, 2)) == 0
+        problem = OptimizationProblem((2, 1), evaluator.evaluate,
+                                      lambda solution: pick_neighbour_for_himmelblau(solution, 0.1, random_buffer))
+        result = run_speculative_simulated_annealing(make_temp_params(), make_iteration_size_function(8),
+                                                     problem, evaluator, speculation=3, random_buffer=random_buffer)
+    assert len(result.get_objective_values()) == 5
+    best_solution = result.get_best_solution()
+    assert best_solution.get_objective_value() == himmelblau(best_solution.get_solution_value())
+
+
+def test_speculation_must_be_positive():
+    problem = OptimizationProblem(0, float, lambda solution: solution + 1)
+    with pytest.raises(ValueError):
+        SpeculativeAnnealingRun(make_temp_params(), make_iteration_size_function(1), problem, None, speculation=0)
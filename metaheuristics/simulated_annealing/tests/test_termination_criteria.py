@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+
+from metaheuristics.simulated_annealing.cooling_schedules \
+    import geometric_schedule, ScheduledTemperatureParams
+from metaheuristics.simulated_annealing.simulated_annealing_utils \
+    import AnnealingRun
+from metaheuristics.simulated_annealing.temperature_record \
+    import TemperatureRecord
+from metaheuristics.simulated_annealing.termination_criteria \
+    import MinimumTemperature, Stagnation, WallClockBudget, EvaluationBudget
+from metaheuristics.tools.optimization_problem import OptimizationProblem
+
+
+def make_record(temperature=100, best_objective_value=10, steps=10, elapsed_time=1.0):
+    return TemperatureRecord(0, temperature, best_objective_value, best_objective_value,
+                             0, steps, elapsed_time)
+
+
+def test_minimum_temperature():
+    criterion = MinimumTemperature(5)
+    assert not criterion.should_terminate(make_record(temperature=5.1))
+    assert criterion.should_terminate(make_record(temperature=5))
+
+
+def test_stagnation():
+    criterion = Stagnation(2, tolerance=0.5)
+    assert not criterion.should_terminate(make_record(best_objective_value=10))
+    assert not criterion.should_terminate(make_record(best_objective_value=9.8))
+    assert not criterion.should_terminate(make_record(best_objective_value=9))
+    assert not criterion.should_terminate(make_record(best_objective_value=9))
+    assert criterion.should_terminate(make_record(best_objective_value=8.7))
+
+
+def test_wall_clock_budget():
+    criterion = WallClockBudget(2.5)
+    assert not criterion.should_terminate(make_record(elapsed_time=2.4))
+    assert criterion.should_terminate(make_record(elapsed_time=2.6))
+
+
+def test_evaluation_budget():
+    criterion = EvaluationBudget(25)
+    assert not criterion.should_terminate(make_record(steps=10))
+    assert not criterion.should_terminate(make_record(steps=10))
+    assert criterion.should_terminate(make_record(steps=10))
+
+
+def test_criteria_restore_their_state():
+    stagnation = Stagnation(2)
+    stagnation.should_terminate(make_record(best_objective_value=10))
+    stagnation.should_terminate(make_record(best_objective_value=10))
+    restored_stagnation = Stagnation(2)
+    restored_stagnation.set_state(stagnation.get_state())
+    assert restored_stagnation.should_terminate(make_record(best_objective_value=10))
+    budget = EvaluationBudget(25)
+    budget.should_terminate(make_record(steps=20))
+    restored_budget = EvaluationBudget(25)
+    restored_budget.set_state(budget.get_state())
+    assert restored_budget.should_terminate(make_record(steps=10))
+    assert MinimumTemperature(5).get_state() == {}
+    assert WallClockBudget(2.5).get_state() == {}
+
+
+def test_annealing_run_stops_at_first_criterion_met():
+    optimization_problem = OptimizationProblem(0, lambda solution: solution ** 2, lambda solution: solution + 1)
+    temp_params = ScheduledTemperatureParams(geometric_schedule(100, 0.5, 1000))
+    minimum_temperature = MinimumTemperature(1)
+    annealing_run = AnnealingRun(temp_params, lambda temperature: 5, optimization_problem,
+                                 [EvaluationBudget(10 ** 6), minimum_temperature])
+    records = list(annealing_run)
+    assert len(records) == 8
+    assert records[-1].get_temperature() <= 1
+    assert annealing_run.get_terminating_criterion() is minimum_temperature
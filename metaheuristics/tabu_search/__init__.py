@@ -0,0 +1,16 @@
+"""A set of methods and classes used to implement the tabu search
+metaheuristic algorithm. Tabu search is a local search method that moves to
+the best neighbour of the current solution at every iteration, even when
+that neighbour is worse than the current solution.
+
+To avoid cycling back to solutions visited recently, moves that would undo
+recent moves are declared tabu for a number of iterations, called the tabu
+tenure. A tabu move is still allowed if it satisfies an aspiration
+criterion, for example when it leads to a solution better than any found
+so far.
+
+The robust tabu search of Taillard, implemented here for the quadratic
+assignment problem, draws the tenure at random from a range around the size
+of the problem and forces moves that have not been made for a long time.
+
+"""
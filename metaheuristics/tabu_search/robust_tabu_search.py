@@ -0,0 +1,373 @@
+"""Runs the robust tabu search of Taillard for the quadratic assignment
+problem. At every iteration the swap of two facilities with the lowest
+change in objective value is chosen among the moves that are not tabu. The
+changes for every swap are kept in a SwapDeltaMatrix, so an iteration costs
+O(n^2) rather than the O(n^3) needed to score every swap from scratch.
+
+A swap is tabu if it places both facilities back in positions they held
+within the last tenure iterations, which is an O(1) lookup in an n x n
+TabuList. A tabu swap is still chosen if it leads to a new best solution,
+and a swap is forced if either facility has not held the position the swap
+moves it to for aspiration iterations, which diversifies the search
+
+"""
+
+import itertools
+import time
+import numpy as np
+from metaheuristics.tabu_search.tabu_search_result import TabuSearchResult
+from metaheuristics.tools.optimization_solution import OptimizationSolution
+from metaheuristics.tools.qap_instance import QAPInstance
+from metaheuristics.tools.quadratic_assignment_problem import QuadraticAssignmentProblem
+from metaheuristics.tools.random_buffer import RandomBuffer
+from metaheuristics.tools.swap_delta_matrix import SwapDeltaMatrix
+
+
+class TabuList:
+    """Records the last iteration at which each position of a permutation
+    held each facility
+
+    Following Taillard, the entry for position i and facility j starts at
+    -(n * i + j), so that a few swaps are tabu during the first iterations
+
+    Attributes
+    ----------
+    last_held: numpy.ndarray
+        An n x n integer array whose entry in row i, column j is the last
+        iteration at which position i held facility j
+
+    Parameters
+    ----------
+    size: int
+        The number of positions in the permutation
+
+    """
+    def __init__(self, size):
+        positions = np.arange(size)
+        self._last_held = -(size * positions[:, None] + positions[None, :])
+
+    def get_last_held(self, position, facility):
+        """Retrieves the last iteration at which a position held a facility
+
+        Parameters
+        ----------
+        position: int
+            A position of the permutation
+        facility: int
+            A facility index
+
+        Returns
+        -------
+        int
+            The last iteration at which position held facility
+
+        """
+        return int(self._last_held[position, facility])
+
+    def get_swap_last_held(self, permutation):
+        """Retrieves, for every swap, the last iteration at which the first
+        position held the facility the swap would move there
+
+        Parameters
+        ----------
+        permutation: numpy.ndarray
+            An array of integers representing an ordering of the facilities
+
+        Returns
+        -------
+        numpy.ndarray
+            An n x n array whose entry in row r, column s is the last
+            iteration at which position r held facility permutation[s]
+
+        """
+        return self._last_held[:, permutation]
+
+    def is_tabu(self, permutation, first, second, iteration, tenure):
+        """Decides whether swapping two positions of permutation is tabu
+
+        Parameters
+        ----------
+        permutation: numpy.ndarray
+            An array of integers representing an ordering of the facilities
+        first: int
+            The position of the first entry being swapped
+        second: int
+            The position of the second entry being swapped
+        iteration: int
+            The current iteration
+        tenure: int
+            The number of iterations for which a position holding a
+            facility again is tabu
+
+        Returns
+        -------
+        bool
+            True if both positions held the facility the swap moves there
+            within the last tenure iterations
+
+        """
+        return (self._last_held[first, permutation[second]] >= iteration - tenure and
+                self._last_held[second, permutation[first]] >= iteration - tenure)
+
+    def record_swap(self, permutation, first, second, iteration):
+        """Records that two positions of permutation give up their facilities
+
+        Parameters
+        ----------
+        permutation: numpy.ndarray
+            The permutation before the swap is applied
+        first: int
+            The position of the first entry being swapped
+        second: int
+            The position of the second entry being swapped
+        iteration: int
+            The iteration at which the swap is applied
+
+        Returns
+        -------
+        None
+
+        Side Effect
+        -----------
+        Sets the last iteration at which first and second held their
+        current facilities to iteration
+
+        """
+        self._last_held[first, permutation[first]] = iteration
+        self._last_held[second, permutation[second]] = iteration
+
+
+def get_default_tenure_range(size):
+    """Retrieves the range of tabu tenures suggested by Taillard
+
+    Parameters
+    ----------
+    size: int
+        The number of facilities in the problem
+
+    Returns
+    -------
+    int, int
+        The smallest and largest tenures, 90% and 110% of size
+
+    """
+    return max(1, int(0.9 * size)), max(1, int(np.ceil(1.1 * size)))
+
+
+def draw_tenure(min_tenure, max_tenure, random_buffer):
+    """Draws a tabu tenure uniformly at random
+
+    Parameters
+    ----------
+    min_tenure: int
+        The smallest tenure
+    max_tenure: int
+        The largest tenure
+    random_buffer: RandomBuffer
+        The RandomBuffer from which the tenure is drawn
+
+    Returns
+    -------
+    int
+        A tenure between min_tenure and max_tenure inclusive
+
+    """
+    return min(min_tenure + int(random_buffer.uniform() * (max_tenure - min_tenure + 1)), max_tenure)
+
+
+def select_tabu_move(deltas, tabu_list, permutation, iteration, tenure, aspiration,
+                     current_objective_value, best_objective_value, pairs=None):
+    """Selects the swap made at an iteration of the robust tabu search
+
+    Swaps satisfying an aspiration criterion are preferred, followed by
+    swaps that are not tabu. The swap with the lowest delta in the preferred
+    group is chosen. If every swap is tabu, the swap with the lowest delta
+    is chosen
+
+    Parameters
+    ----------
+    deltas: numpy.ndarray
+        A matrix whose entry in row r, column s is the change in objective
+        value caused by swapping positions r and s, as kept by a
+        SwapDeltaMatrix
+    tabu_list: TabuList
+        The TabuList of the search
+    permutation: numpy.ndarray
+        An array of integers representing the current ordering of the facilities
+    iteration: int
+        The current iteration
+    tenure: int
+        The current tabu tenure
+    aspiration: int
+        The number of iterations after which a swap is forced if either
+        position has not held the facility the swap moves there
+    current_objective_value: float
+        The objective value of permutation
+    best_objective_value: float
+        The lowest objective value found so far
+    pairs: tuple
+        An optional pair of arrays with the first and second positions of
+        every swap, as returned by numpy.triu_indices. Computed if omitted
+
+    Returns
+    -------
+    int, int
+        The two positions to swap
+
+    """
+    if pairs is None:
+        pairs = np.triu_indices(len(permutation), 1)
+    firsts, seconds = pairs
+    swap_deltas = deltas[firsts, seconds]
+    last_held = tabu_list.get_swap_last_held(permutation)
+    forward_last_held = last_held[firsts, seconds]
+    backward_last_held = last_held[seconds, firsts]
+    allowed = (forward_last_held < iteration - tenure) | (backward_last_held < iteration - tenure)
+    aspired = (((forward_last_held < iteration - aspiration) | (backward_last_held < iteration - aspiration)) |
+               (current_objective_value + swap_deltas < best_objective_value))
+    if aspired.any():
+        candidates = np.flatnonzero(aspired)
+    elif allowed.any():
+        candidates = np.flatnonzero(allowed)
+    else:
+        candidates = np.arange(len(swap_deltas))
+    index = candidates[np.argmin(swap_deltas[candidates])]
+    return int(firsts[index]), int(seconds[index])
+
+
+def run_robust_tabu_search(qap_problem, max_iterations=None, max_time=None, tenure_range=None,
+                           aspiration=None, target_objective=None, random_buffer=None):
+    """Runs the robust tabu search on a quadratic assignment problem
+
+    Parameters
+    ----------
+    qap_problem: QuadraticAssignmentProblem
+        The quadratic assignment problem being solved, whose current
+        solution is the starting point of the search
+    max_iterations: int
+        The largest number of iterations performed
+    max_time: float
+        The number of seconds after which the search stops, which is
+        checked before every iteration
+    tenure_range: tuple
+        An optional pair with the smallest and largest tabu tenures. The
+        tenure is drawn from this range every 2 * largest tenure iterations,
+        and defaults to 90% to 110% of the problem size
+    aspiration: int
+        The number of iterations after which a swap is forced if either
+        position has not held the facility the swap moves there. Defaults to
+        5 * n^2
+    target_objective: float
+        An optional objective value at or below which the search stops
+    random_buffer: RandomBuffer
+        An optional RandomBuffer from which the tenures are drawn. If
+        omitted, an unseeded RandomBuffer is used
+
+    Returns
+    -------
+    TabuSearchResult
+        A TabuSearchResult holding the final and best solutions found by the
+        search and the objective value after each iteration
+
+    Side Effect
+    -----------
+    Applies every swap of the search to qap_problem, so that it holds the
+    final solution
+
+    Raises
+    ------
+    ValueError
+        If neither max_iterations nor max_time is given, or if the problem
+        has fewer than 2 facilities
+
+    """
+    if max_iterations is None and max_time is None:
+        raise ValueError("a max_iterations or max_time budget is required")
+    qap_instance = qap_problem.get_qap_instance()
+    size = qap_instance.get_size()
+    if size < 2:
+        raise ValueError("tabu search needs at least 2 facilities")
+    min_tenure, max_tenure = tenure_range if tenure_range is not None else get_default_tenure_range(size)
+    if aspiration is None:
+        aspiration = 5 * size * size
+    if random_buffer is None:
+        random_buffer = RandomBuffer()
+    delta_matrix = SwapDeltaMatrix(qap_instance, qap_problem.get_current_solution())
+    tabu_list = TabuList(size)
+    pairs = np.triu_indices(size, 1)
+    best_solution = qap_problem.get_current_optimization_solution()
+    best_iteration = 0
+    objective_values = []
+    tenure = draw_tenure(min_tenure, max_tenure, random_buffer)
+    start_time = time.perf_counter()
+    iterations = itertools.count(1) if max_iterations is None else range(1, max_iterations + 1)
+    for iteration in iterations:
+        if target_objective is not None and best_solution.get_objective_value() <= target_objective:
+            break
+        if max_time is not None and time.perf_counter() - start_time >= max_time:
+            break
+        if iteration % (2 * max_tenure) == 0:
+            tenure = draw_tenure(min_tenure, max_tenure, random_buffer)
+        permutation = delta_matrix.get_permutation()
+        first, second = select_tabu_move(
+                delta_matrix.get_deltas(), tabu_list, permutation, iteration, tenure, aspiration,
+                qap_problem.get_current_objective_value(), best_solution.get_objective_value(), pairs)
+        delta = delta_matrix.get_delta(first, second)
+        tabu_list.record_swap(permutation, first, second, iteration)
+        qap_problem.apply_move((first, second), delta)
+        delta_matrix.apply_swap(first, second)
+        objective_value = qap_problem.get_current_objective_value()
+        objective_values.append(objective_value)
+        if objective_value < best_solution.get_objective_value():
+            best_solution = qap_problem.get_current_optimization_solution()
+            best_iteration = iteration
+    return TabuSearchResult(qap_problem.get_current_optimization_solution(), best_solution, objective_values,
+                            best_iteration, time.perf_counter() - start_time)
+
+
+def quadratic_assignment_tabu_search_solver(flow_matrix, dist_matrix, initial_array, max_iterations=None,
+                                            max_time=None, target_objective=None, seed=None):
+    """Runs the robust tabu search for the quadratic assignment problem,
+    starting from the initial solution given by initial_array
+
+    Parameters
+    ----------
+    flow_matrix: pandas.DataFrame or numpy.ndarray
+        A square matrix, specifying the flows between facilities
+    dist_matrix: pandas.DataFrame or numpy.ndarray
+        A square matrix, specifying the distances between the facilities
+    inital_array: list
+        An initial solution to the quadratic assignment problem, that is
+        the list represents an ordering of the facilities
+    max_iterations: int
+        The largest number of iterations performed
+    max_time: float
+        The number of seconds after which the search stops
+    target_objective: float
+        An optional objective value at or below which the search stops
+    seed: int
+        An optional seed for the random number generator of the run, which
+        makes the run reproducible
+
+    Returns
+    -------
+    TabuSearchResult
+        A TabuSearchResult object, holding the final and best solutions
+        found by the search and the objective value after each iteration.
+        The solutions are given as orderings of the facility labels
+
+    """
+    qap_instance = QAPInstance(flow_matrix, dist_matrix)
+    qap_problem = QuadraticAssignmentProblem(qap_instance, qap_instance.encode(initial_array))
+    permutation_result = run_robust_tabu_search(
+            qap_problem, max_iterations, max_time, target_objective=target_objective,
+            random_buffer=RandomBuffer(seed))
+    final_solution = permutation_result.get_final_solution()
+    best_solution = permutation_result.get_best_solution()
+    return TabuSearchResult(
+            OptimizationSolution(qap_problem.get_facility_order(final_solution.get_solution_value()),
+                                 final_solution.get_objective_value()),
+            OptimizationSolution(qap_problem.get_facility_order(best_solution.get_solution_value()),
+                                 best_solution.get_objective_value()),
+            permutation_result.get_objective_values(), permutation_result.get_best_iteration(),
+            permutation_result.get_elapsed_time())
@@ -0,0 +1,100 @@
+"""The TabuSearchResult class acts as a container class for the outcome of
+a run of the tabu search algorithm. It holds the final and best solutions
+along with the trace of objective values recorded at each iteration
+
+"""
+
+class TabuSearchResult:
+    """A container class for the outcome of the tabu search algorithm
+
+    Attributes
+    ----------
+    final_solution: OptimizationSolution
+        The solution held by the algorithm when it finished
+    best_solution: OptimizationSolution
+        The solution with the lowest objective value held at any point
+        during the algorithm
+    objective_values: list
+        The objective value of the solution held after each iteration
+    best_iteration: int
+        The iteration at which best_solution was found, which is 0 if it
+        is the initial solution
+    elapsed_time: float
+        The number of seconds the algorithm ran for
+
+    """
+    def __init__(self, final_solution, best_solution, objective_values, best_iteration, elapsed_time):
+        self._final_solution = final_solution
+        self._best_solution = best_solution
+        self._objective_values = objective_values
+        self._best_iteration = best_iteration
+        self._elapsed_time = elapsed_time
+
+    def get_final_solution(self):
+        """Retrieves the solution held by the algorithm when it finished
+
+        Returns
+        -------
+        OptimizationSolution
+            The final solution found by the algorithm
+
+        """
+        return self._final_solution
+
+    def get_best_solution(self):
+        """Retrieves the best solution held at any point during the algorithm
+
+        Returns
+        -------
+        OptimizationSolution
+            The solution with the lowest objective value found by the
+            algorithm, which may have been left before it finished
+
+        """
+        return self._best_solution
+
+    def get_objective_values(self):
+        """Retrieves the objective value held after each iteration
+
+        Returns
+        -------
+        list
+            The objective value of the solution held after each iteration,
+            in order
+
+        """
+        return self._objective_values
+
+    def get_iterations(self):
+        """Retrieves the number of iterations performed by the algorithm
+
+        Returns
+        -------
+        int
+            The number of iterations performed
+
+        """
+        return len(self._objective_values)
+
+    def get_best_iteration(self):
+        """Retrieves the iteration at which the best solution was found
+
+        Returns
+        -------
+        int
+            The iteration at which the best solution was found, which is 0
+            if no iteration improved on the initial solution
+
+        """
+        return self._best_iteration
+
+    def get_elapsed_time(self):
+        """Retrieves the time taken by the algorithm
+
+        Returns
+        -------
+        float
+            The number of seconds the algorithm ran for
+
+        """
+        return self._elapsed_time
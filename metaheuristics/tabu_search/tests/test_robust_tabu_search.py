@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+
+import itertools
+import pytest
+import numpy as np
+import pandas as pd
+from unittest.mock import MagicMock
+from metaheuristics.tabu_search.robust_tabu_search import TabuList, draw_tenure, \
+    get_default_tenure_range, quadratic_assignment_tabu_search_solver, run_robust_tabu_search, \
+    select_tabu_move
+from metaheuristics.tools.qap_instance import QAPInstance
+from metaheuristics.tools.quadratic_assignment_problem import QuadraticAssignmentProblem
+from metaheuristics.tools.random_buffer import RandomBuffer
+
+
+@pytest.fixture(scope="module")
+def qap_instance():
+    rng = np.random.default_rng(11)
+    return QAPInstance(rng.integers(0, 10, (7, 7)), rng.integers(0, 10, (7, 7)))
+
+
+def test_tabu_list_starts_with_taillard_values():
+    tabu_list = TabuList(3)
+    assert tabu_list.get_last_held(0, 0) == 0
+    assert tabu_list.get_last_held(2, 1) == -7
+
+
+def test_tabu_list_records_swaps():
+    tabu_list = TabuList(4)
+    permutation = np.array([2, 0, 3, 1])
+    tabu_list.record_swap(permutation, 0, 3, 10)
+    assert tabu_list.get_last_held(0, 2) == 10
+    assert tabu_list.get_last_held(3, 1) == 10
+    swapped = np.array([1, 0, 3, 2])
+    assert tabu_list.is_tabu(swapped, 0, 3, 12, 5)
+    assert not tabu_list.is_tabu(swapped, 0, 3, 16, 5)
+    assert tabu_list.get_swap_last_held(swapped)[0, 3] == 10
+
+
+def test_tenure_is_drawn_from_the_range():
+    random_buffer = MagicMock()
+    random_buffer.uniform.side_effect = [0.0, 0.999999]
+    assert draw_tenure(4, 6, random_buffer) == 4
+    assert draw_tenure(4, 6, random_buffer) == 6
+    assert get_default_tenure_range(20) == (18, 22)
+    assert get_default_tenure_range(1) == (1, 2)
+
+
+def test_select_tabu_move_picks_the_best_allowed_swap():
+    tabu_list = TabuList(3)
+    deltas = np.array([[0.0, -5.0, 2.0], [-5.0, 0.0, 1.0], [2.0, 1.0, 0.0]])
+    permutation = np.array([0, 1, 2])
+    tabu_list.record_swap(np.array([1, 0, 2]), 0, 1, 100)
+    assert select_tabu_move(deltas, tabu_list, permutation, 101, 10, 1000, 20.0, 10.0) == (1, 2)
+
+
+def test_select_tabu_move_aspires_to_a_new_best_solution():
+    tabu_list = TabuList(3)
+    deltas = np.array([[0.0, -5.0, 2.0], [-5.0, 0.0, 1.0], [2.0, 1.0, 0.0]])
+    tabu_list.record_swap(np.array([1, 0, 2]), 0, 1, 100)
+    assert select_tabu_move(deltas, tabu_list, np.array([0, 1, 2]), 101, 10, 1000, 12.0, 10.0) == (0, 1)
+
+
+def test_select_tabu_move_forces_long_unused_swaps():
+    tabu_list = TabuList(3)
+    deltas = np.array([[0.0, 3.0, 2.0], [3.0, 0.0, 1.0], [2.0, 1.0, 0.0]])
+    tabu_list.record_swap(np.array([0, 2, 1]), 1, 2, 100)
+    assert select_tabu_move(deltas, tabu_list, np.array([0, 1, 2]), 101, 10, 95, 20.0, 10.0) == (0, 2)
+
+
+def test_select_tabu_move_forces_swaps_with_one_long_unused_position():
+    tabu_list = TabuList(3)
+    deltas = np.array([[0.0, 1.0, 3.0], [1.0, 0.0, 2.0], [3.0, 2.0, 0.0]])
+    tabu_list.record_swap(np.array([2, 0, 1]), 1, 2, 100)
+    assert select_tabu_move(deltas, tabu_list, np.array([0, 1, 2]), 101, 10, 95, 20.0, 10.0) == (0, 1)
+
+
+def test_search_finds_the_optimum_of_a_small_instance(qap_instance):
+    optimum = min(qap_instance.calculate_objective(np.array(permutation))
+                  for permutation in itertools.permutations(range(7)))
+    qap_problem = QuadraticAssignmentProblem(qap_instance, np.arange(7))
+    result = run_robust_tabu_search(qap_problem, 500, random_buffer=RandomBuffer(0))
+    best_solution = result.get_best_solution()
+    assert best_solution.get_objective_value() == optimum
+    assert qap_instance.calculate_objective(best_solution.get_solution_value()) == optimum
+    assert result.get_iterations() == 500
+    assert result.get_objective_values()[-1] == qap_problem.get_current_objective_value()
+    assert result.get_final_solution().get_objective_value() == \
+        qap_instance.calculate_objective(qap_problem.get_current_solution())
+
+
+def test_search_stops_at_the_target_objective(qap_instance):
+    qap_problem = QuadraticAssignmentProblem(qap_instance, np.arange(7))
+    initial_objective = qap_problem.get_current_objective_value()
+    result = run_robust_tabu_search(qap_problem, 500, target_objective=initial_objective,
+                                    random_buffer=RandomBuffer(0))
+    assert result.get_iterations() == 0
+    assert result.get_best_iteration() == 0
+
+
+def test_search_is_reproducible_from_a_seed(qap_instance):
+    results = [run_robust_tabu_search(QuadraticAssignmentProblem(qap_instance, np.arange(7)), 50,
+                                      random_buffer=RandomBuffer(4))
+               for _ in range(2)]
+    assert results[0].get_objective_values() == results[1].get_objective_values()
+
+
+def test_search_requires_a_budget(qap_instance):
+    with pytest.raises(ValueError):
+        run_robust_tabu_search(QuadraticAssignmentProblem(qap_instance, np.arange(7)))
+
+
+def test_search_stops_after_the_time_budget(qap_instance):
+    qap_problem = QuadraticAssignmentProblem(qap_instance, np.arange(7))
+    result = run_robust_tabu_search(qap_problem, max_time=0.0)
+    assert result.get_iterations() == 0
+
+
+def test_solver_returns_facility_labels():
+    facilities = ["X", "Y", "Z"]
+    flow_matrix = pd.DataFrame([[0, 5, 1], [5, 0, 2], [1, 2, 0]], columns=facilities, index=facilities)
+    dist_matrix = pd.DataFrame([[0, 1, 4], [1, 0, 2], [4, 2, 0]], columns=facilities, index=facilities)
+    result = quadratic_assignment_tabu_search_solver(flow_matrix, dist_matrix, ["Z", "X", "Y"], 20, seed=0)
+    assert sorted(result.get_best_solution().get_solution_value()) == facilities
+    assert result.get_best_solution().get_objective_value() <= \
+        result.get_final_solution().get_objective_value()
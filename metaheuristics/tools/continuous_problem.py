@@ -0,0 +1,387 @@
+"""The ContinuousProblem class is an OptimizationProblem over real vectors of
+any dimension constrained to a box. Neighbours change one coordinate at a
+time, cycling through the coordinates, by a Gaussian or Cauchy step scaled
+by a step size kept for each coordinate.
+
+Following Corana et al., the step sizes adapt to the problem. Once every
+coordinate has been proposed adaptation_interval times, the step size of a
+coordinate whose moves were accepted too often is increased and the step
+size of a coordinate whose moves were rejected too often is decreased, so
+the acceptance rate of each coordinate stays within a target range
+
+"""
+
+import math
+import numpy as np
+from metaheuristics.tools.optimization_problem import OptimizationProblem
+from metaheuristics.tools.optimization_solution import OptimizationSolution
+from metaheuristics.tools.random_buffer import RandomBuffer
+
+
+class ContinuousProblem(OptimizationProblem):
+    """A class to maintain a box constrained continuous optimization problem
+    to be solved using a metaheuristic algorithm
+
+    The problem supports the move protocol of OptimizationProblem, where a
+    move is a tuple with the coordinate being changed and its new value.
+    Step sizes are only adapted from moves made through this protocol
+
+    Attributes
+    ----------
+    lower_bounds: numpy.ndarray
+        The lower bound of each coordinate, which may be -numpy.inf
+    upper_bounds: numpy.ndarray
+        The upper bound of each coordinate, which may be numpy.inf
+    step_sizes: numpy.ndarray
+        The scale of the steps proposed for each coordinate
+    proposal: str
+        The distribution of the steps, either "gaussian" or "cauchy"
+    adaptation_interval: int
+        The number of times every coordinate is proposed between
+        adaptations of the step sizes
+    acceptance_range: tuple
+        The lowest and highest target acceptance rates of each coordinate
+    adaptation_factor: float
+        Controls how strongly the step sizes are changed at each adaptation
+    random_buffer: RandomBuffer
+        The RandomBuffer from which the steps are drawn
+    next_dimension: int
+        The coordinate changed by the next proposed move
+    proposals: numpy.ndarray
+        The number of moves proposed for each coordinate since the last
+        adaptation
+    acceptances: numpy.ndarray
+        The number of moves applied to each coordinate since the last
+        adaptation
+
+    Parameters
+    ----------
+    initial_solution: numpy.ndarray
+        An initial solution within the bounds
+    objective_function: function
+        A function taking a one dimensional array and returning its
+        objective value
+    lower_bounds: numpy.ndarray or float
+        The lower bound of each coordinate, or a bound shared by all of them
+    upper_bounds: numpy.ndarray or float
+        The upper bound of each coordinate, or a bound shared by all of them
+    step_sizes: numpy.ndarray or float
+        The initial step size of each coordinate. Defaults to a tenth of the
+        width of each bound, or 1 for an unbounded coordinate
+    proposal: str
+        The distribution of the steps, either "gaussian" or "cauchy". The
+        heavy tails of Cauchy steps occasionally propose distant points
+    adaptation_interval: int
+        The number of times every coordinate is proposed between
+        adaptations of the step sizes
+    acceptance_range: tuple
+        The lowest and highest target acceptance rates of each coordinate
+    adaptation_factor: float
+        Controls how strongly the step sizes are changed at each adaptation
+    random_buffer: RandomBuffer
+        An optional RandomBuffer from which the steps are drawn. If omitted,
+        an unseeded RandomBuffer is used
+    batch_objective_function: function
+        An optional vectorized version of objective_function
+
+    Raises
+    ------
+    ValueError
+        If proposal is not "gaussian" or "cauchy", or if initial_solution
+        does not lie within the bounds
+
+    """
+    def __init__(self, initial_solution, objective_function, lower_bounds, upper_bounds, step_sizes=None,
+                 proposal="gaussian", adaptation_interval=20, acceptance_range=(0.4, 0.6),
+                 adaptation_factor=2.0, random_buffer=None, batch_objective_function=None):
+        if proposal not in ("gaussian", "cauchy"):
+            raise ValueError("proposal must be 'gaussian' or 'cauchy'")
+        initial_solution = np.array(initial_solution, dtype=float)
+        size = len(initial_solution)
+        self._lower_bounds = np.broadcast_to(np.asarray(lower_bounds, dtype=float), (size,)).copy()
+        self._upper_bounds = np.broadcast_to(np.asarray(upper_bounds, dtype=float), (size,)).copy()
+        if not ((self._lower_bounds <= initial_solution) & (initial_solution <= self._upper_bounds)).all():
+            raise ValueError("initial_solution must lie within the bounds")
+        widths = self._upper_bounds - self._lower_bounds
+        if step_sizes is None:
+            step_sizes = np.where(np.isfinite(widths), 0.1 * widths, 1.0)
+        self._step_sizes = np.broadcast_to(np.asarray(step_sizes, dtype=float), (size,)).copy()
+        self._proposal = proposal
+        self._adaptation_interval = adaptation_interval
+        self._acceptance_range = acceptance_range
+        self._adaptation_factor = adaptation_factor
+        self._random_buffer = random_buffer if random_buffer is not None else RandomBuffer()
+        self._next_dimension = 0
+        self._proposals = np.zeros(size, dtype=int)
+        self._acceptances = np.zeros(size, dtype=int)
+        super().__init__(initial_solution, objective_function, self.pick_neighbour, batch_objective_function)
+
+    def get_lower_bounds(self):
+        """Retrieves the lower bound of each coordinate
+
+        Returns
+        -------
+        numpy.ndarray
+            The lower bound of each coordinate
+
+        """
+        return self._lower_bounds
+
+    def get_upper_bounds(self):
+        """Retrieves the upper bound of each coordinate
+
+        Returns
+        -------
+        numpy.ndarray
+            The upper bound of each coordinate
+
+        """
+        return self._upper_bounds
+
+    def get_step_sizes(self):
+        """Retrieves the current step size of each coordinate
+
+        Returns
+        -------
+        numpy.ndarray
+            The scale of the steps proposed for each coordinate
+
+        """
+        return self._step_sizes
+
+    def _draw_value(self, dimension, value):
+        """Draws a new value for a coordinate, within its bounds
+
+        Parameters
+        ----------
+        dimension: int
+            The coordinate being changed
+        value: float
+            The current value of the coordinate
+
+        Returns
+        -------
+        float
+            The new value, reflected back into the bounds if the step
+            leaves them and clipped if the reflection also leaves them
+
+        """
+        if self._proposal == "gaussian":
+            noise = self._random_buffer.normal()
+        else:
+            noise = math.tan(math.pi * (self._random_buffer.uniform() - 0.5))
+        new_value = value + self._step_sizes[dimension] * noise
+        lower = self._lower_bounds[dimension]
+        upper = self._upper_bounds[dimension]
+        if new_value < lower:
+            new_value = 2.0 * lower - new_value
+        elif new_value > upper:
+            new_value = 2.0 * upper - new_value
+        return float(min(max(new_value, lower), upper))
+
+    def pick_neighbour(self, solution):
+        """Selects a neighbour of solution by changing one coordinate
+
+        Parameters
+        ----------
+        solution: numpy.ndarray
+            A solution to the problem
+
+        Returns
+        -------
+        numpy.ndarray
+            A copy of solution with the next coordinate changed
+
+        """
+        dimension = self._next_dimension
+        self._next_dimension = (dimension + 1) % len(solution)
+        new_solution = solution.copy()
+        new_solution[dimension] = self._draw_value(dimension, solution[dimension])
+        return new_solution
+
+    def adapt_step_sizes(self):
+        """Adapts the step size of each coordinate to its acceptance rate
+        since the last adaptation, using the rule of Corana et al.
+
+        Returns
+        -------
+        None
+
+        Side Effect
+        -----------
+        Increases the step sizes of coordinates accepted more often than
+        the upper target rate, decreases those accepted less often than the
+        lower target rate, limits each step size to the width of its bounds
+        and resets the counts of proposals and acceptances
+
+        """
+        low, high = self._acceptance_range
+        rates = self._acceptances / np.maximum(self._proposals, 1)
+        factor = self._adaptation_factor
+        growth = np.where(rates > high, 1.0 + factor * (rates - high) / (1.0 - high), 1.0)
+        shrinkage = np.where(rates < low, 1.0 + factor * (low - rates) / low, 1.0)
+        self._step_sizes = np.minimum(self._step_sizes * growth / shrinkage,
+                                      self._upper_bounds - self._lower_bounds)
+        self._proposals[:] = 0
+        self._acceptances[:] = 0
+
+    def get_state(self):
+        """Retrieves the adaptation state of the problem, so that a
+        checkpointed run can be resumed exactly
+
+        Returns
+        -------
+        dict
+            A picklable dictionary holding the step sizes, the next
+            coordinate, the counts of proposals and acceptances since the
+            last adaptation and the state of the random buffer
+
+        """
+        return {"step_sizes": self._step_sizes.copy(),
+                "next_dimension": self._next_dimension,
+                "proposals": self._proposals.copy(),
+                "acceptances": self._acceptances.copy(),
+                "random_buffer": self._random_buffer.get_state()}
+
+    def set_state(self, state):
+        """Restores a state retrieved by get_state
+
+        Parameters
+        ----------
+        state: dict
+            A dictionary returned by get_state
+
+        Returns
+        -------
+        None
+
+        Side Effect
+        -----------
+        Resets the step sizes, the next coordinate, the counts of proposals
+        and acceptances and the random buffer to the values held in state
+
+        """
+        self._step_sizes = np.array(state["step_sizes"], dtype=float)
+        self._next_dimension = state["next_dimension"]
+        self._proposals = np.array(state["proposals"], dtype=int)
+        self._acceptances = np.array(state["acceptances"], dtype=int)
+        self._random_buffer.set_state(state["random_buffer"])
+
+    def supports_moves(self):
+        """Indicates that the continuous problem supports the move protocol
+
+        Returns
+        -------
+        bool
+            Always True
+
+        """
+        return True
+
+    def propose_move(self):
+        """Proposes a change to the next coordinate, adapting the step
+        sizes first if every coordinate has been proposed
+        adaptation_interval times since the last adaptation
+
+        Returns
+        -------
+        tuple
+            A two element tuple with the coordinate being changed and its
+            new value
+
+        """
+        dimension = self._next_dimension
+        if dimension == 0 and self._proposals[0] >= self._adaptation_interval:
+            self.adapt_step_sizes()
+        self._next_dimension = (dimension + 1) % len(self._proposals)
+        self._proposals[dimension] += 1
+        return dimension, self._draw_value(dimension, self.get_current_solution()[dimension])
+
+    def get_move_delta(self, move):
+        """Calculates the change in objective value caused by a move
+
+        Parameters
+        ----------
+        move: tuple
+            A two element tuple with the coordinate being changed and its
+            new value
+
+        Returns
+        -------
+        float
+            The objective value after the move minus the objective value
+            of the current solution
+
+        """
+        dimension, value = move
+        solution = self.get_current_solution()
+        old_value = solution[dimension]
+        # the objective is evaluated with the coordinate changed in place, avoiding a copy
+        solution[dimension] = value
+        try:
+            new_objective_value = self.get_objective_function()(solution)
+        finally:
+            solution[dimension] = old_value
+        return new_objective_value - self.get_current_objective_value()
+
+    def apply_move(self, move, delta):
+        """Changes a coordinate of the current solution in place
+
+        Parameters
+        ----------
+        move: tuple
+            A two element tuple with the coordinate being changed and its
+            new value
+        delta: float
+            The change in objective value caused by the move
+
+        Returns
+        -------
+        None
+
+        Side Effect
+        -----------
+        Sets the coordinate of the current solution, adds delta to the
+        current objective value and counts the move as accepted
+
+        """
+        dimension, value = move
+        solution = self.get_current_solution()
+        solution[dimension] = value
+        self._acceptances[dimension] += 1
+        super().accept_solution(OptimizationSolution(solution, self.get_current_objective_value() + delta))
+
+    def get_current_optimization_solution(self):
+        """Retrieves a copy of the current solution along with its objective value
+
+        Returns
+        -------
+        OptimizationSolution
+            An OptimizationSolution holding a copy of the current solution,
+            which is unaffected by moves applied afterwards
+
+        """
+        return OptimizationSolution(self.get_current_solution().copy(), self.get_current_objective_value())
+
+    def accept_solution(self, new_solution):
+        """Makes a copy of new_solution the current solution without
+        re-evaluating the objective function
+
+        Parameters
+        ----------
+        new_solution: OptimizationSolution
+            An OptimizationSolution whose objective value has already
+            been calculated
+
+        Returns
+        -------
+        None
+
+        Side Effect
+        -----------
+        Resets the current solution to a copy of new_solution, so that moves
+        applied afterwards do not modify new_solution
+
+        """
+        super().accept_solution(OptimizationSolution(
+                np.array(new_solution.get_solution_value(), dtype=float), new_solution.get_objective_value()))
@@ -0,0 +1,143 @@
+"""Evaluators compute objective values concurrently, for objective functions
+that are expensive enough, such as calls out to a simulator, that several
+evaluations should be in flight at once.
+
+Every evaluator provides submit, which starts evaluating a solution and
+returns a concurrent.futures.Future holding its objective value, and
+evaluate, which waits for the value. The ExecutorEvaluator runs a plain
+function in a thread or process pool, and the AsyncioEvaluator runs a
+coroutine function on an event loop in a background thread
+
+"""
+
+import asyncio
+import threading
+
+
+class ExecutorEvaluator:
+    """Evaluates an objective function in a concurrent.futures executor
+
+    Attributes
+    ----------
+    objective_function: function
+        The objective function being evaluated. It must be picklable if
+        executor is a ProcessPoolExecutor
+    executor: concurrent.futures.Executor
+        The executor in which evaluations run
+
+    """
+    def __init__(self, objective_function, executor):
+        self._objective_function = objective_function
+        self._executor = executor
+
+    def submit(self, solution_value):
+        """Starts evaluating the objective function at solution_value
+
+        Parameters
+        ----------
+        solution_value: object
+            A solution to the optimization problem
+
+        Returns
+        -------
+        concurrent.futures.Future
+            A future holding the objective value of solution_value
+
+        """
+        return self._executor.submit(self._objective_function, solution_value)
+
+    def evaluate(self, solution_value):
+        """Evaluates the objective function at solution_value, waiting for the result
+
+        Parameters
+        ----------
+        solution_value: object
+            A solution to the optimization problem
+
+        Returns
+        -------
+        float
+            The objective value of solution_value
+
+        """
+        return self.submit(solution_value).result()
+
+
+class AsyncioEvaluator:
+    """Evaluates a coroutine objective function on an asyncio event loop
+    running in a background thread
+
+    The evaluator should be closed once it is no longer needed, either by
+    calling close or by using it in a with statement
+
+    Attributes
+    ----------
+    objective_coroutine: function
+        A coroutine function taking a solution and returning its objective value
+    loop: asyncio.AbstractEventLoop
+        The event loop on which the coroutines run
+    thread: threading.Thread
+        The background thread running loop
+
+    """
+    def __init__(self, objective_coroutine):
+        self._objective_coroutine = objective_coroutine
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def submit(self, solution_value):
+        """Schedules the objective coroutine for solution_value on the event loop
+
+        Parameters
+        ----------
+        solution_value: object
+            A solution to the optimization problem
+
+        Returns
+        -------
+        concurrent.futures.Future
+            A future holding the objective value of solution_value
+
+        """
+        return asyncio.run_coroutine_threadsafe(self._objective_coroutine(solution_value), self._loop)
+
+    def evaluate(self, solution_value):
+        """Evaluates the objective coroutine at solution_value, waiting for the result
+
+        Parameters
+        ----------
+        solution_value: object
+            A solution to the optimization problem
+
+        Returns
+        -------
+        float
+            The objective value of solution_value
+
+        """
+        return self.submit(solution_value).result()
+
+    def close(self):
+        """Stops the event loop and its background thread
+
+        Returns
+        -------
+        None
+
+        Side Effect
+        -----------
+        Stops and closes loop, after which no more solutions can be submitted
+
+        """
+        if self._loop.is_closed():
+            return
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
@@ -58,3 +58,145 @@ def himmelblau(solution_tuple):
     first_term = (x ** 2) + y - 11
     second_term = x + (y ** 2) - 7
     return (first_term ** 2) + (second_term ** 2)
+
+
+def quadratic_assignment_permutation_objective(dist_matrix, flow_matrix, permutation):
+    """Calculates the objective value for the quadratic assignment problem
+    using integer indexed arrays
+
+    Parameters
+    ----------
+    dist_matrix: numpy.ndarray
+        The square matrix of distance values, where the entry in row i,
+        column j represents the distance from facility i to facility j
+    flow_matrix: numpy.ndarray
+        The square matrix of flow values, where the entry in row i,
+        column j represents the flow from facility i to facility j
+    permutation: numpy.ndarray
+        An array of integers representing an ordering of the facilities,
+        where each entry is the row index of a facility in dist_matrix
+
+    Returns
+    -------
+    float
+        The objective value for the solution given by permutation to
+        the quadratic assignment problem
+
+    """
+    if len(permutation) == 0:
+        return 0
+    return float((dist_matrix[np.ix_(permutation, permutation)] * flow_matrix).sum())
+
+
+def quadratic_assignment_swap_delta(dist_matrix, flow_matrix, permutation, first, second):
+    """Calculates the change in the quadratic assignment objective caused
+    by swapping two entries of permutation
+
+    Only the rows and columns corresponding to the two swapped entries
+    change, so the difference is computed in O(n) time rather than
+    recomputing the O(n^2) objective
+
+    Parameters
+    ----------
+    dist_matrix: numpy.ndarray
+        The square matrix of distance values, where the entry in row i,
+        column j represents the distance from facility i to facility j
+    flow_matrix: numpy.ndarray
+        The square matrix of flow values, where the entry in row i,
+        column j represents the flow from facility i to facility j
+    permutation: numpy.ndarray
+        An array of integers representing an ordering of the facilities,
+        where each entry is the row index of a facility in dist_matrix
+    first: int
+        The position of the first entry of permutation being swapped
+    second: int
+        The position of the second entry of permutation being swapped
+
+    Returns
+    -------
+    float
+        The objective value of the swapped permutation minus the objective
+        value of permutation
+
+    """
+    r, s = first, second
+    if r == s:
+        return 0.0
+    pr, ps = permutation[r], permutation[s]
+    row_diff = dist_matrix[ps, permutation] - dist_matrix[pr, permutation]
+    col_diff = dist_matrix[permutation, ps] - dist_matrix[permutation, pr]
+    delta = (np.dot(flow_matrix[r] - flow_matrix[s], row_diff) +
+             np.dot(flow_matrix[:, r] - flow_matrix[:, s], col_diff))
+    # the sums above treat the swapped positions like every other position,
+    # so their terms are replaced by the exact change for the 2x2 block
+    delta -= ((flow_matrix[r, r] - flow_matrix[s, r]) * row_diff[r] +
+              (flow_matrix[r, s] - flow_matrix[s, s]) * row_diff[s] +
+              (flow_matrix[r, r] - flow_matrix[r, s]) * col_diff[r] +
+              (flow_matrix[s, r] - flow_matrix[s, s]) * col_diff[s])
+    delta += ((flow_matrix[r, r] - flow_matrix[s, s]) * (dist_matrix[ps, ps] - dist_matrix[pr, pr]) +
+              (flow_matrix[r, s] - flow_matrix[s, r]) * (dist_matrix[ps, pr] - dist_matrix[pr, ps]))
+    return float(delta)
+
+
+def himmelblau_batch(solutions):
+    """A vectorized implementation of the himmelblau function
+
+    Parameters
+    ----------
+    solutions: numpy.ndarray
+        An array of shape (N, 2) in which each row contains the x and y
+        coordinates of a solution to the himmelblau function
+
+    Returns
+    -------
+    numpy.ndarray
+        An array of length N containing the value of the himmelblau
+        function at each row of solutions
+
+    """
+    solutions = np.asarray(solutions, dtype=float)
+    x = solutions[:, 0]
+    y = solutions[:, 1]
+    first_term = (x ** 2) + y - 11
+    second_term = x + (y ** 2) - 7
+    return (first_term ** 2) + (second_term ** 2)
+
+
+def quadratic_assignment_objective_batch(dist_matrix, flow_matrix, permutations, max_chunk_elements=2 ** 22):
+    """A vectorized implementation of the objective function of the
+    quadratic assignment problem for a batch of permutations
+
+    The permuted distance matrices of a chunk of rows are gathered at once,
+    so the rows are processed in chunks to bound the memory used
+
+    Parameters
+    ----------
+    dist_matrix: numpy.ndarray
+        A square matrix, specifying the distances between the facilities
+    flow_matrix: numpy.ndarray
+        A square matrix, specifying the flows between facilities
+    permutations: numpy.ndarray
+        An integer array of shape (N, n) in which each row is a permutation
+        of facility indices, as used by quadratic_assignment_permutation_objective
+    max_chunk_elements: int
+        The largest number of permuted distances gathered at once. Each
+        chunk holds at least one row, so n^2 entries
+
+    Returns
+    -------
+    numpy.ndarray
+        An array of length N containing the objective value of each row
+        of permutations
+
+    """
+    permutations = np.asarray(permutations, dtype=np.intp)
+    size = permutations.shape[1]
+    if size == 0:
+        return np.zeros(len(permutations))
+    chunk_size = max(1, max_chunk_elements // (size * size))
+    objective_values = np.empty(len(permutations), dtype=np.result_type(dist_matrix, flow_matrix))
+    for start in range(0, len(permutations), chunk_size):
+        chunk = permutations[start:start + chunk_size]
+        permuted_distances = dist_matrix[chunk[:, :, None], chunk[:, None, :]]
+        objective_values[start:start + chunk_size] = np.einsum("kij,ij->k", permuted_distances, flow_matrix)
+    return objective_values
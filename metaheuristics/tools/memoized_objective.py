@@ -0,0 +1,188 @@
+"""The MemoizedObjective class wraps an objective function with a cache of
+the objective values of recently evaluated solutions. When a metaheuristic
+algorithm revisits a solution, as simulated annealing does repeatedly at low
+temperatures on discrete problems, the cached value is returned instead of
+evaluating the objective function again.
+
+The cache holds at most max_size values and evicts the least recently used
+value when full. It is only worthwhile for objective functions that are
+expensive compared with hashing a solution
+
+"""
+
+from collections import OrderedDict
+import numpy as np
+
+
+def make_solution_key(solution):
+    """Converts a solution to a hashable key identifying it
+
+    Parameters
+    ----------
+    solution: object
+        A solution to an optimization problem. NumPy arrays are keyed on
+        their shape, type and raw bytes, lists on the tuple of their
+        elements and any other solution is used as its own key
+
+    Returns
+    -------
+    object
+        A hashable key, equal for equal solutions
+
+    """
+    if isinstance(solution, np.ndarray):
+        return solution.shape, solution.dtype.str, solution.tobytes()
+    if isinstance(solution, list):
+        return tuple(solution)
+    return solution
+
+
+class MemoizedObjective:
+    """An objective function with a bounded cache of its values
+
+    A MemoizedObjective object is called in the same way as the objective
+    function it wraps, so it can be passed to an OptimizationProblem in place
+    of that function
+
+    Attributes
+    ----------
+    objective_function: function
+        The objective function whose values are cached
+    max_size: int
+        The largest number of values held in the cache
+    key_function: function
+        A function converting a solution to a hashable key
+    cache: collections.OrderedDict
+        The cached objective values keyed by solution, from the least to
+        the most recently used
+    hits: int
+        The number of evaluations answered from the cache
+    misses: int
+        The number of evaluations of objective_function
+
+    Parameters
+    ----------
+    objective_function: function
+        The objective function whose values are cached
+    max_size: int
+        The largest number of values held in the cache
+    key_function: function
+        An optional function converting a solution to a hashable key. If
+        omitted, make_solution_key is used
+
+    """
+    def __init__(self, objective_function, max_size=10000, key_function=None):
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self._objective_function = objective_function
+        self._max_size = max_size
+        self._key_function = key_function if key_function is not None else make_solution_key
+        self._cache = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def __call__(self, solution):
+        """Calculates the objective value of solution, using the cached
+        value if solution has been evaluated recently
+
+        Parameters
+        ----------
+        solution: object
+            A solution to the optimization problem
+
+        Returns
+        -------
+        float
+            The objective value of solution
+
+        Side Effect
+        -----------
+        Marks the value of solution as the most recently used, adding it
+        to the cache and evicting the least recently used value if needed
+
+        """
+        key = self._key_function(solution)
+        objective_value = self._cache.get(key)
+        if objective_value is not None:
+            self._hits += 1
+            self._cache.move_to_end(key)
+            return objective_value
+        self._misses += 1
+        objective_value = self._objective_function(solution)
+        self._cache[key] = objective_value
+        if len(self._cache) > self._max_size:
+            self._cache.popitem(last=False)
+        return objective_value
+
+    def get_objective_function(self):
+        """Retrieves the objective function whose values are cached
+
+        Returns
+        -------
+        function
+            The wrapped objective function
+
+        """
+        return self._objective_function
+
+    def get_size(self):
+        """Retrieves the number of values held in the cache
+
+        Returns
+        -------
+        int
+            The number of cached objective values
+
+        """
+        return len(self._cache)
+
+    def get_hits(self):
+        """Retrieves the number of evaluations answered from the cache
+
+        Returns
+        -------
+        int
+            The number of cache hits
+
+        """
+        return self._hits
+
+    def get_misses(self):
+        """Retrieves the number of evaluations of the objective function
+
+        Returns
+        -------
+        int
+            The number of cache misses
+
+        """
+        return self._misses
+
+    def get_hit_rate(self):
+        """Calculates the fraction of evaluations answered from the cache
+
+        Returns
+        -------
+        float
+            The number of hits divided by the number of evaluations, or 0
+            if there have been no evaluations
+
+        """
+        evaluations = self._hits + self._misses
+        return self._hits / evaluations if evaluations > 0 else 0.0
+
+    def clear(self):
+        """Empties the cache and resets the hit and miss counts
+
+        Returns
+        -------
+        None
+
+        Side Effect
+        -----------
+        Removes every cached value and sets hits and misses to 0
+
+        """
+        self._cache.clear()
+        self._hits = 0
+        self._misses = 0
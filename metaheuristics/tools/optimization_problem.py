@@ -4,6 +4,7 @@ to move from one solution to a neighbouring solution
 
 """
 
+import numpy as np
 from metaheuristics.tools.optimization_solution import OptimizationSolution
 
 class OptimizationProblem:
@@ -29,6 +30,9 @@ class OptimizationProblem:
         solution. A common characteristic of metaheuristic algorithms is taking one
         solution and applying some transformation to move to another solution,
         also known as a neighbour.
+    batch_objective_function: function
+        An optional vectorized version of objective_function, taking a stacked
+        array of solutions and returning an array of their objective values
 
     Parameters
     ----------
@@ -47,11 +51,16 @@ class OptimizationProblem:
     current_solution: OptimizationSolution
         An OptimizationSolution representing the current solution to the optimization
         problem
+    batch_objective_function: function
+        An optional vectorized version of objective_function. It takes a
+        single parameter, an array stacking solutions along its first axis,
+        and returns an array with the objective value of each solution
 
     """
-    def __init__(self, initial_solution_value, objective_function, solution_updater):
+    def __init__(self, initial_solution_value, objective_function, solution_updater, batch_objective_function=None):
         self._objective_function = objective_function
         self._solution_updater = solution_updater
+        self._batch_objective_function = batch_objective_function
         self._current_solution = OptimizationSolution(
                 initial_solution_value, objective_function(initial_solution_value))
 
@@ -66,6 +75,19 @@ class OptimizationProblem:
         """
         return self._current_solution.get_solution_value()
 
+    def get_current_optimization_solution(self):
+        """Retrieves the current solution to the optimization problem
+        along with its objective value
+
+        Returns
+        -------
+        OptimizationSolution
+            An OptimizationSolution representing the current solution
+            to the optimization problem
+
+        """
+        return self._current_solution
+
     def get_objective_function(self):
         """Retrieves the objective function for the optimization problem
 
@@ -77,6 +99,40 @@ class OptimizationProblem:
         """
         return self._objective_function
 
+    def get_batch_objective_function(self):
+        """Retrieves the vectorized objective function of the problem
+
+        Returns
+        -------
+        function
+            The vectorized objective function, or None if the problem does
+            not have one
+
+        """
+        return self._batch_objective_function
+
+    def evaluate_batch(self, solution_values):
+        """Calculates the objective values of a batch of solutions
+
+        Parameters
+        ----------
+        solution_values: numpy.ndarray or list
+            The solutions to evaluate, stacked along the first axis of an
+            array if batch_objective_function is used
+
+        Returns
+        -------
+        numpy.ndarray
+            The objective value of each solution. They are calculated with
+            batch_objective_function if the problem has one, and otherwise
+            by calling objective_function on each solution
+
+        """
+        if self._batch_objective_function is not None:
+            return np.asarray(self._batch_objective_function(solution_values), dtype=float)
+        return np.array([self._objective_function(solution_value) for solution_value in solution_values],
+                        dtype=float)
+
     def get_current_objective_value(self):
         """Retrieves the objective value of the current solution to the
         optimization problem
@@ -101,11 +157,23 @@ class OptimizationProblem:
             current solution
 
         """
-        curr_solution_val = self._current_solution.get_solution_value()
-        new_solution_val = self._solution_updater(curr_solution_val)
+        new_solution_val = self.find_neighbour_solution_value()
         return OptimizationSolution(
                 new_solution_val, self._objective_function(new_solution_val))
 
+    def find_neighbour_solution_value(self):
+        """Applies the solution_updater function to the current solution
+        without evaluating the objective function at the neighbour, so
+        the neighbour can be evaluated elsewhere
+
+        Returns
+        -------
+        object
+            The value of a neighbour of the current solution
+
+        """
+        return self._solution_updater(self._current_solution.get_solution_value())
+
     def update_current_solution(self, new_solution_val):
         """Updates the current solution of the optimization problem
         to new_solution_val
@@ -127,3 +195,136 @@ class OptimizationProblem:
         """
         self._current_solution = OptimizationSolution(
                 new_solution_val, self.get_objective_function()(new_solution_val))
+
+    def accept_solution(self, new_solution):
+        """Makes new_solution the current solution of the optimization
+        problem without re-evaluating the objective function
+
+        Parameters
+        ----------
+        new_solution: OptimizationSolution
+            An OptimizationSolution whose objective value has already
+            been calculated, such as one returned by find_neighbour_solution
+
+        Returns
+        -------
+        None
+
+        Side Effect
+        -----------
+        Resets the current_solution attribute to new_solution
+
+        """
+        self._current_solution = new_solution
+
+    def get_state(self):
+        """Retrieves any state the problem keeps besides its current
+        solution, so that a checkpointed run can be resumed exactly
+
+        Returns
+        -------
+        dict
+            A picklable dictionary with the state of the problem, which is
+            empty since an OptimizationProblem only keeps its current solution
+
+        """
+        return {}
+
+    def set_state(self, state):
+        """Restores a state retrieved by get_state
+
+        Parameters
+        ----------
+        state: dict
+            A dictionary returned by get_state
+
+        Returns
+        -------
+        None
+
+        """
+        pass
+
+    def supports_moves(self):
+        """Indicates whether the optimization problem supports the move
+        protocol given by propose_move, get_move_delta, apply_move and
+        reject_move
+
+        Under the move protocol a neighbour is described by a move object
+        rather than a new solution. The change in objective value caused
+        by the move is computed without building the neighbour, and the
+        move is applied to the current solution in place only if accepted
+
+        Returns
+        -------
+        bool
+            True if the move protocol is supported, otherwise False. Problems
+            only providing a solution_updater do not support it
+
+        """
+        return False
+
+    def propose_move(self):
+        """Proposes a move from the current solution to a neighbour solution
+
+        Returns
+        -------
+        object
+            A move object describing the neighbour solution
+
+        """
+        raise NotImplementedError("This optimization problem does not support moves")
+
+    def get_move_delta(self, move):
+        """Calculates the change in objective value caused by a move
+
+        Parameters
+        ----------
+        move: object
+            A move object returned by propose_move
+
+        Returns
+        -------
+        float
+            The objective value of the neighbour described by move minus
+            the objective value of the current solution
+
+        """
+        raise NotImplementedError("This optimization problem does not support moves")
+
+    def apply_move(self, move, delta):
+        """Applies a move to the current solution in place
+
+        Parameters
+        ----------
+        move: object
+            A move object returned by propose_move
+        delta: float
+            The change in objective value caused by move, as returned
+            by get_move_delta
+
+        Returns
+        -------
+        None
+
+        Side Effect
+        -----------
+        Changes the current solution to the neighbour described by move
+
+        """
+        raise NotImplementedError("This optimization problem does not support moves")
+
+    def reject_move(self, move):
+        """Discards a move that was proposed but not accepted
+
+        Parameters
+        ----------
+        move: object
+            A move object returned by propose_move
+
+        Returns
+        -------
+        None
+
+        """
+        pass
@@ -0,0 +1,228 @@
+"""The QAPInstance class is a compact representation of an instance of the
+quadratic assignment problem. Facility labels are converted to integer
+indices once, the flow and distance matrices are stored as contiguous NumPy
+arrays and solutions are represented as integer permutations, so labels are
+only needed when reading input and reporting output
+
+"""
+
+import numpy as np
+from metaheuristics.tools.functions import quadratic_assignment_objective_batch, \
+    quadratic_assignment_permutation_objective, quadratic_assignment_swap_delta
+
+
+class QAPInstance:
+    """A container class for an instance of the quadratic assignment problem
+
+    Attributes
+    ----------
+    flow_matrix: numpy.ndarray
+        A contiguous square matrix, specifying the flows between facilities
+    dist_matrix: numpy.ndarray
+        A contiguous square matrix, specifying the distances between the facilities
+    labels: list
+        The labels of the facilities, where the label of the facility with
+        index i is at position i
+
+    Parameters
+    ----------
+    flow_matrix: pandas.DataFrame or numpy.ndarray
+        A square matrix, specifying the flows between facilities
+    dist_matrix: pandas.DataFrame or numpy.ndarray
+        A square matrix, specifying the distances between the facilities
+    labels: list
+        The labels of the facilities. If omitted, the index of dist_matrix
+        is used when it is a DataFrame and the integers 0 to n - 1 otherwise
+
+    """
+    def __init__(self, flow_matrix, dist_matrix, labels=None):
+        self._flow_matrix = np.ascontiguousarray(flow_matrix, dtype=float)
+        self._dist_matrix = np.ascontiguousarray(dist_matrix, dtype=float)
+        if (self._flow_matrix.ndim != 2 or self._flow_matrix.shape[0] != self._flow_matrix.shape[1] or
+                self._flow_matrix.shape != self._dist_matrix.shape):
+            raise ValueError("flow_matrix and dist_matrix must be square matrices of the same size")
+        if labels is None:
+            labels = list(dist_matrix.index) if hasattr(dist_matrix, "index") else list(range(len(self._dist_matrix)))
+        self._labels = list(labels)
+        self._label_indices = {label: idx for idx, label in enumerate(self._labels)}
+
+    def get_size(self):
+        """Retrieves the number of facilities in the instance
+
+        Returns
+        -------
+        int
+            The number of facilities
+
+        """
+        return len(self._labels)
+
+    def get_labels(self):
+        """Retrieves the labels of the facilities
+
+        Returns
+        -------
+        list
+            The labels of the facilities, ordered by facility index
+
+        """
+        return self._labels
+
+    def get_flow_matrix(self):
+        """Retrieves the flow matrix of the instance
+
+        Returns
+        -------
+        numpy.ndarray
+            The square matrix of flows between facilities
+
+        """
+        return self._flow_matrix
+
+    def get_dist_matrix(self):
+        """Retrieves the distance matrix of the instance
+
+        Returns
+        -------
+        numpy.ndarray
+            The square matrix of distances between facilities
+
+        """
+        return self._dist_matrix
+
+    def encode(self, facility_order):
+        """Converts an ordering of facility labels to a permutation of
+        facility indices
+
+        Parameters
+        ----------
+        facility_order: list
+            A list of facility labels representing an ordering of the facilities
+
+        Returns
+        -------
+        numpy.ndarray
+            An array of integers with the index of each facility in facility_order
+
+        """
+        return np.array([self._label_indices[label] for label in facility_order], dtype=np.intp)
+
+    def decode(self, permutation):
+        """Converts a permutation of facility indices to an ordering of
+        facility labels
+
+        Parameters
+        ----------
+        permutation: numpy.ndarray
+            An array of integers representing an ordering of the facilities
+
+        Returns
+        -------
+        list
+            The facility labels in the order given by permutation
+
+        """
+        return [self._labels[idx] for idx in permutation]
+
+    def calculate_objective(self, permutation):
+        """Calculates the objective value of a permutation
+
+        Parameters
+        ----------
+        permutation: numpy.ndarray
+            An array of integers representing an ordering of the facilities
+
+        Returns
+        -------
+        float
+            The objective value of permutation
+
+        """
+        return quadratic_assignment_permutation_objective(
+                self._dist_matrix, self._flow_matrix, permutation)
+
+    def calculate_objective_batch(self, permutations):
+        """Calculates the objective values of a batch of permutations
+
+        Parameters
+        ----------
+        permutations: numpy.ndarray
+            An integer array of shape (N, n) in which each row represents
+            an ordering of the facilities
+
+        Returns
+        -------
+        numpy.ndarray
+            An array of length N with the objective value of each permutation
+
+        """
+        return quadratic_assignment_objective_batch(self._dist_matrix, self._flow_matrix, permutations)
+
+    def calculate_swap_delta(self, permutation, first, second):
+        """Calculates the change in objective value caused by swapping two
+        entries of permutation, in O(n) time
+
+        Parameters
+        ----------
+        permutation: numpy.ndarray
+            An array of integers representing an ordering of the facilities
+        first: int
+            The position of the first entry being swapped
+        second: int
+            The position of the second entry being swapped
+
+        Returns
+        -------
+        float
+            The objective value after the swap minus the objective value
+            of permutation
+
+        """
+        return quadratic_assignment_swap_delta(
+                self._dist_matrix, self._flow_matrix, permutation, first, second)
+
+    def swap(self, permutation, first, second):
+        """Swaps two entries of permutation in place
+
+        Parameters
+        ----------
+        permutation: numpy.ndarray
+            An array of integers representing an ordering of the facilities
+        first: int
+            The position of the first entry being swapped
+        second: int
+            The position of the second entry being swapped
+
+        Returns
+        -------
+        None
+
+        Side Effect
+        -----------
+        Exchanges the entries of permutation at positions first and second
+
+        """
+        permutation[first], permutation[second] = permutation[second], permutation[first]
+
+    def undo_swap(self, permutation, first, second):
+        """Reverts a swap previously applied to permutation with swap
+
+        Parameters
+        ----------
+        permutation: numpy.ndarray
+            An array of integers that was modified by swap
+        first: int
+            The position of the first entry that was swapped
+        second: int
+            The position of the second entry that was swapped
+
+        Returns
+        -------
+        None
+
+        Side Effect
+        -----------
+        Restores the entries of permutation at positions first and second
+
+        """
+        self.swap(permutation, first, second)
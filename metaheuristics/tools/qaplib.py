@@ -0,0 +1,129 @@
+"""Loads instances of the quadratic assignment problem in the QAPLIB format.
+
+A QAPLIB file holds the number of facilities n followed by two n by n
+matrices A and B, and the objective value of a permutation p is the sum of
+a_ij * b_p(i)p(j). This matches quadratic_assignment_permutation_objective
+when A is taken as the flow matrix and B as the distance matrix.
+
+Files are parsed one line at a time into a preallocated NumPy array, so no
+intermediate list of every number is built. The parsed matrices can be
+cached in the NumPy binary format next to the file, where later loads
+memory-map them instead of parsing the text again. Worker processes loading
+the same instance then share the pages of the cached file
+
+"""
+
+import os
+import numpy as np
+
+
+def read_qaplib(file_path):
+    """Parses a QAPLIB file into a single NumPy array
+
+    Parameters
+    ----------
+    file_path: str
+        The path of the QAPLIB file
+
+    Returns
+    -------
+    numpy.ndarray
+        An array of shape (2, n, n), holding the flow matrix followed by
+        the distance matrix of the instance
+
+    Raises
+    ------
+    ValueError
+        If the file does not hold exactly two n by n matrices after the
+        number of facilities
+
+    """
+    size = None
+    matrices = None
+    filled = 0
+    with open(file_path) as qaplib_file:
+        for line in qaplib_file:
+            values = line.split()
+            if size is None:
+                if not values:
+                    continue
+                size = int(values[0])
+                matrices = np.empty(2 * size * size, dtype=float)
+                values = values[1:]
+            if not values:
+                continue
+            if filled + len(values) > len(matrices):
+                raise ValueError("{0} holds more than two {1} by {1} matrices".format(file_path, size))
+            matrices[filled:filled + len(values)] = np.array(values, dtype=float)
+            filled += len(values)
+    if size is None or filled != len(matrices):
+        raise ValueError("{0} does not hold two complete matrices".format(file_path))
+    return matrices.reshape(2, size, size)
+
+
+def get_cache_path(file_path, cache_dir=None):
+    """Determines the path of the binary cache of a QAPLIB file
+
+    Parameters
+    ----------
+    file_path: str
+        The path of the QAPLIB file
+    cache_dir: str
+        An optional directory holding the cache. If omitted, the cache
+        sits next to the QAPLIB file
+
+    Returns
+    -------
+    str
+        The path of the .npy file caching the parsed matrices
+
+    """
+    directory, file_name = os.path.split(os.path.abspath(file_path))
+    if cache_dir is not None:
+        directory = cache_dir
+    return os.path.join(directory, os.path.splitext(file_name)[0] + ".npy")
+
+
+def load_qaplib(file_path, cache_dir=None, use_cache=True, mmap_mode="r"):
+    """Loads the flow and distance matrices of a QAPLIB file
+
+    The matrices are read from the binary cache if it is newer than the
+    QAPLIB file. Otherwise the file is parsed and, if use_cache is True,
+    the cache is written for later loads
+
+    Parameters
+    ----------
+    file_path: str
+        The path of the QAPLIB file
+    cache_dir: str
+        An optional directory holding the cache. If omitted, the cache
+        sits next to the QAPLIB file
+    use_cache: bool
+        If False, the file is always parsed and no cache is written
+    mmap_mode: str
+        The mode used to memory-map the cache, as for numpy.load. If None,
+        the cache is read into memory
+
+    Returns
+    -------
+    numpy.ndarray, numpy.ndarray
+        The flow matrix and the distance matrix of the instance, which can
+        be passed to quadratic_assignment_simulated_annealing_solver or a
+        QAPInstance. The facilities are labelled 0 to n - 1
+
+    """
+    if not use_cache:
+        matrices = read_qaplib(file_path)
+        return matrices[0], matrices[1]
+    cache_path = get_cache_path(file_path, cache_dir)
+    if not os.path.exists(cache_path) or os.path.getmtime(cache_path) < os.path.getmtime(file_path):
+        matrices = read_qaplib(file_path)
+        if cache_dir is not None:
+            os.makedirs(cache_dir, exist_ok=True)
+        # written under a temporary name, so concurrent loads never read a partial cache
+        temporary_path = "{0}.{1}.tmp".format(cache_path, os.getpid())
+        with open(temporary_path, "wb") as cache_file:
+            np.save(cache_file, matrices)
+        os.replace(temporary_path, cache_path)
+    matrices = np.load(cache_path, mmap_mode=mmap_mode)
+    return matrices[0], matrices[1]
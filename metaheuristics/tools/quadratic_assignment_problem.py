@@ -0,0 +1,259 @@
+"""The QuadraticAssignmentProblem class is an OptimizationProblem specialized
+to the quadratic assignment problem. Solutions are stored as integer
+permutations and neighbours are scored using the change in objective value
+caused by a swap, rather than by recomputing the objective from scratch
+
+"""
+
+import random
+import numpy as np
+from metaheuristics.tools.optimization_problem import OptimizationProblem
+from metaheuristics.tools.optimization_solution import OptimizationSolution
+
+
+class QuadraticAssignmentProblem(OptimizationProblem):
+    """A class to maintain a quadratic assignment problem to be solved
+    using a metaheuristic algorithm
+
+    Neighbours are obtained by swapping two facilities in the current
+    ordering. Since the swap is known, the objective value of a neighbour
+    is computed from the objective value of the current solution in O(n)
+
+    The problem supports the move protocol of OptimizationProblem, where a
+    move is a tuple with the two positions being swapped. Accepted moves
+    are applied to the current permutation in place, so the solutions
+    returned by get_current_optimization_solution and kept by
+    accept_solution are copies of the permutation
+
+    Attributes
+    ----------
+    qap_instance: QAPInstance
+        The instance of the quadratic assignment problem being solved
+    random_buffer: RandomBuffer
+        The RandomBuffer from which the facilities to swap are chosen, or
+        None if the global random state is used
+
+    Parameters
+    ----------
+    qap_instance: QAPInstance
+        The instance of the quadratic assignment problem being solved
+    initial_permutation: numpy.ndarray
+        An initial solution to the quadratic assignment problem, that is
+        an array of facility indices representing an ordering of the
+        facilities. An ordering of facility labels can be converted with
+        QAPInstance.encode
+    random_buffer: RandomBuffer
+        An optional RandomBuffer from which the facilities to swap are
+        chosen. If omitted, the global random state is used
+
+    """
+    def __init__(self, qap_instance, initial_permutation, random_buffer=None):
+        self._qap_instance = qap_instance
+        self._random_buffer = random_buffer
+        super().__init__(np.array(initial_permutation, dtype=np.intp), qap_instance.calculate_objective,
+                         self.pick_swap_neighbour, qap_instance.calculate_objective_batch)
+
+    def get_qap_instance(self):
+        """Retrieves the instance of the quadratic assignment problem
+
+        Returns
+        -------
+        QAPInstance
+            The instance of the quadratic assignment problem being solved
+
+        """
+        return self._qap_instance
+
+    def get_facility_order(self, permutation):
+        """Converts a permutation of facility indices to the corresponding
+        ordering of facility labels
+
+        Parameters
+        ----------
+        permutation: numpy.ndarray
+            An array of integers representing an ordering of the facilities
+
+        Returns
+        -------
+        list
+            The facility labels in the order given by permutation
+
+        """
+        return self._qap_instance.decode(permutation)
+
+    def _pick_swap_positions(self, size):
+        """Picks two distinct positions of a permutation of length size
+
+        Parameters
+        ----------
+        size: int
+            The length of the permutation
+
+        Returns
+        -------
+        int, int
+            The two positions to swap
+
+        """
+        if self._random_buffer is None:
+            return tuple(random.sample(range(size), 2))
+        return self._random_buffer.index_pair(size)
+
+    def calculate_swap_delta(self, first, second):
+        """Calculates the change in objective value caused by swapping
+        two facilities in the current solution
+
+        Parameters
+        ----------
+        first: int
+            The position of the first facility being swapped
+        second: int
+            The position of the second facility being swapped
+
+        Returns
+        -------
+        float
+            The objective value after the swap minus the objective
+            value of the current solution
+
+        """
+        return self._qap_instance.calculate_swap_delta(self.get_current_solution(), first, second)
+
+    def pick_swap_neighbour(self, permutation):
+        """Selects a neighbour of permutation by swapping two randomly
+        chosen facilities
+
+        Parameters
+        ----------
+        permutation: numpy.ndarray
+            An array of integers representing an ordering of the facilities
+
+        Returns
+        -------
+        numpy.ndarray
+            A copy of permutation with two random facilities swapped
+
+        """
+        first, second = self._pick_swap_positions(len(permutation))
+        new_permutation = permutation.copy()
+        self._qap_instance.swap(new_permutation, first, second)
+        return new_permutation
+
+    def find_neighbour_solution(self):
+        """Finds a neighbour of the current solution by swapping two
+        randomly chosen facilities
+
+        Returns
+        -------
+        OptimizationSolution
+            An OptimizationSolution representing a neighbour of the
+            current solution. Its objective value is obtained from the
+            objective value of the current solution and the swap delta
+
+        """
+        curr_permutation = self.get_current_solution()
+        first, second = self._pick_swap_positions(len(curr_permutation))
+        new_objective_value = self.get_current_objective_value() + self.calculate_swap_delta(first, second)
+        new_permutation = curr_permutation.copy()
+        self._qap_instance.swap(new_permutation, first, second)
+        return OptimizationSolution(new_permutation, new_objective_value)
+
+    def get_current_optimization_solution(self):
+        """Retrieves a copy of the current solution to the quadratic
+        assignment problem along with its objective value
+
+        Returns
+        -------
+        OptimizationSolution
+            An OptimizationSolution holding a copy of the current permutation,
+            which is unaffected by moves applied afterwards
+
+        """
+        return OptimizationSolution(self.get_current_solution().copy(), self.get_current_objective_value())
+
+    def accept_solution(self, new_solution):
+        """Makes a copy of new_solution the current solution without
+        re-evaluating the objective function
+
+        Parameters
+        ----------
+        new_solution: OptimizationSolution
+            An OptimizationSolution whose objective value has already
+            been calculated
+
+        Returns
+        -------
+        None
+
+        Side Effect
+        -----------
+        Resets the current solution to a copy of new_solution, so that moves
+        applied afterwards do not modify new_solution
+
+        """
+        super().accept_solution(OptimizationSolution(
+                new_solution.get_solution_value().copy(), new_solution.get_objective_value()))
+
+    def supports_moves(self):
+        """Indicates that the quadratic assignment problem supports the
+        move protocol
+
+        Returns
+        -------
+        bool
+            Always True
+
+        """
+        return True
+
+    def propose_move(self):
+        """Proposes a swap of two randomly chosen facilities
+
+        Returns
+        -------
+        tuple
+            A two element tuple with the positions of the facilities to swap
+
+        """
+        return self._pick_swap_positions(self._qap_instance.get_size())
+
+    def get_move_delta(self, move):
+        """Calculates the change in objective value caused by a swap in O(n)
+
+        Parameters
+        ----------
+        move: tuple
+            A two element tuple with the positions of the facilities to swap
+
+        Returns
+        -------
+        float
+            The objective value after the swap minus the objective value
+            of the current solution
+
+        """
+        return self.calculate_swap_delta(move[0], move[1])
+
+    def apply_move(self, move, delta):
+        """Swaps two facilities of the current solution in place
+
+        Parameters
+        ----------
+        move: tuple
+            A two element tuple with the positions of the facilities to swap
+        delta: float
+            The change in objective value caused by the swap
+
+        Returns
+        -------
+        None
+
+        Side Effect
+        -----------
+        Swaps the facilities of the current permutation and adds delta to
+        the current objective value
+
+        """
+        permutation = self.get_current_solution()
+        self._qap_instance.swap(permutation, move[0], move[1])
+        super().accept_solution(OptimizationSolution(permutation, self.get_current_objective_value() + delta))
@@ -0,0 +1,163 @@
+"""The RandomBuffer class supplies the random numbers used by a metaheuristic
+algorithm from a single numpy.random.Generator. Numbers are drawn in large
+blocks and handed out one at a time, which avoids the overhead of calling
+into NumPy for every number and keeps a run reproducible from one seed
+
+"""
+
+import numpy as np
+
+
+class RandomBuffer:
+    """A buffer of random numbers drawn in blocks from a numpy.random.Generator
+
+    Attributes
+    ----------
+    generator: numpy.random.Generator
+        The generator from which blocks of random numbers are drawn
+    buffer_size: int
+        The number of random numbers drawn in each block
+
+    Parameters
+    ----------
+    seed: int, numpy.random.SeedSequence or numpy.random.Generator
+        An optional seed for the generator, or the generator itself
+    buffer_size: int
+        The number of random numbers drawn in each block
+
+    """
+    def __init__(self, seed=None, buffer_size=4096):
+        self._generator = np.random.default_rng(seed)
+        self._buffer_size = buffer_size
+        self._uniforms = []
+        self._uniform_position = 0
+        self._exponentials = []
+        self._exponential_position = 0
+        self._normals = []
+        self._normal_position = 0
+
+    def get_generator(self):
+        """Retrieves the generator from which random numbers are drawn
+
+        Returns
+        -------
+        numpy.random.Generator
+            The generator used by the buffer
+
+        """
+        return self._generator
+
+    def get_state(self):
+        """Retrieves the state of the buffer, from which the same sequence
+        of random numbers can be produced again
+
+        Returns
+        -------
+        dict
+            A picklable dictionary with the state of the generator and the
+            random numbers drawn but not yet handed out
+
+        """
+        return {"generator": self._generator.bit_generator.state,
+                "uniforms": self._uniforms[self._uniform_position:],
+                "exponentials": self._exponentials[self._exponential_position:],
+                "normals": self._normals[self._normal_position:]}
+
+    def set_state(self, state):
+        """Restores a state retrieved by get_state
+
+        Parameters
+        ----------
+        state: dict
+            A dictionary returned by get_state
+
+        Returns
+        -------
+        None
+
+        Side Effect
+        -----------
+        Resets the generator and the buffered random numbers, so the buffer
+        hands out the same random numbers as the buffer the state was
+        retrieved from
+
+        """
+        self._generator.bit_generator.state = state["generator"]
+        self._uniforms = list(state["uniforms"])
+        self._uniform_position = 0
+        self._exponentials = list(state["exponentials"])
+        self._exponential_position = 0
+        self._normals = list(state.get("normals", []))
+        self._normal_position = 0
+
+    def uniform(self):
+        """Retrieves the next random number in the range [0, 1)
+
+        Returns
+        -------
+        float
+            A random number drawn uniformly from [0, 1)
+
+        """
+        if self._uniform_position == len(self._uniforms):
+            self._uniforms = self._generator.random(self._buffer_size).tolist()
+            self._uniform_position = 0
+        value = self._uniforms[self._uniform_position]
+        self._uniform_position += 1
+        return value
+
+    def exponential(self):
+        """Retrieves the next standard exponential random number, which has
+        the distribution of -log(u) for u drawn uniformly from (0, 1]
+
+        Returns
+        -------
+        float
+            A random number drawn from the exponential distribution with
+            mean 1
+
+        """
+        if self._exponential_position == len(self._exponentials):
+            self._exponentials = self._generator.standard_exponential(self._buffer_size).tolist()
+            self._exponential_position = 0
+        value = self._exponentials[self._exponential_position]
+        self._exponential_position += 1
+        return value
+
+    def normal(self):
+        """Retrieves the next standard normal random number
+
+        Returns
+        -------
+        float
+            A random number drawn from the normal distribution with mean 0
+            and standard deviation 1
+
+        """
+        if self._normal_position == len(self._normals):
+            self._normals = self._generator.standard_normal(self._buffer_size).tolist()
+            self._normal_position = 0
+        value = self._normals[self._normal_position]
+        self._normal_position += 1
+        return value
+
+    def index_pair(self, size):
+        """Retrieves two distinct random indices in the range [0, size)
+
+        Parameters
+        ----------
+        size: int
+            The number of indices to choose from, which must be at least 2
+
+        Returns
+        -------
+        int, int
+            Two distinct indices, each pair being equally likely
+
+        """
+        # the products are clamped since rounding can take them up to the upper bound
+        first = min(int(self.uniform() * size), size - 1)
+        second = min(int(self.uniform() * (size - 1)), size - 2)
+        if second >= first:
+            second += 1
+        return first, second
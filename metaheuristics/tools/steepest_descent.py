@@ -0,0 +1,55 @@
+"""A steepest descent local search for the quadratic assignment problem,
+used to polish a solution found by a metaheuristic. At each step the swap
+with the lowest change in objective value is applied, until no swap
+improves the solution. The changes for every swap are kept in a
+SwapDeltaMatrix, so a step costs O(n^2) rather than the O(n^3) needed to
+score every swap from scratch
+
+"""
+
+import numpy as np
+from metaheuristics.tools.swap_delta_matrix import SwapDeltaMatrix
+
+
+def run_steepest_descent(qap_problem, max_swaps=None, tolerance=1e-9):
+    """Applies best improvement swaps to the current solution of a quadratic
+    assignment problem until it is a local optimum
+
+    Parameters
+    ----------
+    qap_problem: QuadraticAssignmentProblem
+        The quadratic assignment problem whose current solution is polished
+    max_swaps: int
+        An optional limit on the number of swaps applied
+    tolerance: float
+        The amount by which a swap must decrease the objective value to be
+        applied, which stops rounding errors from causing endless swaps
+
+    Returns
+    -------
+    int
+        The number of swaps applied
+
+    Side Effect
+    -----------
+    Applies the swaps to qap_problem, so that its current solution is a
+    local optimum with respect to swaps unless max_swaps was reached
+
+    """
+    qap_instance = qap_problem.get_qap_instance()
+    size = qap_instance.get_size()
+    if size < 2:
+        return 0
+    delta_matrix = SwapDeltaMatrix(qap_instance, qap_problem.get_current_solution())
+    firsts, seconds = np.triu_indices(size, 1)
+    swaps = 0
+    while max_swaps is None or swaps < max_swaps:
+        swap_deltas = delta_matrix.get_deltas()[firsts, seconds]
+        index = np.argmin(swap_deltas)
+        if swap_deltas[index] >= -tolerance:
+            break
+        move = (int(firsts[index]), int(seconds[index]))
+        qap_problem.apply_move(move, float(swap_deltas[index]))
+        delta_matrix.apply_swap(*move)
+        swaps += 1
+    return swaps
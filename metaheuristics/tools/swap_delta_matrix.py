@@ -0,0 +1,193 @@
+"""The SwapDeltaMatrix class keeps the change in objective value caused by
+every swap of two facilities in a quadratic assignment problem. The full
+table is computed once in O(n^3) with matrix products. After a swap, the
+entries of pairs disjoint from the swapped pair are updated in O(1) each
+using the update of Taillard, while the rows of the two swapped positions
+are recomputed, so keeping the table costs O(n^2) per swap
+
+"""
+
+import numpy as np
+
+
+def calculate_swap_delta_rows(dist_matrix, flow_matrix, permutation, rows):
+    """Calculates the change in the quadratic assignment objective caused by
+    swapping each position in rows with every position of permutation
+
+    Parameters
+    ----------
+    dist_matrix: numpy.ndarray
+        The square matrix of distance values
+    flow_matrix: numpy.ndarray
+        The square matrix of flow values
+    permutation: numpy.ndarray
+        An array of integers representing an ordering of the facilities
+    rows: numpy.ndarray
+        An array of positions of permutation
+
+    Returns
+    -------
+    numpy.ndarray
+        An array of shape (len(rows), n) whose entry in row k, column s is
+        the change in objective value caused by swapping positions rows[k]
+        and s, which is 0 when rows[k] equals s
+
+    """
+    rows = np.asarray(rows, dtype=np.intp)
+    flows = flow_matrix
+    dists = dist_matrix[np.ix_(permutation, permutation)]
+    # each entry is the sum over every position k of the terms changed by the
+    # swap, from which the terms for k equal to r or s are corrected below
+    diagonal = (flows * dists).sum(axis=0) + (flows * dists).sum(axis=1)
+    deltas = (flows[:, rows].T @ dists + dists[:, rows].T @ flows +
+              flows[rows] @ dists.T + dists[rows] @ flows.T)
+    deltas -= diagonal[rows, None] + diagonal[None, :]
+    f_rr = flows[rows, rows][:, None]
+    f_ss = np.diag(flows)[None, :]
+    f_rs = flows[rows]
+    f_sr = flows[:, rows].T
+    d_rr = dists[rows, rows][:, None]
+    d_ss = np.diag(dists)[None, :]
+    d_rs = dists[rows]
+    d_sr = dists[:, rows].T
+    deltas -= ((f_rr - f_rs) * (d_rs - d_rr) + (f_rr - f_sr) * (d_sr - d_rr) +
+               (f_sr - f_ss) * (d_ss - d_sr) + (f_rs - f_ss) * (d_ss - d_rs))
+    deltas += ((f_rr - f_ss) * (d_ss - d_rr) + (f_rs - f_sr) * (d_sr - d_rs))
+    deltas[np.arange(len(rows)), rows] = 0.0
+    return deltas
+
+
+class SwapDeltaMatrix:
+    """A table of the change in objective value caused by every swap of two
+    positions of a permutation, kept up to date as swaps are applied
+
+    Attributes
+    ----------
+    qap_instance: QAPInstance
+        The instance of the quadratic assignment problem
+    permutation: numpy.ndarray
+        The permutation the table refers to, which is a copy owned by the
+        table and modified by apply_swap
+    deltas: numpy.ndarray
+        A symmetric matrix whose entry in row r, column s is the change in
+        objective value caused by swapping positions r and s of permutation
+
+    Parameters
+    ----------
+    qap_instance: QAPInstance
+        The instance of the quadratic assignment problem
+    permutation: numpy.ndarray
+        An array of integers representing an ordering of the facilities
+
+    """
+    def __init__(self, qap_instance, permutation):
+        self._qap_instance = qap_instance
+        self.reset(permutation)
+
+    def reset(self, permutation):
+        """Recomputes the table for a new permutation in O(n^3)
+
+        Parameters
+        ----------
+        permutation: numpy.ndarray
+            An array of integers representing an ordering of the facilities
+
+        Returns
+        -------
+        None
+
+        Side Effect
+        -----------
+        Sets the permutation to a copy of permutation and recomputes every
+        entry of the table
+
+        """
+        self._permutation = np.array(permutation, dtype=np.intp)
+        size = len(self._permutation)
+        self._deltas = calculate_swap_delta_rows(
+                self._qap_instance.get_dist_matrix(), self._qap_instance.get_flow_matrix(),
+                self._permutation, np.arange(size))
+
+    def get_permutation(self):
+        """Retrieves the permutation the table refers to
+
+        Returns
+        -------
+        numpy.ndarray
+            The permutation, which should not be modified directly
+
+        """
+        return self._permutation
+
+    def get_deltas(self):
+        """Retrieves the table of swap deltas
+
+        Returns
+        -------
+        numpy.ndarray
+            A symmetric matrix whose entry in row r, column s is the change
+            in objective value caused by swapping positions r and s, which
+            should not be modified directly
+
+        """
+        return self._deltas
+
+    def get_delta(self, first, second):
+        """Retrieves the change in objective value caused by a swap in O(1)
+
+        Parameters
+        ----------
+        first: int
+            The position of the first entry being swapped
+        second: int
+            The position of the second entry being swapped
+
+        Returns
+        -------
+        float
+            The objective value after the swap minus the objective value
+            of the permutation
+
+        """
+        return float(self._deltas[first, second])
+
+    def apply_swap(self, first, second):
+        """Swaps two entries of the permutation and updates the table in O(n^2)
+
+        Parameters
+        ----------
+        first: int
+            The position of the first entry being swapped
+        second: int
+            The position of the second entry being swapped
+
+        Returns
+        -------
+        None
+
+        Side Effect
+        -----------
+        Swaps the entries of the permutation at positions first and second
+        and updates every entry of the table for the new permutation
+
+        """
+        if first == second:
+            return
+        flows = self._qap_instance.get_flow_matrix()
+        dists = self._qap_instance.get_dist_matrix()
+        permutation = self._permutation
+        self._qap_instance.swap(permutation, first, second)
+        u, v = first, second
+        pu, pv = permutation[u], permutation[v]
+        # Taillard's update, for a pair r, s disjoint from u, v, adds
+        # (x_r - x_s) * (w_s - w_r) + (z_r - z_s) * (t_s - t_r)
+        x = flows[:, u] - flows[:, v]
+        z = flows[u] - flows[v]
+        w = dists[permutation, pu] - dists[permutation, pv]
+        t = dists[pu, permutation] - dists[pv, permutation]
+        self._deltas += (np.subtract.outer(x, x) * np.subtract.outer(w, w).T +
+                         np.subtract.outer(z, z) * np.subtract.outer(t, t).T)
+        rows = np.array([u, v], dtype=np.intp)
+        swapped_rows = calculate_swap_delta_rows(dists, flows, permutation, rows)
+        self._deltas[rows] = swapped_rows
+        self._deltas[:, rows] = swapped_rows.T
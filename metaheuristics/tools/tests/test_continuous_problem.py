@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+
+import pickle
+import pytest
+import numpy as np
+from unittest.mock import MagicMock
+from metaheuristics.simulated_annealing.simulated_annealing_utils import AnnealingRun
+from metaheuristics.simulated_annealing.temperature_params import TemperatureParams
+from metaheuristics.tools.continuous_problem import ContinuousProblem
+from metaheuristics.tools.optimization_solution import OptimizationSolution
+from metaheuristics.tools.random_buffer import RandomBuffer
+
+
+def sphere(solution):
+    return float(np.sum(solution ** 2))
+
+
+def make_random_buffer(normals=(), uniforms=()):
+    random_buffer = MagicMock()
+    random_buffer.normal.side_effect = list(normals)
+    random_buffer.uniform.side_effect = list(uniforms)
+    return random_buffer
+
+
+def test_bounds_and_step_sizes_are_broadcast():
+    problem = ContinuousProblem([0.0, 1.0, 2.0], sphere, -10.0, [10.0, 20.0, np.inf])
+    assert list(problem.get_lower_bounds()) == [-10.0] * 3
+    assert list(problem.get_step_sizes()) == [2.0, 3.0, 1.0]
+    assert problem.get_current_objective_value() == 5.0
+    assert problem.supports_moves()
+
+
+def test_cannot_create_outside_the_bounds():
+    with pytest.raises(ValueError):
+        ContinuousProblem([0.0, 6.0], sphere, -5.0, 5.0)
+
+
+def test_cannot_create_with_unknown_proposal():
+    with pytest.raises(ValueError):
+        ContinuousProblem([0.0], sphere, -5.0, 5.0, proposal="uniform")
+
+
+def test_moves_cycle_through_the_coordinates():
+    random_buffer = make_random_buffer(normals=[1.0, -2.0, 0.5])
+    problem = ContinuousProblem([0.0, 0.0], sphere, -5.0, 5.0, step_sizes=[1.0, 0.5], random_buffer=random_buffer)
+    assert problem.propose_move() == (0, 1.0)
+    assert problem.propose_move() == (1, -1.0)
+    assert problem.propose_move() == (0, 0.5)
+
+
+def test_cauchy_steps_use_uniform_numbers():
+    random_buffer = make_random_buffer(uniforms=[0.75])
+    problem = ContinuousProblem([0.0], sphere, -5.0, 5.0, step_sizes=2.0, proposal="cauchy",
+                                random_buffer=random_buffer)
+    dimension, value = problem.propose_move()
+    assert dimension == 0
+    assert value == pytest.approx(2.0)
+
+
+def test_steps_are_reflected_into_the_bounds():
+    random_buffer = make_random_buffer(normals=[3.0, -30.0])
+    problem = ContinuousProblem([4.0], sphere, -5.0, 5.0, step_sizes=1.0, random_buffer=random_buffer)
+    assert problem.propose_move() == (0, 3.0)
+    assert problem.propose_move() == (0, 5.0)
+
+
+def test_move_delta_leaves_the_current_solution_unchanged():
+    problem = ContinuousProblem([1.0, 2.0], sphere, -5.0, 5.0)
+    assert problem.get_move_delta((1, 3.0)) == 5.0
+    assert list(problem.get_current_solution()) == [1.0, 2.0]
+
+
+def test_applied_moves_change_the_current_solution():
+    problem = ContinuousProblem([1.0, 2.0], sphere, -5.0, 5.0)
+    solution = problem.get_current_optimization_solution()
+    problem.apply_move((0, 0.0), -1.0)
+    assert list(problem.get_current_solution()) == [0.0, 2.0]
+    assert problem.get_current_objective_value() == 4.0
+    assert list(solution.get_solution_value()) == [1.0, 2.0]
+
+
+def test_accepted_solutions_are_copied():
+    problem = ContinuousProblem([1.0, 2.0], sphere, -5.0, 5.0)
+    new_solution = OptimizationSolution(np.array([0.0, 1.0]), 1.0)
+    problem.accept_solution(new_solution)
+    problem.apply_move((1, 0.0), -1.0)
+    assert list(new_solution.get_solution_value()) == [0.0, 1.0]
+
+
+def test_step_sizes_adapt_to_acceptance_rates():
+    problem = ContinuousProblem([0.0, 0.0, 0.0], sphere, -100.0, 100.0, step_sizes=1.0, adaptation_interval=10,
+                                random_buffer=RandomBuffer(0))
+    for step in range(30):
+        move = problem.propose_move()
+        if move[0] == 0 or (move[0] == 1 and step % 2 == 1):
+            problem.apply_move(move, problem.get_move_delta(move))
+        else:
+            problem.reject_move(move)
+    problem.propose_move()
+    assert list(problem.get_step_sizes()) == pytest.approx([3.0, 1.0, 1.0 / 3.0])
+
+
+def test_step_sizes_are_limited_to_the_width_of_the_bounds():
+    problem = ContinuousProblem([0.0], sphere, -1.0, 1.0, step_sizes=1.5, adaptation_interval=1,
+                                random_buffer=RandomBuffer(0))
+    move = problem.propose_move()
+    problem.apply_move(move, problem.get_move_delta(move))
+    problem.adapt_step_sizes()
+    assert list(problem.get_step_sizes()) == [2.0]
+
+
+def test_neighbours_change_one_coordinate():
+    problem = ContinuousProblem([0.0, 0.0], sphere, -5.0, 5.0, random_buffer=RandomBuffer(1))
+    neighbour = problem.find_neighbour_solution()
+    assert neighbour.get_solution_value()[1] == 0.0
+    assert neighbour.get_objective_value() == sphere(neighbour.get_solution_value())
+    assert list(problem.get_current_solution()) == [0.0, 0.0]
+
+
+def test_resumed_annealing_run_matches_uninterrupted_run():
+    def make_run():
+        random_buffer = RandomBuffer(seed=8, buffer_size=16)
+        problem = ContinuousProblem(np.full(5, 3.0), sphere, -5.0, 5.0, adaptation_interval=4,
+                                    random_buffer=random_buffer)
+        temp_params = TemperatureParams(initial_temperature=10.0, temperature_changes=8,
+                                        temperature_updater=lambda temperature: 0.7 * temperature)
+        return AnnealingRun(temp_params, lambda temperature: 30, problem, random_buffer=random_buffer)
+
+    expected_values = [record.get_current_objective_value() for record in make_run()]
+    interrupted_run = make_run()
+    first_values = [next(interrupted_run).get_current_objective_value() for _ in range(3)]
+    state = pickle.loads(pickle.dumps(interrupted_run.get_state()))
+    resumed_run = make_run()
+    resumed_run.set_state(state)
+    assert first_values + [record.get_current_objective_value() for record in resumed_run] == expected_values
@@ -1,4 +1,5 @@
-from metaheuristics.tools.functions import himmelblau
+import numpy as np
+from metaheuristics.tools.functions import himmelblau, himmelblau_batch
 
 
 def test_with_both_coordinates_zero():
@@ -24,3 +25,11 @@ def test_with_x_negative_y_positive():
 def test_with_x_positive_y_negative():
     result = himmelblau((2, -2))
     assert round(result, 2) == 82.00
+
+
+def test_batch_matches_scalar_function():
+    solutions = np.array([[0, 0], [-1.5, -2.4], [2.0, 0.5], [-3, 1], [2, -2]])
+    result = himmelblau_batch(solutions)
+    assert result.shape == (5,)
+    for solution, value in zip(solutions, result):
+        assert round(value, 2) == round(himmelblau(tuple(solution)), 2)
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+
+import pickle
+import pytest
+import numpy as np
+from metaheuristics.tools.functions import himmelblau
+from metaheuristics.tools.memoized_objective import MemoizedObjective, make_solution_key
+from metaheuristics.tools.optimization_problem import OptimizationProblem
+from unittest.mock import MagicMock
+
+
+def test_make_solution_key():
+    assert make_solution_key([2, 0, 1]) == (2, 0, 1)
+    assert make_solution_key((1.5, 2.5)) == (1.5, 2.5)
+    assert make_solution_key(np.array([2, 0, 1])) == make_solution_key(np.array([2, 0, 1]))
+    assert make_solution_key(np.array([2, 0, 1])) != make_solution_key(np.array([2, 1, 0]))
+    assert make_solution_key(np.array([1, 2])) != make_solution_key(np.array([1.0, 2.0]))
+
+
+def test_cannot_create_with_empty_cache():
+    with pytest.raises(ValueError):
+        MemoizedObjective(sum, max_size=0)
+
+
+def test_revisited_solution_is_not_evaluated_again():
+    mock_objective = MagicMock(side_effect=lambda solution: float(solution.sum()))
+    memoized_objective = MemoizedObjective(mock_objective)
+    assert memoized_objective(np.array([1, 2])) == 3
+    assert memoized_objective(np.array([1, 2])) == 3
+    assert mock_objective.call_count == 1
+    assert memoized_objective.get_hits() == 1
+    assert memoized_objective.get_misses() == 1
+    assert memoized_objective.get_hit_rate() == 0.5
+
+
+def test_least_recently_used_value_is_evicted():
+    mock_objective = MagicMock(side_effect=sum)
+    memoized_objective = MemoizedObjective(mock_objective, max_size=2)
+    memoized_objective([1])
+    memoized_objective([2])
+    memoized_objective([1])
+    memoized_objective([3])
+    assert memoized_objective.get_size() == 2
+    memoized_objective([1])
+    assert mock_objective.call_count == 3
+    memoized_objective([2])
+    assert mock_objective.call_count == 4
+
+
+def test_zero_objective_value_is_cached():
+    mock_objective = MagicMock(return_value=0.0)
+    memoized_objective = MemoizedObjective(mock_objective)
+    memoized_objective((0, 0))
+    memoized_objective((0, 0))
+    assert mock_objective.call_count == 1
+
+
+def test_clear():
+    memoized_objective = MemoizedObjective(sum)
+    memoized_objective([1, 2])
+    memoized_objective([1, 2])
+    memoized_objective.clear()
+    assert memoized_objective.get_size() == 0
+    assert memoized_objective.get_hit_rate() == 0.0
+
+
+def test_used_in_optimization_problem():
+    memoized_objective = MemoizedObjective(himmelblau)
+    problem = OptimizationProblem((3, 2), memoized_objective, lambda solution: (3, 2))
+    neighbour = problem.find_neighbour_solution()
+    assert neighbour.get_objective_value() == 0
+    assert memoized_objective.get_hits() == 1
+    assert pickle.loads(pickle.dumps(memoized_objective)).get_size() == 1
@@ -1,3 +1,4 @@
+import pytest
 from metaheuristics.tools.optimization_problem import OptimizationProblem
 from metaheuristics.tools.optimization_solution import OptimizationSolution
 from unittest.mock import call, MagicMock
@@ -85,3 +86,63 @@ def test_update_current_solution_multiple_times():
     assert mock_objective_function.call_count == 3
     objective_func_calls = [call(solution) for solution in solution_vals]
     mock_objective_function.assert_has_calls(objective_func_calls)
+
+
+def test_accept_solution_does_not_evaluate_objective():
+    initial_solution_val = (0, 1)
+    mock_objective_function = MagicMock(return_value=4.5)
+    mock_updater = MagicMock()
+    optimization_problem = OptimizationProblem(
+            initial_solution_val, mock_objective_function, mock_updater)
+    new_solution = OptimizationSolution((1, 1), 2.5)
+    optimization_problem.accept_solution(new_solution)
+    assert optimization_problem.get_current_optimization_solution() is new_solution
+    assert optimization_problem.get_current_solution() == (1, 1)
+    assert optimization_problem.get_current_objective_value() == 2.5
+    mock_objective_function.assert_called_once_with(initial_solution_val)
+
+
+def test_find_and_accept_neighbour_evaluates_objective_once():
+    solution_vals = [["a", "b"], ["b", "a"]]
+    mock_objective_function = MagicMock(side_effect=[1.5, 0.5])
+    mock_updater = MagicMock(return_value=solution_vals[1])
+    optimization_problem = OptimizationProblem(
+            solution_vals[0], mock_objective_function, mock_updater)
+    optimization_problem.accept_solution(optimization_problem.find_neighbour_solution())
+    assert optimization_problem.get_current_solution() == solution_vals[1]
+    assert optimization_problem.get_current_objective_value() == 0.5
+    assert mock_objective_function.call_count == 2
+
+
+def test_move_protocol_not_supported_by_default():
+    optimization_problem = OptimizationProblem((0, 1), MagicMock(return_value=1), MagicMock())
+    assert not optimization_problem.supports_moves()
+    with pytest.raises(NotImplementedError):
+        optimization_problem.propose_move()
+    with pytest.raises(NotImplementedError):
+        optimization_problem.get_move_delta((0, 1))
+    with pytest.raises(NotImplementedError):
+        optimization_problem.apply_move((0, 1), 0.5)
+
+
+def test_find_neighbour_solution_value_does_not_evaluate():
+    mock_objective = MagicMock(return_value=3)
+    problem = OptimizationProblem(5, mock_objective, lambda solution: solution + 1)
+    assert problem.find_neighbour_solution_value() == 6
+    mock_objective.assert_called_once_with(5)
+
+
+def test_evaluate_batch_with_batch_objective_function():
+    mock_objective = MagicMock(return_value=3)
+    mock_batch_objective = MagicMock(return_value=[1, 2])
+    problem = OptimizationProblem(5, mock_objective, MagicMock(), mock_batch_objective)
+    assert problem.get_batch_objective_function() is mock_batch_objective
+    assert list(problem.evaluate_batch([6, 7])) == [1, 2]
+    mock_batch_objective.assert_called_once_with([6, 7])
+    mock_objective.assert_called_once_with(5)
+
+
+def test_evaluate_batch_without_batch_objective_function():
+    problem = OptimizationProblem(5, lambda solution: 2 * solution, MagicMock())
+    assert problem.get_batch_objective_function() is None
+    assert list(problem.evaluate_batch([6, 7])) == [12, 14]
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+import numpy as np
+import pandas as pd
+from metaheuristics.tools.functions import quadratic_assignment_objective
+from metaheuristics.tools.qap_instance import QAPInstance
+
+
+@pytest.fixture(scope="module")
+def mock_flow_matrix():
+    facilities = ["X", "Y", "Z"]
+    return pd.DataFrame([[1, 0, 1], [0, 1, 2], [2, 2, 1]],
+                        columns=facilities, index=facilities)
+
+
+@pytest.fixture(scope="module")
+def mock_dist_matrix():
+    facilities = ["X", "Y", "Z"]
+    return pd.DataFrame([[0, 2, 0], [2, 0, 0], [0, 0, 0]],
+                        columns=facilities, index=facilities)
+
+
+def test_can_create_from_dataframes(mock_flow_matrix, mock_dist_matrix):
+    qap_instance = QAPInstance(mock_flow_matrix, mock_dist_matrix)
+    assert qap_instance.get_size() == 3
+    assert qap_instance.get_labels() == ["X", "Y", "Z"]
+    assert qap_instance.get_flow_matrix().flags["C_CONTIGUOUS"]
+    assert qap_instance.get_dist_matrix().dtype == np.float64
+    assert np.array_equal(qap_instance.get_dist_matrix(), np.array(mock_dist_matrix))
+
+
+def test_can_create_from_arrays():
+    qap_instance = QAPInstance(np.eye(2), np.ones((2, 2)))
+    assert qap_instance.get_labels() == [0, 1]
+
+
+def test_cannot_create_with_mismatched_matrices():
+    with pytest.raises(ValueError):
+        QAPInstance(np.eye(2), np.ones((3, 3)))
+
+
+def test_encode_and_decode(mock_flow_matrix, mock_dist_matrix):
+    qap_instance = QAPInstance(mock_flow_matrix, mock_dist_matrix)
+    permutation = qap_instance.encode(["Z", "X", "Y"])
+    assert permutation.tolist() == [2, 0, 1]
+    assert qap_instance.decode(permutation) == ["Z", "X", "Y"]
+
+
+def test_objective_matches_dataframe_objective(mock_flow_matrix, mock_dist_matrix):
+    qap_instance = QAPInstance(mock_flow_matrix, mock_dist_matrix)
+    for facility_order in [["X", "Y", "Z"], ["Z", "X", "Y"], ["Y", "Z", "X"]]:
+        assert qap_instance.calculate_objective(qap_instance.encode(facility_order)) == \
+            quadratic_assignment_objective(mock_dist_matrix, mock_flow_matrix, facility_order)
+
+
+def test_swap_and_undo_swap_in_place(mock_flow_matrix, mock_dist_matrix):
+    qap_instance = QAPInstance(mock_flow_matrix, mock_dist_matrix)
+    permutation = qap_instance.encode(["X", "Y", "Z"])
+    delta = qap_instance.calculate_swap_delta(permutation, 0, 2)
+    initial_objective = qap_instance.calculate_objective(permutation)
+    qap_instance.swap(permutation, 0, 2)
+    assert permutation.tolist() == [2, 1, 0]
+    assert qap_instance.calculate_objective(permutation) == pytest.approx(initial_objective + delta)
+    qap_instance.undo_swap(permutation, 0, 2)
+    assert permutation.tolist() == [0, 1, 2]
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+
+import os
+import pytest
+import numpy as np
+from metaheuristics.tools.qap_instance import QAPInstance
+from metaheuristics.tools.qaplib import get_cache_path, load_qaplib, read_qaplib
+
+
+QAPLIB_TEXT = """  3
+
+ 0 1 2
+ 1 0 3
+ 2 3 0
+
+ 0 5 2 4
+ 1 0 0 6 1
+"""
+
+
+@pytest.fixture
+def qaplib_path(tmp_path):
+    file_path = tmp_path / "tiny3.dat"
+    file_path.write_text(QAPLIB_TEXT)
+    return str(file_path)
+
+
+def test_read_qaplib(qaplib_path):
+    matrices = read_qaplib(qaplib_path)
+    assert matrices.shape == (2, 3, 3)
+    assert np.array_equal(matrices[0], [[0, 1, 2], [1, 0, 3], [2, 3, 0]])
+    assert np.array_equal(matrices[1], [[0, 5, 2], [4, 1, 0], [0, 6, 1]])
+
+
+def test_read_qaplib_with_missing_values(tmp_path):
+    file_path = tmp_path / "short.dat"
+    file_path.write_text("2\n1 2 3 4\n5 6 7\n")
+    with pytest.raises(ValueError):
+        read_qaplib(str(file_path))
+
+
+def test_read_qaplib_with_extra_values(tmp_path):
+    file_path = tmp_path / "long.dat"
+    file_path.write_text("1\n1\n2\n3\n")
+    with pytest.raises(ValueError):
+        read_qaplib(str(file_path))
+
+
+def test_objective_matches_qaplib_definition(qaplib_path):
+    flow_matrix, dist_matrix = load_qaplib(qaplib_path, use_cache=False)
+    permutation = np.array([2, 0, 1])
+    expected_value = sum(flow_matrix[i, j] * dist_matrix[permutation[i], permutation[j]]
+                         for i in range(3) for j in range(3))
+    assert QAPInstance(flow_matrix, dist_matrix).calculate_objective(permutation) == expected_value
+
+
+def test_load_qaplib_writes_and_maps_cache(qaplib_path):
+    flow_matrix, dist_matrix = load_qaplib(qaplib_path)
+    cache_path = get_cache_path(qaplib_path)
+    assert cache_path == os.path.splitext(qaplib_path)[0] + ".npy"
+    assert os.path.exists(cache_path)
+    assert isinstance(flow_matrix, np.memmap)
+    assert np.array_equal(dist_matrix, [[0, 5, 2], [4, 1, 0], [0, 6, 1]])
+
+
+def test_load_qaplib_reads_cache_without_parsing(qaplib_path, monkeypatch):
+    load_qaplib(qaplib_path)
+    monkeypatch.setattr("metaheuristics.tools.qaplib.read_qaplib",
+                        lambda file_path: pytest.fail("the file was parsed again"))
+    flow_matrix, _ = load_qaplib(qaplib_path)
+    assert flow_matrix[1, 2] == 3
+
+
+def test_load_qaplib_refreshes_stale_cache(qaplib_path):
+    load_qaplib(qaplib_path)
+    cache_path = get_cache_path(qaplib_path)
+    os.utime(cache_path, (0, 0))
+    with open(qaplib_path, "w") as qaplib_file:
+        qaplib_file.write("1\n7\n8\n")
+    flow_matrix, dist_matrix = load_qaplib(qaplib_path)
+    assert flow_matrix.shape == (1, 1)
+    assert dist_matrix[0, 0] == 8
+
+
+def test_load_qaplib_with_cache_dir(qaplib_path, tmp_path):
+    cache_dir = str(tmp_path / "cache")
+    load_qaplib(qaplib_path, cache_dir=cache_dir)
+    assert os.listdir(cache_dir) == ["tiny3.npy"]
+
+
+def test_qap_instance_does_not_copy_mapped_matrices(qaplib_path):
+    flow_matrix, dist_matrix = load_qaplib(qaplib_path)
+    qap_instance = QAPInstance(flow_matrix, dist_matrix)
+    assert np.shares_memory(qap_instance.get_flow_matrix(), flow_matrix)
+    assert qap_instance.get_labels() == [0, 1, 2]
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+import numpy as np
+import pandas as pd
+from metaheuristics.tools.functions import quadratic_assignment_objective
+from metaheuristics.tools.qap_instance import QAPInstance
+from metaheuristics.tools.quadratic_assignment_problem import QuadraticAssignmentProblem
+from metaheuristics.tools.random_buffer import RandomBuffer
+
+
+@pytest.fixture(scope="module")
+def mock_flow_matrix():
+    facilities = ["W", "X", "Y", "Z"]
+    return pd.DataFrame([[0, 3, 1, 4], [3, 0, 2, 0], [1, 2, 0, 5], [4, 0, 5, 0]],
+                        columns=facilities, index=facilities)
+
+
+@pytest.fixture(scope="module")
+def mock_dist_matrix():
+    facilities = ["W", "X", "Y", "Z"]
+    return pd.DataFrame([[0, 1, 2, 3], [1, 0, 1, 2], [2, 1, 0, 1], [3, 2, 1, 0]],
+                        columns=facilities, index=facilities)
+
+
+def test_can_create(mock_flow_matrix, mock_dist_matrix):
+    facility_order = ["Y", "W", "Z", "X"]
+    qap_instance = QAPInstance(mock_flow_matrix, mock_dist_matrix)
+    qap_problem = QuadraticAssignmentProblem(qap_instance, qap_instance.encode(facility_order))
+    assert qap_problem.get_qap_instance() is qap_instance
+    assert list(qap_problem.get_current_solution()) == [2, 0, 3, 1]
+    assert qap_problem.get_facility_order(qap_problem.get_current_solution()) == facility_order
+    assert qap_problem.get_current_objective_value() == quadratic_assignment_objective(
+            mock_dist_matrix, mock_flow_matrix, facility_order)
+
+
+def test_swap_delta_matches_objective_difference(mock_flow_matrix, mock_dist_matrix):
+    facility_order = ["Y", "W", "Z", "X"]
+    qap_instance = QAPInstance(mock_flow_matrix, mock_dist_matrix)
+    qap_problem = QuadraticAssignmentProblem(qap_instance, qap_instance.encode(facility_order))
+    swapped_order = ["Y", "X", "Z", "W"]
+    expected = (quadratic_assignment_objective(mock_dist_matrix, mock_flow_matrix, swapped_order) -
+                quadratic_assignment_objective(mock_dist_matrix, mock_flow_matrix, facility_order))
+    assert qap_problem.calculate_swap_delta(1, 3) == pytest.approx(expected)
+
+
+def test_find_neighbour_solution_is_a_scored_swap(mock_flow_matrix, mock_dist_matrix):
+    facility_order = ["Z", "Y", "X", "W"]
+    qap_instance = QAPInstance(mock_flow_matrix, mock_dist_matrix)
+    qap_problem = QuadraticAssignmentProblem(qap_instance, qap_instance.encode(facility_order))
+    initial_permutation = qap_problem.get_current_solution().copy()
+    for _ in range(10):
+        neighbour = qap_problem.find_neighbour_solution()
+        neighbour_permutation = neighbour.get_solution_value()
+        assert np.sum(neighbour_permutation != initial_permutation) == 2
+        assert neighbour.get_objective_value() == pytest.approx(
+                qap_instance.calculate_objective(neighbour_permutation))
+    assert np.array_equal(qap_problem.get_current_solution(), initial_permutation)
+
+
+def test_initial_permutation_is_not_modified_by_moves(mock_flow_matrix, mock_dist_matrix):
+    qap_instance = QAPInstance(mock_flow_matrix, mock_dist_matrix)
+    initial_permutation = qap_instance.encode(["Y", "W", "Z", "X"])
+    qap_problem = QuadraticAssignmentProblem(qap_instance, initial_permutation)
+    qap_problem.apply_move((0, 1), qap_problem.get_move_delta((0, 1)))
+    assert initial_permutation.tolist() == [2, 0, 3, 1]
+
+
+def test_apply_move_swaps_in_place(mock_flow_matrix, mock_dist_matrix):
+    qap_instance = QAPInstance(mock_flow_matrix, mock_dist_matrix)
+    qap_problem = QuadraticAssignmentProblem(qap_instance, qap_instance.encode(["Y", "W", "Z", "X"]))
+    assert qap_problem.supports_moves()
+    snapshot = qap_problem.get_current_optimization_solution()
+    current_permutation = qap_problem.get_current_solution()
+    move = qap_problem.propose_move()
+    assert len(set(move)) == 2
+    delta = qap_problem.get_move_delta(move)
+    qap_problem.apply_move(move, delta)
+    assert qap_problem.get_current_solution() is current_permutation
+    assert np.sum(current_permutation != snapshot.get_solution_value()) == 2
+    assert snapshot.get_solution_value().tolist() == [2, 0, 3, 1]
+    assert qap_problem.get_current_objective_value() == pytest.approx(
+            snapshot.get_objective_value() + delta)
+    assert qap_problem.get_current_objective_value() == pytest.approx(
+            qap_instance.calculate_objective(current_permutation))
+
+
+def test_accepted_solution_is_not_modified_by_moves(mock_flow_matrix, mock_dist_matrix):
+    qap_instance = QAPInstance(mock_flow_matrix, mock_dist_matrix)
+    qap_problem = QuadraticAssignmentProblem(qap_instance, qap_instance.encode(["Y", "W", "Z", "X"]))
+    neighbour = qap_problem.find_neighbour_solution()
+    neighbour_permutation = neighbour.get_solution_value().copy()
+    qap_problem.accept_solution(neighbour)
+    qap_problem.apply_move((0, 3), qap_problem.get_move_delta((0, 3)))
+    assert np.array_equal(neighbour.get_solution_value(), neighbour_permutation)
+
+
+def test_moves_are_drawn_from_random_buffer(mock_flow_matrix, mock_dist_matrix):
+    qap_instance = QAPInstance(mock_flow_matrix, mock_dist_matrix)
+    first_problem = QuadraticAssignmentProblem(qap_instance, np.arange(4), RandomBuffer(seed=8))
+    second_problem = QuadraticAssignmentProblem(qap_instance, np.arange(4), RandomBuffer(seed=8))
+    assert [first_problem.propose_move() for _ in range(10)] == \
+        [second_problem.propose_move() for _ in range(10)]
+
+
+def test_evaluate_batch_of_permutations(mock_flow_matrix, mock_dist_matrix):
+    qap_instance = QAPInstance(mock_flow_matrix, mock_dist_matrix)
+    qap_problem = QuadraticAssignmentProblem(qap_instance, np.arange(4))
+    permutations = np.array([[2, 0, 3, 1], [0, 1, 2, 3]])
+    objective_values = qap_problem.evaluate_batch(permutations)
+    assert list(objective_values) == [qap_instance.calculate_objective(permutation) for permutation in permutations]
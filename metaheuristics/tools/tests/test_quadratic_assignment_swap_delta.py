@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+import numpy as np
+from metaheuristics.tools.functions import \
+    quadratic_assignment_objective_batch, quadratic_assignment_permutation_objective, \
+    quadratic_assignment_swap_delta
+
+
+@pytest.fixture(scope="module")
+def mock_flow_matrix():
+    return np.array([[1, 0, 1, 4], [0, 1, 2, 3], [2, 2, 1, 0], [5, 1, 0, 2]], dtype=float)
+
+
+@pytest.fixture(scope="module")
+def mock_dist_matrix():
+    return np.array([[0, 2, 0, 1], [2, 0, 3, 0], [1, 0, 0, 4], [3, 1, 2, 0]], dtype=float)
+
+
+def test_permutation_objective_with_empty_permutation():
+    empty_matrix = np.zeros((0, 0))
+    result = quadratic_assignment_permutation_objective(
+            empty_matrix, empty_matrix, np.array([], dtype=int))
+    assert result == 0
+
+
+def test_permutation_objective_with_identity(mock_flow_matrix, mock_dist_matrix):
+    result = quadratic_assignment_permutation_objective(
+            mock_dist_matrix, mock_flow_matrix, np.array([0, 1, 2, 3]))
+    assert result == 28
+
+
+def test_permutation_objective_with_reordering(mock_flow_matrix, mock_dist_matrix):
+    result = quadratic_assignment_permutation_objective(
+            mock_dist_matrix, mock_flow_matrix, np.array([2, 0, 3, 1]))
+    assert result == 39
+
+
+def test_swap_delta_with_same_position(mock_flow_matrix, mock_dist_matrix):
+    result = quadratic_assignment_swap_delta(
+            mock_dist_matrix, mock_flow_matrix, np.array([0, 1, 2, 3]), 2, 2)
+    assert result == 0
+
+
+@pytest.mark.parametrize("first,second", [(0, 1), (1, 0), (0, 3), (1, 2), (2, 3)])
+def test_swap_delta_matches_recomputed_objective(mock_flow_matrix, mock_dist_matrix, first, second):
+    permutation = np.array([2, 0, 3, 1])
+    swapped = permutation.copy()
+    swapped[[first, second]] = permutation[[second, first]]
+    expected = (quadratic_assignment_permutation_objective(mock_dist_matrix, mock_flow_matrix, swapped) -
+                quadratic_assignment_permutation_objective(mock_dist_matrix, mock_flow_matrix, permutation))
+    result = quadratic_assignment_swap_delta(
+            mock_dist_matrix, mock_flow_matrix, permutation, first, second)
+    assert result == pytest.approx(expected)
+
+
+def test_objective_batch_matches_single_objective(mock_flow_matrix, mock_dist_matrix):
+    permutations = np.array([[0, 1, 2, 3], [3, 1, 0, 2], [2, 3, 1, 0]])
+    result = quadratic_assignment_objective_batch(mock_dist_matrix, mock_flow_matrix, permutations)
+    assert result.shape == (3,)
+    for permutation, objective_value in zip(permutations, result):
+        assert objective_value == quadratic_assignment_permutation_objective(
+                mock_dist_matrix, mock_flow_matrix, permutation)
+
+
+@pytest.mark.parametrize("max_chunk_elements", [1, 16, 40])
+def test_objective_batch_in_chunks(mock_flow_matrix, mock_dist_matrix, max_chunk_elements):
+    permutations = np.array([[0, 1, 2, 3], [3, 1, 0, 2], [2, 3, 1, 0], [1, 0, 3, 2], [3, 2, 1, 0]])
+    result = quadratic_assignment_objective_batch(mock_dist_matrix, mock_flow_matrix, permutations,
+                                                  max_chunk_elements)
+    assert np.array_equal(result, quadratic_assignment_objective_batch(mock_dist_matrix, mock_flow_matrix,
+                                                                       permutations))
+
+
+def test_objective_batch_with_empty_permutations():
+    result = quadratic_assignment_objective_batch(np.zeros((0, 0)), np.zeros((0, 0)), np.zeros((2, 0)))
+    assert list(result) == [0, 0]
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+from metaheuristics.tools.random_buffer import RandomBuffer
+
+
+def test_uniform_matches_generator():
+    random_buffer = RandomBuffer(seed=5, buffer_size=3)
+    expected_numbers = np.random.default_rng(5).random(6)
+    numbers = [random_buffer.uniform() for _ in range(6)]
+    assert np.allclose(numbers, expected_numbers)
+
+
+def test_same_seed_gives_same_numbers():
+    first_buffer = RandomBuffer(seed=11)
+    second_buffer = RandomBuffer(seed=11)
+    assert [first_buffer.uniform() for _ in range(10)] == [second_buffer.uniform() for _ in range(10)]
+
+
+def test_index_pair_is_distinct_and_in_range():
+    random_buffer = RandomBuffer(seed=3, buffer_size=16)
+    for _ in range(200):
+        first, second = random_buffer.index_pair(4)
+        assert first != second
+        assert 0 <= first < 4
+        assert 0 <= second < 4
+
+
+def test_index_pair_covers_every_pair():
+    random_buffer = RandomBuffer(seed=7)
+    pairs = {random_buffer.index_pair(3) for _ in range(200)}
+    assert pairs == {(0, 1), (0, 2), (1, 0), (1, 2), (2, 0), (2, 1)}
+
+
+def test_index_pair_when_uniform_rounds_up(monkeypatch):
+    random_buffer = RandomBuffer(seed=0)
+    monkeypatch.setattr(random_buffer, "uniform", lambda: 1.0 - 1e-17)
+    assert random_buffer.index_pair(2) == (1, 0)
+
+
+def test_exponential_matches_generator():
+    random_buffer = RandomBuffer(seed=5, buffer_size=4)
+    expected_numbers = np.random.default_rng(5).standard_exponential(8)
+    numbers = [random_buffer.exponential() for _ in range(8)]
+    assert np.allclose(numbers, expected_numbers)
+
+
+def test_normal_matches_generator():
+    random_buffer = RandomBuffer(seed=5, buffer_size=4)
+    expected_numbers = np.random.default_rng(5).standard_normal(8)
+    numbers = [random_buffer.normal() for _ in range(8)]
+    assert np.allclose(numbers, expected_numbers)
+
+
+def test_restored_state_gives_same_numbers():
+    random_buffer = RandomBuffer(seed=2, buffer_size=4)
+    for _ in range(6):
+        random_buffer.uniform()
+    random_buffer.exponential()
+    random_buffer.normal()
+    state = random_buffer.get_state()
+    expected_numbers = [(random_buffer.uniform(), random_buffer.exponential(), random_buffer.normal())
+                        for _ in range(10)]
+    restored_buffer = RandomBuffer(seed=99, buffer_size=4)
+    restored_buffer.set_state(state)
+    assert [(restored_buffer.uniform(), restored_buffer.exponential(), restored_buffer.normal())
+            for _ in range(10)] == expected_numbers
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+import numpy as np
+from metaheuristics.simulated_annealing.simulated_annealing_utils \
+    import quadratic_assignment_simulated_annealing_solver
+from metaheuristics.simulated_annealing.temperature_params import TemperatureParams
+from metaheuristics.tools.qap_instance import QAPInstance
+from metaheuristics.tools.quadratic_assignment_problem import QuadraticAssignmentProblem
+from metaheuristics.tools.steepest_descent import run_steepest_descent
+
+
+@pytest.fixture(scope="module")
+def qap_instance():
+    rng = np.random.default_rng(9)
+    return QAPInstance(rng.integers(0, 20, (10, 10)), rng.integers(0, 20, (10, 10)))
+
+
+def is_local_optimum(qap_instance, permutation):
+    return all(qap_instance.calculate_swap_delta(permutation, first, second) >= 0
+               for first in range(len(permutation)) for second in range(len(permutation)))
+
+
+def test_steepest_descent_reaches_a_local_optimum(qap_instance):
+    qap_problem = QuadraticAssignmentProblem(qap_instance, np.arange(10))
+    initial_objective = qap_problem.get_current_objective_value()
+    swaps = run_steepest_descent(qap_problem)
+    permutation = qap_problem.get_current_solution()
+    assert swaps > 0
+    assert qap_problem.get_current_objective_value() < initial_objective
+    assert qap_problem.get_current_objective_value() == qap_instance.calculate_objective(permutation)
+    assert is_local_optimum(qap_instance, permutation)
+
+
+def test_steepest_descent_leaves_a_local_optimum_unchanged(qap_instance):
+    qap_problem = QuadraticAssignmentProblem(qap_instance, np.arange(10))
+    run_steepest_descent(qap_problem)
+    permutation = qap_problem.get_current_solution().copy()
+    assert run_steepest_descent(qap_problem) == 0
+    assert np.array_equal(qap_problem.get_current_solution(), permutation)
+
+
+def test_steepest_descent_applies_the_best_swap_first(qap_instance):
+    qap_problem = QuadraticAssignmentProblem(qap_instance, np.arange(10))
+    permutation = np.arange(10)
+    best_delta = min(qap_instance.calculate_swap_delta(permutation, first, second)
+                     for first in range(10) for second in range(10))
+    initial_objective = qap_problem.get_current_objective_value()
+    assert run_steepest_descent(qap_problem, max_swaps=1) == 1
+    assert qap_problem.get_current_objective_value() == initial_objective + best_delta
+
+
+def test_steepest_descent_with_a_single_facility():
+    qap_problem = QuadraticAssignmentProblem(QAPInstance(np.ones((1, 1)), np.ones((1, 1))), [0])
+    assert run_steepest_descent(qap_problem) == 0
+
+
+def test_annealing_solver_polishes_the_best_solution(qap_instance):
+    temp_params = TemperatureParams(initial_temperature=1.0, temperature_changes=1,
+                                    temperature_updater=lambda temperature: temperature)
+    result = quadratic_assignment_simulated_annealing_solver(
+            qap_instance.get_flow_matrix(), qap_instance.get_dist_matrix(), list(range(10)), 1, temp_params,
+            seed=0, polish=True)
+    best_permutation = np.array(result.get_best_solution().get_solution_value())
+    assert result.get_best_solution().get_objective_value() == qap_instance.calculate_objective(best_permutation)
+    assert is_local_optimum(qap_instance, best_permutation)
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+import numpy as np
+from metaheuristics.tools.qap_instance import QAPInstance
+from metaheuristics.tools.swap_delta_matrix import SwapDeltaMatrix, calculate_swap_delta_rows
+
+
+@pytest.fixture(scope="module")
+def qap_instance():
+    rng = np.random.default_rng(3)
+    return QAPInstance(rng.integers(0, 10, (6, 6)), rng.integers(0, 10, (6, 6)))
+
+
+def calculate_all_swap_deltas(qap_instance, permutation):
+    size = qap_instance.get_size()
+    return np.array([[qap_instance.calculate_swap_delta(permutation, first, second)
+                      for second in range(size)] for first in range(size)])
+
+
+def test_swap_delta_rows_match_single_swap_deltas(qap_instance):
+    permutation = np.array([3, 0, 5, 1, 4, 2])
+    rows = calculate_swap_delta_rows(qap_instance.get_dist_matrix(), qap_instance.get_flow_matrix(),
+                                     permutation, [4, 1])
+    expected = calculate_all_swap_deltas(qap_instance, permutation)
+    assert np.allclose(rows, expected[[4, 1]])
+
+
+def test_matrix_is_computed_for_a_copy_of_the_permutation(qap_instance):
+    permutation = np.array([3, 0, 5, 1, 4, 2])
+    delta_matrix = SwapDeltaMatrix(qap_instance, permutation)
+    assert np.allclose(delta_matrix.get_deltas(), calculate_all_swap_deltas(qap_instance, permutation))
+    assert delta_matrix.get_delta(0, 2) == qap_instance.calculate_swap_delta(permutation, 0, 2)
+    delta_matrix.apply_swap(0, 1)
+    assert list(permutation) == [3, 0, 5, 1, 4, 2]
+    assert list(delta_matrix.get_permutation()) == [0, 3, 5, 1, 4, 2]
+
+
+def test_matrix_is_updated_after_swaps(qap_instance):
+    rng = np.random.default_rng(5)
+    delta_matrix = SwapDeltaMatrix(qap_instance, rng.permutation(6))
+    for _ in range(20):
+        first, second = rng.choice(6, 2, replace=False)
+        delta_matrix.apply_swap(first, second)
+        expected = calculate_all_swap_deltas(qap_instance, delta_matrix.get_permutation())
+        assert np.allclose(delta_matrix.get_deltas(), expected)
+
+
+def test_swapping_a_position_with_itself_changes_nothing(qap_instance):
+    delta_matrix = SwapDeltaMatrix(qap_instance, np.arange(6))
+    deltas = delta_matrix.get_deltas().copy()
+    delta_matrix.apply_swap(2, 2)
+    assert np.array_equal(delta_matrix.get_deltas(), deltas)
+    assert list(delta_matrix.get_permutation()) == list(range(6))
+
+
+def test_reset_recomputes_the_matrix(qap_instance):
+    delta_matrix = SwapDeltaMatrix(qap_instance, np.arange(6))
+    delta_matrix.reset([5, 4, 3, 2, 1, 0])
+    expected = calculate_all_swap_deltas(qap_instance, np.array([5, 4, 3, 2, 1, 0]))
+    assert np.allclose(delta_matrix.get_deltas(), expected)